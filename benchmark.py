@@ -0,0 +1,306 @@
+"""
+Suite de rendimiento del Hotel Sena.
+
+Genera datos sintéticos (N habitaciones, M clientes, K reservaciones) con
+las clases del modelo, sin pasar por el menú, y mide:
+
+    - creación de reservaciones,
+    - búsquedas de disponibilidad por rango de fechas,
+    - búsqueda de clientes por nombre o teléfono,
+    - escritura en el diario de persistencia (y en el formato JSON anterior),
+    - recarga del estado al arrancar,
+    - procesamiento de pagos,
+    - tiempo de arranque de un proceso nuevo: importar el menú y listar
+      las llegadas del día con `python -m hotel_sena llegadas` (el mejor de
+      varios intentos, con los datos de la escala).
+
+Uso:
+    python benchmark.py --escalas pequena,mediana --salida resultados.json
+    python benchmark.py --escalas pequena --comparar resultados_base.json
+
+Los resultados se emiten en JSON para compararlos entre versiones;
+`--comparar` termina con código 1 si alguna prueba es más lenta que la
+base por encima de la tolerancia.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+from hotel_sena.almacenamiento import AlmacenamientoJSON, DiarioJSONL, configurar_almacenamiento, obtener_almacen
+from hotel_sena.arranque import cargar_estado
+from hotel_sena.busqueda import indice_clientes
+from hotel_sena.Cliente import Cliente
+from hotel_sena.Habitaciones import Habitacion
+from hotel_sena.Pagos import Pago
+from hotel_sena.procesador_pagos import PasarelaSimulada, ProcesadorPagos
+from hotel_sena.registro import RegistroClientes, RegistroHabitaciones, RegistroPagos, RegistroReservas
+from hotel_sena.reservacion import Reservacion
+from hotel_sena.disponibilidad import indice_disponibilidad
+
+
+ESCALAS = {
+    "pequena": {"habitaciones": 20, "clientes": 200, "reservas": 1_000},
+    "mediana": {"habitaciones": 100, "clientes": 5_000, "reservas": 20_000},
+    "grande": {"habitaciones": 500, "clientes": 40_000, "reservas": 200_000},
+}
+
+TIPOS = ["Sencilla", "Doble", "Suite"]
+NOMBRES = ["María", "José", "Ana", "Luis", "Carlos", "Andrés", "Sofía", "Valentina", "Juan", "Camila",
+           "Diego", "Laura", "Santiago", "Daniela", "Miguel", "Paula", "Felipe", "Natalia", "Jorge", "Lucía"]
+APELLIDOS = ["Gómez", "Rodríguez", "Martínez", "García", "López", "Hernández", "Peña", "Díaz", "Pérez",
+             "Sánchez", "Ramírez", "Torres", "Flórez", "Castro", "Vargas", "Rojas", "Ortiz", "Muñoz",
+             "Jiménez", "Serna", "Silva", "Durán", "Carrillo", "Santana", "Quintero", "Ospina"]
+INICIO = date(2024, 1, 1).toordinal()
+HORIZONTE_DIAS = 3 * 365
+
+
+# ---------------------------------------------------------
+# Datos sintéticos
+# ---------------------------------------------------------
+def generar_datos(n_habitaciones: int, m_clientes: int, k_reservas: int, semilla: int = 42) -> Dict:
+    """
+    Crea habitaciones, clientes y reservaciones con las clases del modelo.
+    Las reservaciones que chocan con otra se descartan y se vuelve a sortear.
+    """
+    azar = random.Random(semilla)
+    indice_disponibilidad.reiniciar()
+    indice_clientes.reiniciar()
+    clientes, habitaciones, reservas = RegistroClientes(), RegistroHabitaciones(), RegistroReservas()
+
+    for i in range(n_habitaciones):
+        h = Habitacion(habitaciones.siguiente_id(), TIPOS[i % len(TIPOS)], 80_000 + 40_000 * (i % len(TIPOS)))
+        habitaciones.agregar(h)
+        indice_disponibilidad.agregar_habitacion(h)
+
+    for i in range(m_clientes):
+        nombre = f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}"
+        clientes.agregar(Cliente(clientes.siguiente_id(), nombre, f"cliente{i}@gmail.com", 3_000_000_000 + i))
+
+    lista_habitaciones = list(habitaciones)
+    intentos = 0
+    while len(reservas) < k_reservas and intentos < k_reservas * 20:
+        intentos += 1
+        ingreso = INICIO + azar.randrange(HORIZONTE_DIAS)
+        salida = ingreso + azar.randint(1, 7)
+        try:
+            reserva = Reservacion(
+                reservas.siguiente_id(),
+                clientes.obtener(azar.randint(1, m_clientes)),
+                azar.choice(lista_habitaciones),
+                date.fromordinal(ingreso).isoformat(),
+                date.fromordinal(salida).isoformat(),
+                80_000,
+            )
+        except ValueError:
+            continue
+        reservas.agregar(reserva)
+        reserva.cliente.registrar_reserva(reserva.id_reserva, mostrar=False)
+
+    return {"clientes": clientes, "habitaciones": habitaciones, "reservas": reservas, "azar": azar}
+
+
+# ---------------------------------------------------------
+# Medición
+# ---------------------------------------------------------
+def _resultado(escala: str, prueba: str, operaciones: int, segundos: float) -> Dict:
+    return {
+        "escala": escala,
+        "prueba": prueba,
+        "operaciones": operaciones,
+        "segundos": round(segundos, 6),
+        "ops_por_segundo": round(operaciones / segundos, 2) if segundos else None,
+        "us_por_operacion": round(segundos / operaciones * 1e6, 3) if operaciones else None,
+    }
+
+
+def medir_creacion_reservas(escala: str, config: Dict, semilla: int) -> Tuple[List[Dict], Dict]:
+    inicio = time.perf_counter()
+    datos = generar_datos(config["habitaciones"], config["clientes"], config["reservas"], semilla)
+    segundos = time.perf_counter() - inicio
+    return [_resultado(escala, "generar_y_reservar", len(datos["reservas"]), segundos)], datos
+
+
+def medir_disponibilidad(escala: str, datos: Dict, consultas: int = 2_000) -> List[Dict]:
+    azar = datos["azar"]
+    rangos = []
+    for _ in range(consultas):
+        ingreso = INICIO + azar.randrange(HORIZONTE_DIAS)
+        rangos.append((ingreso, ingreso + azar.randint(1, 7), azar.choice([None] + TIPOS)))
+
+    inicio = time.perf_counter()
+    for ingreso, salida, tipo in rangos:
+        indice_disponibilidad.habitaciones_disponibles(ingreso, salida, tipo)
+    return [_resultado(escala, "consulta_disponibilidad", consultas, time.perf_counter() - inicio)]
+
+
+def medir_busqueda_clientes(escala: str, datos: Dict, consultas: int = 2_000) -> List[Dict]:
+    azar = datos["azar"]
+    total = len(datos["clientes"])
+    # Prefijos de nombre, teléfonos y nombres con una letra cambiada (búsqueda aproximada)
+    textos = []
+    for i in range(consultas):
+        cliente = datos["clientes"].obtener(azar.randint(1, total))
+        if i % 3 == 0:
+            textos.append(cliente.nombre[:6])
+        elif i % 3 == 1:
+            textos.append(cliente.telefono)
+        else:
+            textos.append(cliente.nombre.replace("e", "a", 1) + "z")
+    indice_clientes.buscar("")  # aplica los cambios pendientes fuera de la medición
+
+    inicio = time.perf_counter()
+    for texto in textos:
+        indice_clientes.buscar(texto)
+    return [_resultado(escala, "busqueda_clientes", consultas, time.perf_counter() - inicio)]
+
+
+def medir_persistencia(escala: str, datos: Dict, directorio: str, maximo_json: int = 500) -> List[Dict]:
+    resultados = []
+    reservas = list(datos["reservas"])
+
+    # Diario de solo-anexar (formato actual)
+    diario = DiarioJSONL(os.path.join(directorio, "reservas.json"))
+    inicio = time.perf_counter()
+    for reserva in reservas:
+        diario.agregar(reserva.to_dict())
+    resultados.append(_resultado(escala, "escritura_diario", len(reservas), time.perf_counter() - inicio))
+
+    # Formato anterior (arreglo JSON reescrito en cada escritura), limitado por ser O(n²)
+    anterior = AlmacenamientoJSON(os.path.join(directorio, "reservas_formato_anterior.json"))
+    muestra = reservas[:maximo_json]
+    inicio = time.perf_counter()
+    for reserva in muestra:
+        anterior.agregar(reserva.to_dict())
+    resultados.append(_resultado(escala, "escritura_json_anterior", len(muestra), time.perf_counter() - inicio))
+
+    # Recarga en arranque (clientes + habitaciones + reservas)
+    obtener_almacen(os.path.join(directorio, "clientes.json")).agregar_lote(c.to_dict() for c in datos["clientes"])
+    obtener_almacen(os.path.join(directorio, "habitaciones.json")).agregar_lote(
+        h.to_dict() for h in datos["habitaciones"]
+    )
+    indice_disponibilidad.reiniciar()
+    inicio = time.perf_counter()
+    cargados = cargar_estado(RegistroClientes(), RegistroHabitaciones(), RegistroReservas(), RegistroPagos(),
+                             directorio)
+    resultados.append(_resultado(escala, "recarga_arranque", cargados["reservas"], time.perf_counter() - inicio))
+    return resultados
+
+
+def medir_pagos(escala: str, datos: Dict, directorio: str, cantidad: int = 2_000,
+                latencia: float = 0.01) -> List[Dict]:
+    procesador = ProcesadorPagos(ruta_archivo=os.path.join(directorio, "pagos.json"), limite_por_defecto=200)
+    procesador.pasarela_por_defecto = PasarelaSimulada(latencia=latencia, semilla=1)
+    metodos = Pago.METODOS_VALIDOS
+    pagos = [Pago(i + 1, 100_000, metodos[i % len(metodos)]) for i in range(cantidad)]
+
+    inicio = time.perf_counter()
+    procesador.procesar_sync(pagos)
+    return [_resultado(escala, f"pagos_latencia_{int(latencia * 1000)}ms", cantidad, time.perf_counter() - inicio)]
+
+
+def medir_arranque(escala: str, directorio: str, repeticiones: int = 5) -> List[Dict]:
+    """Procesos nuevos de Python; se toma el mejor tiempo para quitar el ruido del sistema."""
+    raiz = os.path.dirname(os.path.abspath(__file__))
+    entorno = dict(os.environ, PYTHONPATH=raiz)
+    fecha = date.fromordinal(INICIO + 30).isoformat()
+    comandos = {
+        "arranque_importar_menu": [sys.executable, "-c", "import hotel_sena.Hotel_Sena"],
+        "arranque_llegadas": [sys.executable, "-m", "hotel_sena", "llegadas",
+                              "--datos", directorio, "--fecha", fecha],
+    }
+    resultados = []
+    for prueba, comando in comandos.items():
+        mejor = None
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            subprocess.run(comando, cwd=directorio, env=entorno, check=True, stdout=subprocess.DEVNULL)
+            segundos = time.perf_counter() - inicio
+            mejor = segundos if mejor is None else min(mejor, segundos)
+        resultados.append(_resultado(escala, prueba, 1, mejor))
+    return resultados
+
+
+def ejecutar(escalas: List[str], semilla: int = 42) -> Dict:
+    """Corre todas las pruebas en las escalas indicadas y devuelve el informe."""
+    resultados = []
+    for escala in escalas:
+        config = ESCALAS[escala]
+        with tempfile.TemporaryDirectory(prefix="hotel_sena_bench_") as directorio:
+            configurar_almacenamiento(DiarioJSONL)  # almacenes nuevos para cada escala
+            creacion, datos = medir_creacion_reservas(escala, config, semilla)
+            resultados += creacion
+            resultados += medir_disponibilidad(escala, datos)
+            resultados += medir_busqueda_clientes(escala, datos)
+            resultados += medir_persistencia(escala, datos, directorio)
+            resultados += medir_arranque(escala, directorio)
+            resultados += medir_pagos(escala, datos, directorio)
+        configurar_almacenamiento(DiarioJSONL)
+        indice_disponibilidad.reiniciar()
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "resultados": resultados,
+    }
+
+
+def comparar(base: Dict, actual: Dict, tolerancia: float = 0.2) -> List[str]:
+    """Lista las pruebas cuyo tiempo por operación empeoró más que `tolerancia` (0.2 = 20 %)."""
+    anteriores = {(r["escala"], r["prueba"]): r for r in base["resultados"]}
+    regresiones = []
+    for r in actual["resultados"]:
+        previo = anteriores.get((r["escala"], r["prueba"]))
+        if not previo or not previo["us_por_operacion"] or not r["us_por_operacion"]:
+            continue
+        cambio = r["us_por_operacion"] / previo["us_por_operacion"] - 1
+        if cambio > tolerancia:
+            regresiones.append(
+                f"{r['escala']}/{r['prueba']}: {previo['us_por_operacion']} -> {r['us_por_operacion']} "
+                f"µs/op (+{cambio:.0%})"
+            )
+    return regresiones
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks del Hotel Sena.")
+    parser.add_argument("--escalas", default="pequena", help=f"Lista separada por comas: {', '.join(ESCALAS)}")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados (por defecto, la consola)")
+    parser.add_argument("--comparar", help="Resultados JSON de referencia para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    escalas = [e.strip() for e in args.escalas.split(",") if e.strip()]
+    desconocidas = [e for e in escalas if e not in ESCALAS]
+    if desconocidas:
+        parser.error(f"Escalas desconocidas: {', '.join(desconocidas)}")
+
+    informe = ejecutar(escalas, args.semilla)
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            regresiones = comparar(json.load(f), informe, args.tolerancia)
+        for linea in regresiones:
+            print(f"REGRESIÓN {linea}", file=sys.stderr)
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+from typing import Dict, List
+
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.eventos import CanalEventos, canal_global
+from hotel_sena.metricas import medido
+
+
+class Cliente:
+    """Representa un cliente registrado en el sistema del Hotel Sena."""
+
+    __slots__ = ("id_cliente", "nombre", "correo", "telefono", "reservas")
+
+    def __init__(self, id_cliente: int, nombre: str, correo: str, telefono: int,
+                 canal: CanalEventos = canal_global):
+        self.id_cliente = id_cliente
+        self.nombre = nombre.strip().title()
+        self.correo = correo.strip().lower()
+        self.telefono = str(telefono).strip()
+        self.reservas: List[int] = []  # historial de reservas (IDs de reservación)
+
+        # Validaciones personalizadas
+        if not self._validar_nombre(self.nombre):
+            raise ValueError("El nombre no puede estar vacío o contener solo espacios.")
+        if not self._validar_correo(self.correo):
+            raise ValueError("Correo inválido: debe contener '@' y 'gmail.com'.")
+        if not self._validar_telefono(self.telefono):
+            raise ValueError("Número de teléfono inválido: debe tener exactamente 10 dígitos.")
+
+        # Mantiene al día el índice de búsqueda (None: el cliente ya está indexado, p. ej. al hidratarlo)
+        if canal is not None:
+            canal.emitir("cliente_registrado", cliente=self)
+
+    # ----------------------------------------------------------
+    # Métodos privados de validación
+    # ----------------------------------------------------------
+    def _validar_nombre(self, nombre: str) -> bool:
+        """Valida que el nombre no esté vacío."""
+        return bool(nombre and nombre.strip())
+
+    def _validar_correo(self, correo: str) -> bool:
+        """Valida que el correo contenga '@' y 'gmail.com'."""
+        return "@" in correo and "gmail.com" in correo
+
+    def _validar_telefono(self, telefono: str) -> bool:
+        """Valida que el teléfono tenga exactamente 10 dígitos."""
+        return telefono.isdigit() and len(telefono) == 10
+
+    # ----------------------------------------------------------
+    # Métodos funcionales
+    # ----------------------------------------------------------
+    def registrar_reserva(self, reserva, mostrar: bool = True) -> None:
+        """Agrega una reserva (su ID, o el diccionario de `Reservacion.to_dict`) al historial del cliente."""
+        self.reservas.append(reserva["ID"] if isinstance(reserva, dict) else reserva)
+        if mostrar:
+            print(f"Reserva registrada correctamente para {self.nombre}.")
+
+    def actualizar_info(self, nombre: str = None, correo: str = None, telefono: int = None,
+                        mostrar: bool = True, canal: CanalEventos = canal_global) -> None:
+        """
+        Actualiza los datos indicados (los vacíos no se tocan). Valida todo
+        antes de cambiar nada: lanza ValueError si algún dato es inválido.
+
+        Los índices por correo y teléfono de `RegistroClientes` no se enteran:
+        use `ServicioHotel.actualizar_cliente`, que además lo anota en la bitácora.
+        """
+        nombre = nombre.strip().title() if nombre else self.nombre
+        correo = correo.strip().lower() if correo else self.correo
+        telefono = str(telefono).strip() if telefono else self.telefono
+        if not self._validar_nombre(nombre):
+            raise ValueError("El nombre no puede estar vacío o contener solo espacios.")
+        if not self._validar_correo(correo):
+            raise ValueError("Correo inválido: debe contener '@' y 'gmail.com'.")
+        if not self._validar_telefono(telefono):
+            raise ValueError("Número de teléfono inválido: debe tener exactamente 10 dígitos.")
+        self.nombre, self.correo, self.telefono = nombre, correo, telefono
+        canal.emitir("cliente_actualizado", cliente=self)
+        if mostrar:
+            print(f"Información actualizada correctamente para el cliente #{self.id_cliente}.")
+
+    def consultar_info(self) -> Dict:
+        """Devuelve la información completa del cliente como diccionario."""
+        return {
+            "ID": self.id_cliente,
+            "Nombre": self.nombre,
+            "Correo": self.correo,
+            "Teléfono": self.telefono,
+            "Reservas": len(self.reservas)
+        }
+
+    def to_dict(self) -> Dict:
+        """Devuelve el registro del cliente tal como se persiste."""
+        return {
+            "id_cliente": self.id_cliente,
+            "nombre": self.nombre,
+            "correo": self.correo,
+            "telefono": self.telefono
+        }
+
+    @medido("cliente.guardar_json")
+    def guardar_json(self, ruta_archivo: str = "data/clientes.json") -> None:
+        """Anexa el cliente al diario de clientes (ver almacenamiento.DiarioJSONL)."""
+        obtener_almacen(ruta_archivo).agregar(self.to_dict())
+
+    def formato_consola(self) -> str:
+        """Ficha del cliente en formato elegante, como un solo bloque de texto."""
+        return "\n".join([
+            "\n" + "=" * 40,
+            "        INFORMACIÓN DEL CLIENTE",
+            "=" * 40,
+            f"{'ID':15}: {self.id_cliente}",
+            f"{'Nombre':15}: {self.nombre}",
+            f"{'Correo':15}: {self.correo}",
+            f"{'Teléfono':15}: {self.telefono}",
+            f"{'Reservas':15}: {len(self.reservas)} registradas",
+            "=" * 40 + "\n",
+        ])
+
+    def mostrar_en_consola(self) -> None:
+        """Muestra la información del cliente en formato elegante."""
+        print(self.formato_consola())
+
+    def __str__(self) -> str:
+        """Representación simple en texto del cliente."""
+        return f"{self.nombre} ({self.correo})"
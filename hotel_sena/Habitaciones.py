@@ -1,11 +1,18 @@
 from typing import Dict
 
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.disponibilidad import indice_disponibilidad
+from hotel_sena.eventos import CanalEventos, canal_global
+from hotel_sena.metricas import medido
+
 
 class Habitacion:
     """Representa una habitación del hotel."""
 
     ESTADOS_VALIDOS = {"disponible", "ocupada", "reservada"}
 
+    __slots__ = ("id_habitacion", "tipo", "precio", "estado")
+
     def __init__(self, id_habitacion: int, tipo: str, precio: float, estado: str = "disponible"):
         self.id_habitacion = id_habitacion
         self.tipo = tipo
@@ -15,16 +22,21 @@ class Habitacion:
             # Si el estado no es válido, lo forzamos a 'disponible'
             self.estado = "disponible"
 
-    def verificar_disponibilidad(self) -> bool:
-        """Devuelve True si la habitación está disponible."""
+    def verificar_disponibilidad(self, fecha_ingreso=None, fecha_salida=None, indice=indice_disponibilidad) -> bool:
+        """
+        Sin fechas, devuelve True si la habitación está disponible hoy (según su estado).
+        Con fechas ('YYYY-MM-DD'), consulta el índice de reservas para ese rango.
+        """
+        if fecha_ingreso is not None and fecha_salida is not None:
+            return indice.esta_libre(self.id_habitacion, fecha_ingreso, fecha_salida)
         return self.estado == "disponible"
 
     def ocupar(self) -> bool:
         """
-        Marca la habitación como 'ocupada' si está disponible.
-        Devuelve True si la operación fue exitosa, False si no.
+        Marca la habitación como 'ocupada' si está disponible o reservada
+        (llega el huésped). Devuelve True si la operación fue exitosa, False si no.
         """
-        if self.verificar_disponibilidad():
+        if self.estado in ("disponible", "reservada"):
             self.estado = "ocupada"
             return True
         return False
@@ -43,15 +55,17 @@ class Habitacion:
         """Libera la habitación y la deja como 'disponible'."""
         self.estado = "disponible"
 
-    def actualizar_precio(self, nuevo_precio: float) -> None:
+    def actualizar_precio(self, nuevo_precio: float, canal: CanalEventos = canal_global) -> None:
         """Actualiza el precio de la habitación (validando que sea positivo)."""
         try:
             p = float(nuevo_precio)
             if p < 0:
                 raise ValueError("El precio no puede ser negativo.")
-            self.precio = p
         except (TypeError, ValueError):
             raise ValueError("Precio inválido. Debe ser un número positivo.")
+        anterior, self.precio = self.precio, p
+        if p != anterior:
+            canal.emitir("precio_actualizado", habitacion=self, anterior=anterior)
 
     def to_dict(self) -> Dict:
         """Devuelve un diccionario con la información de la habitación (útil para JSON / DB)."""
@@ -62,16 +76,27 @@ class Habitacion:
             "estado": self.estado
         }
 
+    @medido("habitacion.guardar_json")
+    def guardar_json(self, ruta_archivo: str = "data/habitaciones.json") -> None:
+        """Anexa la habitación al diario de habitaciones (ver almacenamiento.DiarioJSONL)."""
+        obtener_almacen(ruta_archivo).agregar(self.to_dict())
+
+    def formato_consola(self) -> str:
+        """Ficha de la habitación en formato elegante, como un solo bloque de texto."""
+        return "\n".join([
+            "\n" + "=" * 40,
+            "          INFORMACIÓN DE HABITACIÓN",
+            "=" * 40,
+            f"{'ID':15}: {self.id_habitacion}",
+            f"{'Tipo':15}: {self.tipo}",
+            f"{'Precio':15}: {self.precio}",
+            f"{'Estado':15}: {self.estado}",
+            "=" * 40 + "\n",
+        ])
+
     def mostrar_en_consola(self) -> None:
         """Muestra la habitación en consola con formato elegante."""
-        print("\n" + "=" * 40)
-        print("          INFORMACIÓN DE HABITACIÓN")
-        print("=" * 40)
-        print(f"{'ID':15}: {self.id_habitacion}")
-        print(f"{'Tipo':15}: {self.tipo}")
-        print(f"{'Precio':15}: {self.precio}")
-        print(f"{'Estado':15}: {self.estado}")
-        print("=" * 40 + "\n")
+        print(self.formato_consola())
 
     def __str__(self) -> str:
         return f"Habitacion#{self.id_habitacion} ({self.tipo}) - {self.estado} - {self.precio}"
@@ -0,0 +1,427 @@
+from hotel_sena.servicio import ServicioHotel
+from hotel_sena.analitica import Analitica
+from hotel_sena.lista_espera import SolicitudEspera
+from hotel_sena import metricas
+from hotel_sena.listados import (ORDEN_CLIENTES, ORDEN_HABITACIONES, ORDEN_RESERVACIONES, escribir_paginas,
+                      filtrar_clientes, filtrar_habitaciones, filtrar_reservaciones)
+from datetime import datetime
+
+# Las operaciones viven en la capa de servicio (ver servicio.py);
+# este módulo solo se encarga del menú de consola.
+servicio = ServicioHotel()
+
+# Registros indexados por ID (búsquedas O(1) e IDs que nunca se repiten)
+clientes = servicio.clientes
+habitaciones = servicio.habitaciones
+reservas = servicio.reservas
+pagos = servicio.pagos
+
+
+def habitaciones_disponibles(fecha_ingreso, fecha_salida, tipo=None):
+    """Habitaciones libres entre dos fechas (opcionalmente de un tipo)."""
+    return servicio.habitaciones_disponibles(fecha_ingreso, fecha_salida, tipo)
+
+
+# --------------------------------------------------------------
+# Función auxiliar para validar fechas
+# --------------------------------------------------------------
+def validar_fecha(fecha: str) -> bool:
+    """Verifica que la fecha esté en formato YYYY-MM-DD y sea una fecha válida."""
+    try:
+        datetime.strptime(fecha, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+# --------------------------------------------------------------
+# Menú principal
+# --------------------------------------------------------------
+def mostrar_menu():
+    print("\n" + "=" * 40)
+    print("        HOTEL SENA - MENÚ PRINCIPAL")
+    print("=" * 40)
+    print("1. Registrar cliente")
+    print("2. Registrar habitación")
+    print("3. Crear reservación")
+    print("4. Ver clientes")
+    print("5. Ver habitaciones")
+    print("6. Ver reservaciones")
+    print("7. Salir")
+    print("8. Procesar pago de una reservación")
+    print("9. Reporte de ocupación e ingresos")
+    print("10. Métricas de rendimiento")
+    print("=" * 40)
+
+
+# --------------------------------------------------------------
+# Registrar nuevo cliente
+# --------------------------------------------------------------
+def registrar_cliente():
+    print("\n--- Registrar nuevo cliente ---")
+    nombre = input("Nombre del cliente: ").strip()
+    correo = input("Correo electrónico: ").strip()
+    telefono = input("Teléfono: ").strip()
+
+    try:
+        cliente = servicio.registrar_cliente(nombre, correo, telefono)
+        print(f"Cliente {cliente.nombre} registrado con éxito.")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+# --------------------------------------------------------------
+# Registrar nueva habitación
+# --------------------------------------------------------------
+def registrar_habitacion():
+    print("\n--- Registrar nueva habitación ---")
+    try:
+        tipo = input("Tipo de habitación (Sencilla, Doble, Suite): ").strip().capitalize()
+        precio = input("Precio por noche: ")
+        habitacion = servicio.registrar_habitacion(tipo, precio)
+        print(f"Habitación {habitacion.tipo} registrada correctamente.")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+# --------------------------------------------------------------
+# Crear nueva reservación
+# --------------------------------------------------------------
+def crear_reservacion():
+    print("\n--- Crear nueva reservación ---")
+
+    if not clientes or not habitaciones:
+        print("Debes tener al menos un cliente y una habitación registrada.")
+        return
+
+    try:
+        # Buscar y seleccionar cliente
+        consulta = input("Buscar cliente (nombre, correo o teléfono): ").strip()
+        encontrados = servicio.buscar_clientes(consulta) if consulta else []
+        if not encontrados:
+            print("No se encontraron clientes con esa búsqueda.")
+            return
+        print("\nClientes encontrados:")
+        for c in encontrados:
+            print(f"{c.id_cliente}. {c.nombre} - {c.correo} - {c.telefono}")
+        id_cliente = int(input("Seleccione el ID del cliente: "))
+        if id_cliente not in clientes:
+            print("Cliente no encontrado.")
+            return
+
+        # Validar fechas de ingreso y salida
+        fecha_ingreso = input("Fecha de ingreso (YYYY-MM-DD): ").strip()
+        while not validar_fecha(fecha_ingreso):
+            print("Formato o valor de fecha inválido. Ejemplo correcto: 2025-10-02")
+            fecha_ingreso = input("Ingrese nuevamente la fecha de ingreso (YYYY-MM-DD): ").strip()
+
+        fecha_salida = input("Fecha de salida (YYYY-MM-DD): ").strip()
+        while not validar_fecha(fecha_salida):
+            print("Formato o valor de fecha inválido. Ejemplo correcto: 2025-10-10")
+            fecha_salida = input("Ingrese nuevamente la fecha de salida (YYYY-MM-DD): ").strip()
+
+        # Verificar que la salida sea posterior al ingreso
+        ingreso_dt = datetime.strptime(fecha_ingreso, "%Y-%m-%d")
+        salida_dt = datetime.strptime(fecha_salida, "%Y-%m-%d")
+        if salida_dt <= ingreso_dt:
+            print("Error: la fecha de salida debe ser posterior a la fecha de ingreso.")
+            return
+
+        # Seleccionar habitación libre en ese rango de fechas
+        print("\nHabitaciones disponibles:")
+        cotizadas = servicio.cotizar_disponibles(fecha_ingreso, fecha_salida)
+        disponibles = [h for h, _ in cotizadas]
+        if not disponibles:
+            print("No hay habitaciones disponibles en esas fechas.")
+            ofrecer_lista_espera(id_cliente, fecha_ingreso, fecha_salida)
+            return
+        for h, total in cotizadas:
+            print(f"{h.id_habitacion}. {h.tipo} - ${h.precio:,.2f} por noche - total estadía ${total:,.2f} - {h.estado}")
+        id_hab = int(input("Seleccione el ID de la habitación: "))
+        if not any(h.id_habitacion == id_hab for h in disponibles):
+            print("Habitación no encontrada o no disponible en esas fechas.")
+            return
+
+        # Crear reservación
+        reserva = servicio.crear_reservacion(id_cliente, id_hab, fecha_ingreso, fecha_salida)
+        print("Reservación creada correctamente.")
+        reserva.mostrar_en_consola()
+
+    except ValueError as e:
+        print(f"Error de datos: {e}")
+    except Exception as e:
+        print(f"Ocurrió un error al crear la reservación: {e}")
+
+
+def ofrecer_lista_espera(id_cliente, fecha_ingreso, fecha_salida):
+    """Sin habitaciones libres: se puede pedir un tipo (reacomodando otras reservas) o anotarse en espera."""
+    tipo = input("Tipo de habitación para la lista de espera (Enter para no anotarse): ").strip()
+    if not tipo:
+        return
+    resultado = servicio.solicitar_habitacion(id_cliente, tipo, fecha_ingreso, fecha_salida)
+    if not isinstance(resultado, SolicitudEspera):
+        print("Se reacomodaron otras reservaciones y quedó una habitación libre.")
+        resultado.mostrar_en_consola()
+    elif resultado.estado == "prioritaria":
+        print(f"Solicitud #{resultado.id_espera} anotada con prioridad: será la primera en atenderse al liberarse una habitación.")
+    else:
+        print(f"Solicitud #{resultado.id_espera} anotada en la lista de espera.")
+
+
+# --------------------------------------------------------------
+# Procesar pago de una reservación
+# --------------------------------------------------------------
+def procesar_pago_reservacion():
+    print("\n--- Procesar pago de una reservación ---")
+
+    if not reservas:
+        print("No hay reservaciones registradas.")
+        return
+
+    # Mostrar reservas activas, por páginas como en los listados
+    mostradas = escribir_paginas(
+        filtrar_reservaciones(reservas, estado="activa"),
+        lambda r: f"ID: {r.id_reserva} | Cliente: {r.cliente.nombre} | "
+                  f"Total: ${r.calcular_precio_total():,.2f} | Habitación: {r.habitacion.tipo}",
+        TAMANO_PAGINA,
+        continuar=_continuar_eleccion,
+    )
+    if not mostradas:
+        print("No hay reservaciones activas para pagar.")
+        return
+
+    try:
+        id_r = int(input("Seleccione el ID de la reservación para pagar: "))
+        reserva = reservas.obtener(id_r)
+        if not reserva or reserva.estado != "activa":
+            print("Reservación no encontrada o no activa.")
+            return
+
+        metodo = input("Método de pago (tarjeta, nequi, daviplata, paypal): ").strip().lower()
+        print("Procesando pago...")
+        pago = servicio.procesar_pago(id_r, metodo)
+        if pago.estado == "aprobado":
+            print(f"Pago #{pago.id_pago} aprobado por un monto de ${pago.monto:,.2f}. "
+                  f"La reservación #{id_r} quedó pagada.")
+        elif pago.estado == "rechazado":
+            print(f"Método de pago '{pago.metodo_pago}' no es válido.")
+        else:
+            print("El pago no pudo completarse correctamente.")
+
+    except Exception as e:
+        print(f"Ocurrió un error al procesar el pago: {e}")
+
+
+# --------------------------------------------------------------
+# Listados paginados (una escritura por página, ver listados.py)
+# --------------------------------------------------------------
+TAMANO_PAGINA = 10
+
+
+def _opcional(mensaje: str):
+    """Lee un filtro opcional; Enter lo deja vacío (None)."""
+    return input(mensaje).strip() or None
+
+
+def _continuar(_numero_pagina: int) -> bool:
+    return input("Enter: siguiente página | q: volver al menú: ").strip().lower() != "q"
+
+
+def _continuar_eleccion(_numero_pagina: int) -> bool:
+    return input("Enter: siguiente página | q: elegir de las mostradas: ").strip().lower() != "q"
+
+
+def _listar(filtrar, registro, filtros) -> None:
+    try:
+        mostrados = escribir_paginas(filtrar(registro, **filtros), lambda e: e.formato_consola(), TAMANO_PAGINA, continuar=_continuar)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    if not mostrados:
+        print("Ningún registro coincide con los filtros.")
+
+
+def _quiere_filtrar() -> bool:
+    return input("¿Aplicar filtros u orden? (s/N): ").strip().lower() == "s"
+
+
+# --------------------------------------------------------------
+# Ver clientes registrados
+# --------------------------------------------------------------
+def ver_clientes():
+    if not clientes:
+        print("No hay clientes registrados.")
+        return
+    filtros = {}
+    if _quiere_filtrar():
+        filtros["texto"] = _opcional("Nombre o correo contiene (Enter = todos): ")
+        filtros["orden"] = _opcional(f"Ordenar por ({', '.join(ORDEN_CLIENTES)}; Enter = registro): ")
+    _listar(filtrar_clientes, clientes, filtros)
+
+
+# --------------------------------------------------------------
+# Ver habitaciones registradas
+# --------------------------------------------------------------
+def ver_habitaciones():
+    if not habitaciones:
+        print("No hay habitaciones registradas.")
+        return
+    filtros = {}
+    if _quiere_filtrar():
+        filtros["tipo"] = _opcional("Tipo (Sencilla, Doble, Suite; Enter = todos): ")
+        filtros["estado"] = _opcional("Estado (disponible, reservada, ocupada; Enter = todos): ")
+        filtros["orden"] = _opcional(f"Ordenar por ({', '.join(ORDEN_HABITACIONES)}; Enter = registro): ")
+    _listar(filtrar_habitaciones, habitaciones, filtros)
+
+
+# --------------------------------------------------------------
+# Ver todas las reservaciones
+# --------------------------------------------------------------
+def ver_reservaciones():
+    if not reservas:
+        print("No hay reservaciones registradas.")
+        return
+    filtros = {}
+    if _quiere_filtrar():
+        filtros["estado"] = _opcional("Estado (activa, cancelada; Enter = todas): ")
+        filtros["desde"] = _opcional("Desde (YYYY-MM-DD; Enter = sin límite): ")
+        filtros["hasta"] = _opcional("Hasta (YYYY-MM-DD; Enter = sin límite): ")
+        for fecha in (filtros["desde"], filtros["hasta"]):
+            if fecha and not validar_fecha(fecha):
+                print("Formato o valor de fecha inválido. Ejemplo correcto: 2025-10-02")
+                return
+        id_cliente = _opcional("ID del cliente (Enter = todos): ")
+        if id_cliente:
+            if not id_cliente.isdigit():
+                print("Error: el ID del cliente debe ser un número.")
+                return
+            filtros["id_cliente"] = int(id_cliente)
+        filtros["tipo"] = _opcional("Tipo de habitación (Enter = todos): ")
+        filtros["orden"] = _opcional(f"Ordenar por ({', '.join(ORDEN_RESERVACIONES)}; Enter = registro): ")
+    _listar(filtrar_reservaciones, reservas, filtros)
+
+
+# --------------------------------------------------------------
+# Reporte de ocupación e ingresos
+# --------------------------------------------------------------
+def ver_reporte():
+    print("\n--- Reporte de ocupación e ingresos ---")
+    desde = input("Desde (YYYY-MM-DD): ").strip()
+    hasta = input("Hasta (YYYY-MM-DD): ").strip()
+    if not validar_fecha(desde) or not validar_fecha(hasta):
+        print("Formato o valor de fecha inválido. Ejemplo correcto: 2025-10-02")
+        return
+
+    try:
+        analitica = Analitica.desde_registros(reservas, habitaciones, pagos)
+        resumen = analitica.resumen(desde, hasta)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    print("\n" + "=" * 40)
+    print("     OCUPACIÓN E INGRESOS")
+    print("=" * 40)
+    print(f"{'Noches vendidas':15}: {resumen['noches_vendidas']} de {resumen['noches_disponibles']}")
+    print(f"{'Ocupación':15}: {resumen['ocupacion']:.1%}")
+    print(f"{'Ingresos':15}: ${resumen['ingresos']:,.2f}")
+    print(f"{'ADR':15}: ${resumen['adr']:,.2f}")
+    print(f"{'RevPAR':15}: ${resumen['revpar']:,.2f}")
+    for tipo, total in analitica.ingresos_por_tipo(desde, hasta).items():
+        print(f"{tipo:15}: ${total:,.2f}")
+    for metodo, total in analitica.ingresos_por_metodo(desde, hasta).items():
+        print(f"{'Pagos ' + metodo:15}: ${total:,.2f}")
+    print("=" * 40)
+
+    # Conciliación de todo el libro de pagos (ver libro_pagos.py)
+    print("     CONCILIACIÓN DE PAGOS")
+    print("=" * 40)
+    titulos = {"sin_pagar": "Sin pagar", "fallidas": "Cobro fallido", "pago_doble": "Pago doble",
+               "canceladas_pagas": "Cancel. pagas"}
+    for categoria, filas in servicio.conciliar_pagos().items():
+        ids = ", ".join(f"#{f['id_reserva']}" for f in filas[:10]) + (" ..." if len(filas) > 10 else "")
+        print(f"{titulos[categoria]:15}: {len(filas)} {ids}")
+    print("=" * 40 + "\n")
+
+
+# --------------------------------------------------------------
+# Métricas de rendimiento
+# --------------------------------------------------------------
+def ver_metricas():
+    while True:
+        print("\n--- Métricas de rendimiento (tiempos en ms) ---")
+        print(f"Medición: {'activa' if metricas.activo else 'inactiva'}")
+        print(metricas.tabla())
+        cache = servicio.cache.estadisticas()
+        print(f"Caché de consultas: {cache['entradas']}/{cache['capacidad']} entradas, "
+              f"{cache['aciertos']} aciertos, {cache['fallos']} fallos ({cache['tasa_aciertos']:.1%}), "
+              f"{cache['invalidadas']} invalidadas")
+        opcion = input("a: activar/desactivar | p: perfilado cProfile | t: texto Prometheus | "
+                       "r: reiniciar | Enter: volver: ").strip().lower()
+        if opcion == "a":
+            metricas.activar(not metricas.activo)
+        elif opcion == "p":
+            reporte = metricas.reporte_perfil()
+            if reporte:
+                print(reporte)
+            cada = input("Perfilar una de cada N llamadas (0 = apagar): ").strip()
+            try:
+                metricas.perfilar(int(cada))
+            except ValueError:
+                print("Ingrese un número entero mayor o igual a 0.")
+        elif opcion == "t":
+            print(metricas.texto_prometheus())
+        elif opcion == "r":
+            metricas.reiniciar()
+        else:
+            return
+
+
+# --------------------------------------------------------------
+# Bucle principal
+# --------------------------------------------------------------
+def main():
+    # Recuperar el estado guardado (los objetos se construyen a medida que se consultan)
+    cargados = servicio.cargar()
+    if any(cargados.values()):
+        print(f"Datos cargados: {cargados['clientes']} clientes, {cargados['habitaciones']} habitaciones, "
+              f"{cargados['reservas']} reservaciones, {cargados['pagos']} pagos, "
+              f"{cargados['espera']} en lista de espera.")
+
+    while True:
+        # Ingresos y salidas de huéspedes vencidos (ver agenda.py)
+        aplicados = servicio.avanzar_estancias()
+        if any(aplicados.values()):
+            print(f"Agenda del día: {aplicados['ingresos']} ingreso(s) y {aplicados['salidas']} salida(s) registrados.")
+
+        mostrar_menu()
+        opcion = input("Seleccione una opción: ").strip()
+
+        if opcion == "1":
+            registrar_cliente()
+        elif opcion == "2":
+            registrar_habitacion()
+        elif opcion == "3":
+            crear_reservacion()
+        elif opcion == "4":
+            ver_clientes()
+        elif opcion == "5":
+            ver_habitaciones()
+        elif opcion == "6":
+            ver_reservaciones()
+        elif opcion == "8":
+            procesar_pago_reservacion()
+        elif opcion == "9":
+            ver_reporte()
+        elif opcion == "10":
+            ver_metricas()
+        elif opcion == "7":
+            servicio.cerrar()
+            print("Gracias por usar el sistema del Hotel Sena. Hasta pronto.")
+            break
+        else:
+            print("Opción no válida. Intente de nuevo.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,31 @@
-import time
-import random
-import json
-import os
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.metricas import medido
+from hotel_sena.procesador_pagos import procesar_pagos
 
 class Pago:
     """Representa el pago asociado a una reservación."""
 
     METODOS_VALIDOS = ["tarjeta", "nequi", "daviplata", "paypal"]
 
-    def __init__(self, id_pago, monto, metodo_pago):
+    __slots__ = ("id_pago", "monto", "metodo_pago", "estado", "fecha", "id_reserva", "clave")
+
+    def __init__(self, id_pago, monto, metodo_pago, id_reserva=None, clave=None):
         self.id_pago = id_pago
         self.monto = float(monto)
         self.metodo_pago = metodo_pago.strip().lower()
         self.estado = "pendiente"
+        self.fecha = None  # fecha en que se procesó (YYYY-MM-DD)
+        self.id_reserva = id_reserva  # reservación que se cobra
+        self.clave = clave            # clave de idempotencia que envió la terminal (opcional)
+
+    @classmethod
+    def desde_registro(cls, registro):
+        """Reconstruye un pago a partir de su registro persistido (`to_dict`)."""
+        pago = cls(registro["ID Pago"], registro["Monto"], registro["Método"],
+                   registro.get("ID Reserva"), registro.get("Clave"))
+        pago.estado = registro["Estado"]
+        pago.fecha = registro.get("Fecha")
+        return pago
 
     # ----------------------------------------------------------
     # Validación del método de pago
@@ -30,50 +43,43 @@ class Pago:
     # ----------------------------------------------------------
     # Proceso de pago (simulación)
     # ----------------------------------------------------------
+    @medido("pago.procesar")
     def procesar_pago(self):
-        """Simula el proceso de pago y guarda el resultado."""
+        """
+        Procesa el pago a través de la pasarela (ver procesador_pagos) y guarda el resultado.
+        Para cobrar muchos pagos a la vez usar `procesar_pagos([...])`, que los envía en paralelo.
+        """
         if not self.validar_metodo_pago():
             return
 
         print("Procesando pago...")
-        time.sleep(1.5)
+        procesar_pagos([self])
 
-        exito = random.choice([True, False])  # Simulación aleatoria
-        if exito:
-            self.estado = "aprobado"
+        if self.estado == "aprobado":
             print(f"Pago #{self.id_pago} aprobado por un monto de ${self.monto:,.2f}.")
         else:
-            self.estado = "fallido"
             print("El pago no pudo completarse correctamente.")
-
-        # Guardar en archivo JSON
-        self.guardar_json()
+        print(f"Información del pago #{self.id_pago} guardada.")
 
     # ----------------------------------------------------------
     # Guardar información del pago
     # ----------------------------------------------------------
-    def guardar_json(self, ruta_archivo="data/pagos.json"):
-        """Guarda los pagos en un archivo JSON (se crea si no existe)."""
-        os.makedirs(os.path.dirname(ruta_archivo), exist_ok=True)
-
-        data = []
-        if os.path.exists(ruta_archivo):
-            with open(ruta_archivo, "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = []
-
-        data.append({
+    def to_dict(self):
+        """Devuelve el registro del pago tal como se persiste."""
+        return {
             "ID Pago": self.id_pago,
             "Monto": self.monto,
             "Método": self.metodo_pago,
-            "Estado": self.estado
-        })
-
-        with open(ruta_archivo, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+            "Estado": self.estado,
+            "Fecha": self.fecha,
+            "ID Reserva": self.id_reserva,
+            "Clave": self.clave
+        }
 
+    @medido("pago.guardar_json")
+    def guardar_json(self, ruta_archivo="data/pagos.json"):
+        """Anexa el pago al diario de pagos (ver almacenamiento.DiarioJSONL)."""
+        obtener_almacen(ruta_archivo).agregar(self.to_dict())
         print(f"Información del pago #{self.id_pago} guardada en '{ruta_archivo}'.")
 
     # ----------------------------------------------------------
@@ -0,0 +1,6 @@
+"""
+Sistema de gestión del Hotel Sena: clientes, habitaciones, reservaciones y pagos.
+
+Los módulos se importan por su ruta completa (`from hotel_sena.servicio import
+ServicioHotel`); el punto de entrada es hotel_main.py (`python -m hotel_sena`).
+"""
@@ -0,0 +1,6 @@
+"""`python -m hotel_sena ...`: lo mismo que la orden `hotel-sena` (ver hotel_main.py)."""
+import sys
+
+from hotel_sena.hotel_main import main
+
+sys.exit(main())
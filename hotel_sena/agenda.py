@@ -0,0 +1,136 @@
+"""
+Agenda de ingresos y salidas de huéspedes.
+
+Cada reservación activa produce dos eventos en un montículo ordenado por
+fecha: el ingreso (la habitación pasa a "ocupada") y la salida (la
+reservación queda "finalizada" y la habitación vuelve a "disponible", o a
+"reservada" si tiene más reservaciones por delante). Los eventos se
+programan solos con "reserva_registrada" (ver eventos.py), tanto al crear
+una reservación como al cargar los datos.
+
+`vencidos(hasta)` saca del montículo solo los eventos con fecha <= hasta,
+en orden: O(log n) por evento, sin recorrer las reservaciones. El mismo
+día las salidas van antes que los ingresos, para que una habitación que
+se entrega por la mañana pueda recibir al siguiente huésped.
+
+Las cancelaciones no se quitan del montículo: quien aplica los eventos
+(`ServicioHotel.avanzar_estancias`) descarta los de reservaciones que ya
+no están activas. Una reservación que se vuelve a registrar con las mismas
+fechas (al moverla de habitación o al deshacer un cambio) no se programa
+dos veces: la agenda recuerda qué (reservación, ingreso, salida) tiene
+pendientes hasta sacar su salida.
+
+El reloj es configurable, así que las pruebas pueden simular el paso de
+los días:
+
+    agenda = AgendaEstancias(reloj=lambda: date(2025, 12, 24))
+"""
+import heapq
+import threading
+from datetime import date
+from typing import Callable, List, Set, Tuple
+
+from hotel_sena.eventos import CanalEventos, canal_global
+
+SALIDA = 0   # el mismo día, primero las salidas
+INGRESO = 1
+
+# (día, SALIDA|INGRESO, id_reserva, ingreso, salida); fechas como ordinales
+Evento = Tuple[int, int, int, int, int]
+
+
+class AgendaEstancias:
+    """Montículo de ingresos y salidas programados."""
+
+    def __init__(self, reloj: Callable[[], date] = date.today, canal: CanalEventos = canal_global):
+        self.reloj = reloj
+        self._eventos: List[Evento] = []
+        # Programados aún no llevados al montículo: al cargar miles de
+        # reservaciones se ordenan todas juntas con heapify.
+        self._pendientes: List[Evento] = []
+        self._programadas: Set[Tuple[int, int, int]] = set()  # (id_reserva, ingreso, salida) con salida pendiente
+        self._candado = threading.Lock()
+
+        self._suscripciones = {
+            "reserva_registrada": self._al_registrar,
+            "indice_reiniciado": self.limpiar,
+        }
+        self.canal = canal
+        for evento, funcion in self._suscripciones.items():
+            canal.suscribir(evento, funcion)
+
+    def desconectar(self) -> None:
+        """Deja de escuchar los eventos del sistema."""
+        for evento, funcion in self._suscripciones.items():
+            self.canal.desuscribir(evento, funcion)
+
+    def hoy(self) -> int:
+        return self.reloj().toordinal()
+
+    def __len__(self) -> int:
+        with self._candado:
+            return len(self._eventos) + len(self._pendientes)
+
+    # ----------------------------------------------------------
+    # Programación
+    # ----------------------------------------------------------
+    def programar(self, id_reserva: int, ingreso: int, salida: int) -> None:
+        """Programa el ingreso y la salida de una reservación (una sola vez por fechas)."""
+        with self._candado:
+            clave = (id_reserva, ingreso, salida)
+            if clave in self._programadas:
+                return
+            self._programadas.add(clave)
+            self._pendientes.append((ingreso, INGRESO, id_reserva, ingreso, salida))
+            self._pendientes.append((salida, SALIDA, id_reserva, ingreso, salida))
+
+    def reprogramar(self, eventos: List[Evento]) -> None:
+        """Devuelve al montículo eventos ya sacados (por ejemplo, si no se pudieron aplicar)."""
+        with self._candado:
+            self._pendientes.extend(eventos)
+            self._programadas.update((e[2], e[3], e[4]) for e in eventos if e[1] == SALIDA)
+
+    def _al_registrar(self, habitacion, ingreso: int, salida: int, id_reserva: int) -> None:
+        self.programar(id_reserva, ingreso, salida)
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self._eventos.clear()
+            self._pendientes.clear()
+            self._programadas.clear()
+
+    def _aplicar_pendientes(self) -> None:
+        if not self._pendientes:
+            return
+        pendientes, self._pendientes = self._pendientes, []
+        if len(pendientes) > len(self._eventos) // 8:
+            self._eventos.extend(pendientes)
+            heapq.heapify(self._eventos)
+        else:
+            for evento in pendientes:
+                heapq.heappush(self._eventos, evento)
+
+    # ----------------------------------------------------------
+    # Consulta
+    # ----------------------------------------------------------
+    def proximo(self) -> int:
+        """Día (ordinal) del próximo evento, o 0 si no hay ninguno."""
+        with self._candado:
+            self._aplicar_pendientes()
+            return self._eventos[0][0] if self._eventos else 0
+
+    def hay_vencidos(self, hasta: int) -> bool:
+        proximo = self.proximo()
+        return bool(proximo) and proximo <= hasta
+
+    def vencidos(self, hasta: int) -> List[Evento]:
+        """Saca del montículo, en orden, los eventos con fecha <= `hasta`."""
+        with self._candado:
+            self._aplicar_pendientes()
+            sacados = []
+            while self._eventos and self._eventos[0][0] <= hasta:
+                evento = heapq.heappop(self._eventos)
+                if evento[1] == SALIDA:
+                    self._programadas.discard((evento[2], evento[3], evento[4]))
+                sacados.append(evento)
+            return sacados
@@ -0,0 +1,257 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Tuple
+
+from hotel_sena.almacenamiento import AlmacenamientoBase
+from hotel_sena.metricas import medido
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    id_cliente    INTEGER PRIMARY KEY,
+    nombre        TEXT NOT NULL,
+    correo        TEXT NOT NULL,
+    telefono      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_clientes_correo ON clientes (correo);
+
+CREATE TABLE IF NOT EXISTS habitaciones (
+    id_habitacion INTEGER PRIMARY KEY,
+    tipo          TEXT NOT NULL,
+    precio        REAL NOT NULL CHECK (precio >= 0),
+    estado        TEXT NOT NULL DEFAULT 'disponible'
+);
+CREATE INDEX IF NOT EXISTS ix_habitaciones_tipo ON habitaciones (tipo);
+
+CREATE TABLE IF NOT EXISTS reservaciones (
+    id_reserva    INTEGER PRIMARY KEY,
+    cliente       TEXT,
+    id_habitacion INTEGER NOT NULL,
+    ingreso       TEXT NOT NULL,
+    salida        TEXT NOT NULL,
+    precio        REAL NOT NULL,
+    precio_total  REAL,
+    estado        TEXT NOT NULL DEFAULT 'activa',
+    id_cliente    INTEGER,
+    CHECK (salida > ingreso)
+);
+CREATE INDEX IF NOT EXISTS ix_reservaciones_habitacion_fechas
+    ON reservaciones (id_habitacion, ingreso, salida);
+CREATE INDEX IF NOT EXISTS ix_reservaciones_cliente ON reservaciones (id_cliente);
+
+CREATE TABLE IF NOT EXISTS pagos (
+    id_pago       INTEGER PRIMARY KEY,
+    monto         REAL NOT NULL,
+    metodo        TEXT NOT NULL,
+    estado        TEXT NOT NULL,
+    fecha         TEXT,
+    id_reserva    INTEGER,
+    clave         TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_pagos_reserva ON pagos (id_reserva);
+
+CREATE TABLE IF NOT EXISTS libro_pagos (
+    orden         INTEGER PRIMARY KEY,
+    id_pago       INTEGER NOT NULL,
+    id_reserva    INTEGER,
+    clave         TEXT,
+    estado        TEXT NOT NULL,
+    monto         REAL NOT NULL,
+    metodo        TEXT,
+    registrado    TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_libro_pagos_reserva ON libro_pagos (id_reserva);
+
+CREATE TABLE IF NOT EXISTS lista_espera (
+    id_espera     INTEGER PRIMARY KEY,
+    id_cliente    INTEGER NOT NULL,
+    tipo          TEXT NOT NULL,
+    ingreso       TEXT NOT NULL,
+    salida        TEXT NOT NULL,
+    estado        TEXT NOT NULL,
+    creada        TEXT,
+    id_reserva    INTEGER
+);
+"""
+
+# Tabla de cada archivo de datos y, en el orden de `to_dict`, la columna de
+# cada campo. La primera columna es la clave primaria, salvo en el libro de
+# pagos: es de solo-anexar (varios movimientos por pago) y se ordena por
+# `orden`, que asigna SQLite.
+_TABLAS: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "clientes.json": ("clientes", (
+        ("id_cliente", "id_cliente"), ("nombre", "nombre"), ("correo", "correo"), ("telefono", "telefono"),
+    )),
+    "habitaciones.json": ("habitaciones", (
+        ("id_habitacion", "id_habitacion"), ("tipo", "tipo"), ("precio", "precio"), ("estado", "estado"),
+    )),
+    "reservas.json": ("reservaciones", (
+        ("ID", "id_reserva"), ("Cliente", "cliente"), ("Habitación", "id_habitacion"), ("Ingreso", "ingreso"),
+        ("Salida", "salida"), ("Precio por día", "precio"), ("Precio total", "precio_total"),
+        ("Estado", "estado"), ("ID Cliente", "id_cliente"),
+    )),
+    "pagos.json": ("pagos", (
+        ("ID Pago", "id_pago"), ("Monto", "monto"), ("Método", "metodo"), ("Estado", "estado"),
+        ("Fecha", "fecha"), ("ID Reserva", "id_reserva"), ("Clave", "clave"),
+    )),
+    "libro_pagos.json": ("libro_pagos", (
+        ("ID Pago", "id_pago"), ("ID Reserva", "id_reserva"), ("Clave", "clave"), ("Estado", "estado"),
+        ("Monto", "monto"), ("Método", "metodo"), ("Registrado", "registrado"),
+    )),
+    "lista_espera.json": ("lista_espera", (
+        ("ID Espera", "id_espera"), ("ID Cliente", "id_cliente"), ("Tipo", "tipo"), ("Ingreso", "ingreso"),
+        ("Salida", "salida"), ("Estado", "estado"), ("Creada", "creada"), ("ID Reserva", "id_reserva"),
+    )),
+}
+
+# Otra reservación vigente de la misma habitación que se cruza con la dada
+# (usa el índice por habitación y fechas).
+_SQL_CRUCE = """
+    SELECT otra.id_reserva FROM reservaciones r
+    JOIN reservaciones otra
+      ON otra.id_habitacion = r.id_habitacion AND otra.id_reserva != r.id_reserva
+    WHERE r.id_reserva = ? AND r.estado IN ('activa', 'pagada')
+      AND otra.estado IN ('activa', 'pagada')
+      AND otra.ingreso < r.salida AND otra.salida > r.ingreso
+    LIMIT 1
+"""
+
+
+class AlmacenSQLite(AlmacenamientoBase):
+    """
+    Persistencia en una base SQLite (modo WAL) compartida por todos los
+    archivos de datos de un directorio: `AlmacenSQLite("data/reservas.json")`
+    guarda en la tabla `reservaciones` de `data/hotel_sena.db`. Se elige con
+    `configurar_almacenamiento(AlmacenSQLite)` y la bitácora le escribe en
+    cada punto de control como a cualquier otro backend.
+
+    Cada tabla guarda solo la última versión de cada registro (clave
+    primaria = el ID del registro), salvo `libro_pagos`, que es de
+    solo-anexar. `cargar()` recorre la tabla por clave en páginas de
+    `tamano_pagina` filas (sin OFFSET), así que no la carga completa.
+
+    Las reservaciones además pasan por `reservando`: el cruce de fechas se
+    verifica e inserta dentro de una transacción `BEGIN IMMEDIATE`, de modo
+    que dos conexiones a la misma base (dos terminales o procesos) no
+    pueden reservar la misma habitación en las mismas noches.
+    """
+
+    def __init__(self, ruta: str, base: str = None, timeout: float = 5.0, tamano_pagina: int = 1000):
+        nombre = os.path.basename(ruta)
+        if nombre not in _TABLAS:
+            raise ValueError(f"No hay tabla para el archivo '{nombre}'. Opciones: {', '.join(_TABLAS)}")
+        self.ruta = ruta
+        self.base = base or os.path.join(os.path.dirname(ruta), "hotel_sena.db")
+        self.tabla, campos = _TABLAS[nombre]
+        self.campos = [campo for campo, _ in campos]
+        self.clave = "orden" if self.tabla == "libro_pagos" else campos[0][1]
+        self.tamano_pagina = tamano_pagina
+        columnas = [columna for _, columna in campos]
+        # Las sentencias son constantes con parámetros: sqlite3 las prepara una vez.
+        verbo = "INSERT" if self.tabla == "libro_pagos" else "INSERT OR REPLACE"
+        self._sql_insertar = (f"{verbo} INTO {self.tabla} ({', '.join(columnas)}) "
+                              f"VALUES ({', '.join('?' * len(columnas))})")
+        self._sql_pagina = (f"SELECT {self.clave}, {', '.join(columnas)} FROM {self.tabla} "
+                            f"WHERE {self.clave} > ? ORDER BY {self.clave} LIMIT ?")
+
+        carpeta = os.path.dirname(self.base)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        # isolation_level=None: las transacciones se abren explícitamente.
+        self.conexion = sqlite3.connect(self.base, timeout=timeout, isolation_level=None,
+                                        check_same_thread=False)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute("PRAGMA synchronous=FULL")
+        self.conexion.executescript(ESQUEMA)
+        self._candado = threading.RLock()
+
+    # ----------------------------------------------------------
+    # Transacciones
+    # ----------------------------------------------------------
+    @contextmanager
+    def _transaccion(self, inmediata: bool = False):
+        """
+        Abre una transacción; confirma al salir o revierte si hubo error.
+        Dentro de otra transacción de esta conexión (un punto de control
+        durante `reservando`) se suma a ella.
+        """
+        with self._candado:
+            if self.conexion.in_transaction:
+                yield self.conexion
+                return
+            self.conexion.execute("BEGIN IMMEDIATE" if inmediata else "BEGIN")
+            try:
+                yield self.conexion
+            except BaseException:
+                self.conexion.execute("ROLLBACK")
+                raise
+            self.conexion.execute("COMMIT")
+
+    # ----------------------------------------------------------
+    # Escritura
+    # ----------------------------------------------------------
+    @medido("almacen.sqlite.agregar_lote")
+    def agregar_lote(self, registros: Iterable[Dict]) -> int:
+        filas = [self._fila(registro) for registro in registros]
+        with self._transaccion(inmediata=True) as cx:
+            cx.executemany(self._sql_insertar, filas)
+        return len(filas)
+
+    @contextmanager
+    def reservando(self, registros: Iterable[Dict]):
+        """
+        Inserta las reservaciones y verifica, en la misma transacción
+        `BEGIN IMMEDIATE`, que ninguna vigente se cruce con otra de la misma
+        habitación; si alguna se cruza lanza ValueError sin guardar nada.
+        El cuerpo del `with` (la anotación en la bitácora) corre con la
+        transacción abierta: si falla, también se revierte.
+        """
+        if self.tabla != "reservaciones":
+            raise ValueError(f"'{self.tabla}' no guarda reservaciones.")
+        registros = list(registros)
+        with self._transaccion(inmediata=True) as cx:
+            cx.executemany(self._sql_insertar, map(self._fila, registros))
+            for registro in registros:
+                cruce = cx.execute(_SQL_CRUCE, (registro["ID"],)).fetchone()
+                if cruce is not None:
+                    raise ValueError(
+                        f"La habitación #{registro['Habitación']} ya está reservada en esas fechas "
+                        f"(reservación #{cruce[0]})."
+                    )
+            yield
+
+    def _fila(self, registro: Dict) -> Tuple:
+        return tuple(registro.get(campo) for campo in self.campos)
+
+    # ----------------------------------------------------------
+    # Lectura
+    # ----------------------------------------------------------
+    def cargar(self) -> Iterator[Dict]:
+        """Recorre la tabla por clave, página por página (paginación por clave, sin OFFSET)."""
+        ultimo = -1
+        while True:
+            with self._candado:
+                filas = self.conexion.execute(self._sql_pagina, (ultimo, self.tamano_pagina)).fetchall()
+            if not filas:
+                return
+            for fila in filas:
+                yield dict(zip(self.campos, fila[1:]))
+            ultimo = filas[-1][0]
+
+    def contar(self) -> int:
+        with self._candado:
+            return self.conexion.execute(f"SELECT COUNT(*) FROM {self.tabla}").fetchone()[0]
+
+    # ----------------------------------------------------------
+    # Mantenimiento y cierre
+    # ----------------------------------------------------------
+    def compactar(self) -> None:
+        """Pasa el WAL de SQLite a la base y lo deja vacío."""
+        with self._candado:
+            self.conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def cerrar(self) -> None:
+        with self._candado:
+            self.conexion.close()
@@ -0,0 +1,324 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator
+
+from hotel_sena.metricas import medido
+
+
+class AlmacenamientoBase:
+    """Interfaz común de los backends que persisten registros (diccionarios)."""
+
+    def agregar(self, registro: Dict) -> None:
+        """Persiste un único registro."""
+        self.agregar_lote([registro])
+
+    def agregar_lote(self, registros: Iterable[Dict]) -> int:
+        """Persiste varios registros en una sola escritura y devuelve cuántos fueron."""
+        raise NotImplementedError
+
+    def cargar(self) -> Iterator[Dict]:
+        """Recorre todos los registros persistidos en orden de escritura."""
+        raise NotImplementedError
+
+    def leer(self, contiene: str = None) -> Iterator[Dict]:
+        """
+        Recorre los registros sin reparar ni reorganizar nada, para leer
+        desde otro proceso mientras este escribe. Con `contiene`, el backend
+        puede saltarse sin interpretarlos los registros cuyo texto no lo
+        incluye (es solo un filtro rápido: quien llama revisa igual cada
+        registro). Por defecto, `cargar()`.
+        """
+        return self.cargar()
+
+    def compactar(self) -> None:
+        """Reorganiza el almacenamiento. Por defecto no hace nada."""
+
+    @contextmanager
+    def reservando(self, registros: Iterable[Dict]):
+        """
+        Envuelve la anotación de reservaciones nuevas o modificadas. Un
+        backend compartido entre procesos (ver almacen_sqlite.AlmacenSQLite)
+        verifica ahí el cruce de fechas contra lo que escribieron los demás
+        y lanza ValueError si lo hay. Por defecto no hace nada: en un solo
+        proceso basta el candado del servicio y el índice de disponibilidad.
+        """
+        yield
+
+
+# ---------------------------------------------------------
+# Formato histórico: arreglo JSON con sangría
+# ---------------------------------------------------------
+class AlmacenamientoJSON(AlmacenamientoBase):
+    """
+    Formato original de data/reservas.json y data/pagos.json:
+    un arreglo JSON que se lee y reescribe completo en cada escritura.
+    Se conserva por compatibilidad; para uso normal ver `DiarioJSONL`.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+
+    def cargar(self) -> Iterator[Dict]:
+        if not os.path.exists(self.ruta):
+            return iter(())
+        with open(self.ruta, "r", encoding="utf-8") as f:
+            try:
+                return iter(json.load(f))
+            except json.JSONDecodeError:
+                # Antes se ignoraba y la siguiente escritura borraba el historial.
+                raise ValueError(f"El archivo '{self.ruta}' no contiene un arreglo JSON válido.")
+
+    @medido("almacen.json.agregar_lote")
+    def agregar_lote(self, registros: Iterable[Dict]) -> int:
+        carpeta = os.path.dirname(self.ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        data = list(self.cargar())
+        antes = len(data)
+        data.extend(registros)
+        escribir_atomico(self.ruta, json.dumps(data, indent=4, ensure_ascii=False))
+        return len(data) - antes
+
+
+# ---------------------------------------------------------
+# Diario de solo-anexar (JSON lines) + snapshot
+# ---------------------------------------------------------
+class DiarioJSONL(AlmacenamientoBase):
+    """
+    Almacenamiento de solo-anexar.
+
+    Cada registro nuevo se escribe como una línea JSON en el diario
+    (`reservas.jsonl`) y se hace fsync, de modo que el costo de guardar
+    no depende del tamaño del historial. Cada `compactar_cada` registros
+    el diario se vuelca en el snapshot (`reservas.json`), que sigue siendo
+    un arreglo JSON válido, por lo que los archivos del formato anterior
+    se cargan sin conversión.
+
+    La compactación es segura ante caídas:
+        1. el diario se renombra a `.compactando` (las escrituras nuevas
+           van a un diario vacío),
+        2. se escribe `snapshot.nuevo` = snapshot + `.compactando`,
+        3. se borra `.compactando`,
+        4. `snapshot.nuevo` reemplaza al snapshot.
+    Si el proceso muere en cualquier paso, `_recuperar` deja los archivos
+    en un estado consistente sin perder ni duplicar registros.
+    """
+
+    def __init__(self, ruta_snapshot: str, ruta_diario: str = None, compactar_cada: int = 1000):
+        self.ruta_snapshot = ruta_snapshot
+        self.ruta_diario = ruta_diario or os.path.splitext(ruta_snapshot)[0] + ".jsonl"
+        self.ruta_compactando = self.ruta_diario + ".compactando"
+        self.ruta_nuevo = self.ruta_snapshot + ".nuevo"
+        self.compactar_cada = compactar_cada
+        self._lineas_diario = None  # se cuenta al primer uso
+        self._recuperado = False
+
+    # ----------------------------------------------------------
+    # Escritura
+    # ----------------------------------------------------------
+    @medido("almacen.diario.agregar_lote")
+    def agregar_lote(self, registros: Iterable[Dict]) -> int:
+        self._recuperar()
+        escritos = 0
+        with open(self.ruta_diario, "a", encoding="utf-8") as f:
+            for registro in registros:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                escritos += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._lineas_diario += escritos
+        if self.compactar_cada and self._lineas_diario >= self.compactar_cada:
+            self.compactar()
+        return escritos
+
+    # ----------------------------------------------------------
+    # Lectura
+    # ----------------------------------------------------------
+    def cargar(self) -> Iterator[Dict]:
+        """Reproduce snapshot + diario en orden de escritura."""
+        self._recuperar()
+        yield from _leer_snapshot(self.ruta_snapshot)
+        yield from _leer_diario(self.ruta_diario)
+
+    def leer(self, contiene: str = None) -> Iterator[Dict]:
+        """Snapshot + diario (y el diario en compactación, si lo hay); ignora una línea a medio escribir."""
+        yield from _leer_snapshot(self.ruta_snapshot, contiene)
+        for ruta in (self.ruta_compactando, self.ruta_diario):
+            yield from _leer_diario(ruta, solo_completas=True, contiene=contiene)
+
+    # ----------------------------------------------------------
+    # Compactación
+    # ----------------------------------------------------------
+    @medido("almacen.diario.compactar")
+    def compactar(self) -> None:
+        """Vuelca el diario en el snapshot y deja el diario vacío."""
+        self._recuperar()
+        if not os.path.exists(self.ruta_diario) or os.path.getsize(self.ruta_diario) == 0:
+            return
+        os.replace(self.ruta_diario, self.ruta_compactando)
+        self._lineas_diario = 0
+        self._terminar_compactacion()
+
+    def _terminar_compactacion(self) -> None:
+        registros = _encadenar(
+            _leer_snapshot(self.ruta_snapshot),
+            _leer_diario(self.ruta_compactando),
+        )
+        _escribir_snapshot(self.ruta_nuevo, registros)
+        os.remove(self.ruta_compactando)
+        os.replace(self.ruta_nuevo, self.ruta_snapshot)
+        _sincronizar_carpeta(self.ruta_snapshot)
+
+    def _recuperar(self) -> None:
+        """Completa o rehace una compactación interrumpida y repara el diario."""
+        if self._recuperado:
+            return
+        carpeta = os.path.dirname(self.ruta_snapshot)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+
+        if os.path.exists(self.ruta_compactando):
+            # La caída ocurrió antes de borrar `.compactando`: el snapshot
+            # viejo sigue intacto, así que se rehace la compactación.
+            _truncar_linea_incompleta(self.ruta_compactando)
+            self._terminar_compactacion()
+        elif os.path.exists(self.ruta_nuevo):
+            # `.compactando` ya se borró: `snapshot.nuevo` está completo.
+            os.replace(self.ruta_nuevo, self.ruta_snapshot)
+
+        self._lineas_diario = _truncar_linea_incompleta(self.ruta_diario)
+        self._recuperado = True
+
+
+# ---------------------------------------------------------
+# Funciones auxiliares de lectura/escritura
+# ---------------------------------------------------------
+def _encadenar(*iterables: Iterable[Dict]) -> Iterator[Dict]:
+    for it in iterables:
+        yield from it
+
+
+def _leer_diario(ruta: str, solo_completas: bool = False, contiene: str = None) -> Iterator[Dict]:
+    if not os.path.exists(ruta):
+        return
+    with open(ruta, "r", encoding="utf-8") as f:
+        for linea in f:
+            if solo_completas and not linea.endswith("\n"):
+                return  # otro proceso la está escribiendo
+            if contiene is not None and contiene not in linea:
+                continue
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def _leer_snapshot(ruta: str, contiene: str = None) -> Iterator[Dict]:
+    """
+    Lee un snapshot. Los escritos por `_escribir_snapshot` tienen un
+    registro por línea y se leen en streaming (con `contiene`, se saltan
+    las líneas que no incluyen ese texto); cualquier otro arreglo JSON
+    (por ejemplo el formato con sangría anterior) se carga completo.
+    """
+    if not os.path.exists(ruta):
+        return
+    with open(ruta, "r", encoding="utf-8") as f:
+        primera = f.readline().strip()
+        segunda = f.readline().strip()
+        por_lineas = primera == "[" and (segunda == "]" or (segunda.startswith("{") and segunda.rstrip(",").endswith("}")))
+        if not por_lineas:
+            f.seek(0)
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                raise ValueError(f"El archivo '{ruta}' no contiene un arreglo JSON válido.")
+            yield from data
+            return
+
+        linea = segunda
+        while linea and linea != "]":
+            if contiene is None or contiene in linea:
+                yield json.loads(linea.rstrip(","))
+            linea = f.readline().strip()
+
+
+def _escribir_snapshot(ruta: str, registros: Iterable[Dict]) -> None:
+    """Escribe un arreglo JSON con un registro por línea y hace fsync."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        separador = ""
+        for registro in registros:
+            f.write(separador + json.dumps(registro, ensure_ascii=False))
+            separador = ",\n"
+        f.write("\n]\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def escribir_atomico(ruta: str, contenido: str) -> None:
+    """
+    Reemplaza el archivo de una sola vez: escribe un temporal, hace fsync y
+    lo renombra encima. Tras una caída queda la versión vieja o la nueva
+    completa, nunca una mezcla.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        f.write(contenido)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+    _sincronizar_carpeta(ruta)
+
+
+def _sincronizar_carpeta(ruta: str) -> None:
+    """fsync de la carpeta para que el rename sobreviva a un corte de luz (solo POSIX)."""
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(ruta) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _truncar_linea_incompleta(ruta: str) -> int:
+    """
+    Elimina una última línea sin salto de línea (escritura interrumpida)
+    y devuelve cuántas líneas completas quedan en el diario.
+    """
+    if not os.path.exists(ruta):
+        return 0
+    with open(ruta, "rb+") as f:
+        contenido = f.read()
+        if contenido and not contenido.endswith(b"\n"):
+            completo = contenido.rfind(b"\n") + 1
+            f.truncate(completo)
+            contenido = contenido[:completo]
+    return contenido.count(b"\n")
+
+
+# ---------------------------------------------------------
+# Selección del backend
+# ---------------------------------------------------------
+_fabrica: Callable[[str], AlmacenamientoBase] = DiarioJSONL
+_almacenes: Dict[str, AlmacenamientoBase] = {}
+
+
+def configurar_almacenamiento(fabrica: Callable[[str], AlmacenamientoBase]) -> None:
+    """Cambia el backend usado por `obtener_almacen` (recibe la ruta del archivo)."""
+    global _fabrica
+    _fabrica = fabrica
+    _almacenes.clear()
+
+
+def obtener_almacen(ruta: str) -> AlmacenamientoBase:
+    """Devuelve (y reutiliza) el almacén asociado a una ruta."""
+    almacen = _almacenes.get(ruta)
+    if almacen is None:
+        almacen = _almacenes[ruta] = _fabrica(ruta)
+    return almacen
+
+
+def importar_arreglo_json(ruta_origen: str, destino: AlmacenamientoBase) -> int:
+    """Importa un arreglo JSON del formato anterior a cualquier almacén."""
+    return destino.agregar_lote(AlmacenamientoJSON(ruta_origen).cargar())
@@ -0,0 +1,206 @@
+from array import array
+from datetime import date
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from hotel_sena.columnar import TablaReservasColumnar
+from hotel_sena.disponibilidad import a_ordinal
+
+try:  # NumPy es opcional: sin él se usan los mismos algoritmos en Python puro
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _vector(columna: array):
+    """Vista NumPy (sin copia) de una columna `array`."""
+    return np.array(columna, dtype=columna.typecode) if not len(columna) else np.frombuffer(columna, dtype=columna.typecode)
+
+
+class ColumnasPagos:
+    """Pagos aprobados en columnas: monto, método (código) y fecha (ordinal)."""
+
+    def __init__(self):
+        self.monto = array("d")
+        self.metodo = array("h")
+        self.fecha = array("i")
+        self.metodos: List[str] = []
+        self._codigo_metodo: Dict[str, int] = {}
+
+    def agregar_fila(self, monto: float, metodo: str, fecha: Optional[str], estado: str) -> None:
+        if estado != "aprobado" or not fecha:
+            return
+        codigo = self._codigo_metodo.get(metodo)
+        if codigo is None:
+            codigo = self._codigo_metodo[metodo] = len(self.metodos)
+            self.metodos.append(metodo)
+        self.monto.append(monto)
+        self.metodo.append(codigo)
+        self.fecha.append(date.fromisoformat(fecha).toordinal())
+
+    def agregar_registro(self, registro: Dict) -> None:
+        """Agrega un registro persistido (`Pago.to_dict`)."""
+        self.agregar_fila(registro["Monto"], registro["Método"], registro.get("Fecha"), registro["Estado"])
+
+    def __len__(self) -> int:
+        return len(self.monto)
+
+
+class Analitica:
+    """
+    Métricas de ocupación e ingresos sobre las tablas en columnas.
+
+    Los rangos `desde`-`hasta` incluyen ambos días (noches de hotel). La
+    ocupación por noche se calcula con un arreglo de diferencias (+1 en
+    la noche de ingreso, -1 en la de salida) y una suma acumulada, así que
+    el costo es O(reservas + días) sin recorrer las noches de cada estadía.
+    Con NumPy instalado todas las operaciones son vectoriales
+    (`bincount`, `cumsum`, `clip`); sin NumPy se usa el mismo algoritmo
+    con `array` e `itertools.accumulate`.
+    """
+
+    def __init__(self, reservas: TablaReservasColumnar, total_habitaciones: int, pagos: ColumnasPagos = None):
+        self.reservas = reservas
+        self.pagos = pagos or ColumnasPagos()
+        self.total_habitaciones = total_habitaciones
+
+    @classmethod
+    def desde_registros(cls, reservas, habitaciones, pagos=()) -> "Analitica":
+        """
+        Construye las columnas a partir de los registros del sistema usando
+        los registros crudos, sin construir objetos pendientes de carga.
+        """
+        tipos = {h.id_habitacion: h.tipo for h in habitaciones}
+
+        tabla = TablaReservasColumnar()
+        for registro in sorted(reservas.crudos(), key=lambda r: r["ID"]):
+            tabla.agregar_registro(registro, tipos.get(registro["Habitación"], ""))
+
+        columnas_pagos = ColumnasPagos()
+        for registro in (pagos.crudos() if hasattr(pagos, "crudos") else (p.to_dict() for p in pagos)):
+            columnas_pagos.agregar_registro(registro)
+        return cls(tabla, len(tipos), columnas_pagos)
+
+    # ----------------------------------------------------------
+    # Noches dentro del rango (recorte de cada estadía)
+    # ----------------------------------------------------------
+    def _recortar(self, desde: int, dias: int):
+        """
+        Devuelve (inicio, fin, precio, tipo) de las reservaciones no canceladas,
+        con inicio/fin relativos a `desde` y recortados a [0, dias].
+        """
+        t = self.reservas
+        cancelada = t._codigo_estado.get("cancelada", -1)
+        if np is not None:
+            ingreso, salida, precio, tipo, estado = (
+                _vector(c) for c in (t.ingreso, t.salida, t.precio, t.tipo, t.estado)
+            )
+            inicio = np.clip(ingreso - desde, 0, dias)
+            fin = np.clip(salida - desde, 0, dias)
+            validas = (estado != cancelada) & (fin > inicio)
+            return inicio[validas], fin[validas], precio[validas], tipo[validas]
+
+        inicio, fin, precio, tipo = array("i"), array("i"), array("d"), array("h")
+        for i in range(len(t)):
+            if t.estado[i] == cancelada:
+                continue
+            a = min(max(t.ingreso[i] - desde, 0), dias)
+            b = min(max(t.salida[i] - desde, 0), dias)
+            if b > a:
+                inicio.append(a)
+                fin.append(b)
+                precio.append(t.precio[i])
+                tipo.append(t.tipo[i])
+        return inicio, fin, precio, tipo
+
+    @staticmethod
+    def _por_noche(inicio, fin, pesos, dias: int) -> List[float]:
+        """Suma `pesos` en cada noche cubierta por [inicio, fin) usando un arreglo de diferencias."""
+        if np is not None:
+            dif = np.bincount(inicio, weights=pesos, minlength=dias + 1) \
+                - np.bincount(fin, weights=pesos, minlength=dias + 1)
+            return np.cumsum(dif[:dias]).tolist()
+        dif = [0.0] * (dias + 1)
+        for a, b, w in zip(inicio, fin, pesos):
+            dif[a] += w
+            dif[b] -= w
+        return list(accumulate(dif[:dias]))
+
+    @staticmethod
+    def _rango(desde, hasta) -> Tuple[int, int]:
+        inicio, fin = a_ordinal(desde), a_ordinal(hasta)
+        if fin < inicio:
+            raise ValueError("La fecha final del reporte no puede ser anterior a la inicial.")
+        return inicio, fin - inicio + 1
+
+    # ----------------------------------------------------------
+    # Métricas
+    # ----------------------------------------------------------
+    def ocupacion_diaria(self, desde, hasta) -> List[Tuple[str, int, float]]:
+        """[(fecha, habitaciones ocupadas, tasa de ocupación), ...] por cada noche del rango."""
+        inicio, dias = self._rango(desde, hasta)
+        a, b, precio, _ = self._recortar(inicio, dias)
+        unos = np.ones(len(a)) if np is not None else [1.0] * len(a)
+        ocupadas = self._por_noche(a, b, unos, dias)
+        total = self.total_habitaciones or 1
+        return [
+            (date.fromordinal(inicio + i).isoformat(), int(round(n)), n / total)
+            for i, n in enumerate(ocupadas)
+        ]
+
+    def ingresos_diarios(self, desde, hasta) -> List[Tuple[str, float]]:
+        """[(fecha, ingresos de habitaciones de esa noche), ...]."""
+        inicio, dias = self._rango(desde, hasta)
+        a, b, precio, _ = self._recortar(inicio, dias)
+        ingresos = self._por_noche(a, b, precio, dias)
+        return [(date.fromordinal(inicio + i).isoformat(), v) for i, v in enumerate(ingresos)]
+
+    def resumen(self, desde, hasta) -> Dict[str, float]:
+        """Noches vendidas, ingresos, ocupación, ADR y RevPAR del rango."""
+        inicio, dias = self._rango(desde, hasta)
+        a, b, precio, _ = self._recortar(inicio, dias)
+        if np is not None:
+            noches = b - a
+            vendidas = int(noches.sum())
+            ingresos = float((noches * precio).sum())
+        else:
+            vendidas = sum(y - x for x, y in zip(a, b))
+            ingresos = sum((y - x) * p for x, y, p in zip(a, b, precio))
+        disponibles = self.total_habitaciones * dias
+        return {
+            "noches_vendidas": vendidas,
+            "noches_disponibles": disponibles,
+            "ingresos": ingresos,
+            "ocupacion": vendidas / disponibles if disponibles else 0.0,
+            "adr": ingresos / vendidas if vendidas else 0.0,
+            "revpar": ingresos / disponibles if disponibles else 0.0,
+        }
+
+    def ingresos_por_tipo(self, desde, hasta) -> Dict[str, float]:
+        """Ingresos de las noches del rango agrupados por tipo de habitación."""
+        inicio, dias = self._rango(desde, hasta)
+        a, b, precio, tipo = self._recortar(inicio, dias)
+        tipos = self.reservas.tipos
+        if np is not None:
+            totales = np.bincount(tipo, weights=(b - a) * precio, minlength=len(tipos)).tolist()
+        else:
+            totales = [0.0] * len(tipos)
+            for x, y, p, k in zip(a, b, precio, tipo):
+                totales[k] += (y - x) * p
+        return {tipos[k]: v for k, v in enumerate(totales) if v}
+
+    def ingresos_por_metodo(self, desde, hasta) -> Dict[str, float]:
+        """Pagos aprobados con fecha dentro del rango, agrupados por método de pago."""
+        inicio, dias = self._rango(desde, hasta)
+        p = self.pagos
+        if np is not None and len(p):
+            fecha = _vector(p.fecha)
+            dentro = (fecha >= inicio) & (fecha < inicio + dias)
+            totales = np.bincount(_vector(p.metodo)[dentro], weights=_vector(p.monto)[dentro],
+                                  minlength=len(p.metodos)).tolist()
+        else:
+            totales = [0.0] * len(p.metodos)
+            for monto, metodo, fecha in zip(p.monto, p.metodo, p.fecha):
+                if inicio <= fecha < inicio + dias:
+                    totales[metodo] += monto
+        return {p.metodos[k]: v for k, v in enumerate(totales) if v}
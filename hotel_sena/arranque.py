@@ -0,0 +1,113 @@
+import os
+from datetime import date
+from typing import Dict
+
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.busqueda import indice_clientes
+from hotel_sena.Cliente import Cliente
+from hotel_sena.Habitaciones import Habitacion
+from hotel_sena.reservacion import Reservacion
+from hotel_sena.Pagos import Pago
+from hotel_sena.disponibilidad import indice_disponibilidad
+from hotel_sena.metricas import medido
+
+
+def _ultimos_por_id(ruta: str, campo_id: str) -> Dict:
+    """
+    Recorre el almacén y se queda con la última versión de cada registro
+    (en un diario de solo-anexar, una escritura posterior reemplaza a la anterior).
+    """
+    ultimos = {}
+    for registro in obtener_almacen(ruta).cargar():
+        pk = registro.get(campo_id)
+        if pk is not None:
+            ultimos[pk] = registro
+    return ultimos
+
+
+@medido("arranque.cargar_estado")
+def cargar_estado(clientes, habitaciones, reservas, pagos, directorio: str = "data",
+                  indice=indice_disponibilidad, busqueda=indice_clientes) -> Dict[str, int]:
+    """
+    Reconstruye el estado en memoria a partir de lo persistido en `directorio`.
+
+    Las habitaciones (pocas) se construyen de inmediato. Clientes,
+    reservaciones y pagos solo se indexan: se guardan los registros crudos
+    con sus claves y cada objeto se construye (con su `strptime`) la
+    primera vez que se consulta. El índice de disponibilidad (`indice`) se
+    arma con ordinales a partir de las fechas ISO, sin construir
+    reservaciones, y el de búsqueda (`busqueda`) con los registros crudos.
+
+    Devuelve cuántos registros de cada tipo se cargaron.
+    """
+    ruta = lambda nombre: os.path.join(directorio, nombre)
+
+    # Habitaciones ------------------------------------------------
+    for crudo in _ultimos_por_id(ruta("habitaciones.json"), "id_habitacion").values():
+        if crudo["id_habitacion"] in habitaciones:
+            continue
+        habitacion = Habitacion(crudo["id_habitacion"], crudo["tipo"], crudo["precio"], crudo["estado"])
+        habitaciones.agregar(habitacion)
+        indice.agregar_habitacion(habitacion)
+
+    # Clientes ----------------------------------------------------
+    crudos_clientes = _ultimos_por_id(ruta("clientes.json"), "id_cliente")
+    for pk, crudo in crudos_clientes.items():
+        if pk not in clientes:
+            clientes.agregar_perezoso(pk, crudo, {"correo": crudo["correo"], "telefono": crudo["telefono"]})
+            busqueda.indexar(pk, crudo["nombre"], crudo["correo"], crudo["telefono"])
+
+    def hidratar_cliente(crudo: Dict) -> Cliente:
+        cliente = Cliente(crudo["id_cliente"], crudo["nombre"], crudo["correo"], crudo["telefono"], canal=None)
+        cliente.reservas = reservas.ids("cliente", cliente.id_cliente)
+        return cliente
+
+    clientes.hidratar = hidratar_cliente
+
+    # Reservaciones -----------------------------------------------
+    # Los registros anteriores no guardaban "ID Cliente": se resuelve por nombre.
+    por_nombre = None
+    cargadas = 0
+    for pk, crudo in _ultimos_por_id(ruta("reservas.json"), "ID").items():
+        if pk in reservas:
+            continue
+        id_cliente = crudo.get("ID Cliente")
+        if id_cliente is None:
+            if por_nombre is None:
+                por_nombre = {c["nombre"]: c["id_cliente"] for c in crudos_clientes.values()}
+            id_cliente = crudo["ID Cliente"] = por_nombre.get(crudo["Cliente"])
+        habitacion = habitaciones.obtener(crudo["Habitación"])
+        if id_cliente is None or habitacion is None:
+            continue  # registro huérfano: su cliente o habitación no se persistió
+
+        reservas.agregar_perezoso(pk, crudo, {"cliente": id_cliente, "habitacion": habitacion.id_habitacion})
+        cargadas += 1
+        if crudo["Estado"].lower() in Reservacion.VIGENTES:
+            indice.registrar(
+                habitacion,
+                date.fromisoformat(crudo["Ingreso"]).toordinal(),
+                date.fromisoformat(crudo["Salida"]).toordinal(),
+                pk,
+            )
+            if habitacion.estado == "disponible":
+                habitacion.estado = "reservada"
+
+    def hidratar_reserva(crudo: Dict) -> Reservacion:
+        return Reservacion.desde_registro(
+            crudo, clientes.obtener(crudo["ID Cliente"]), habitaciones.obtener(crudo["Habitación"])
+        )
+
+    reservas.hidratar = hidratar_reserva
+
+    # Pagos ------------------------------------------------------
+    for pk, crudo in _ultimos_por_id(ruta("pagos.json"), "ID Pago").items():
+        if pk not in pagos:
+            pagos.agregar_perezoso(pk, crudo, {"reserva": crudo.get("ID Reserva"), "clave": crudo.get("Clave")})
+    pagos.hidratar = Pago.desde_registro
+
+    return {
+        "clientes": len(clientes),
+        "habitaciones": len(habitaciones),
+        "reservas": cargadas,
+        "pagos": len(pagos),
+    }
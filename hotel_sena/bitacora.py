@@ -0,0 +1,201 @@
+"""
+Bitácora de escritura anticipada (WAL) del estado del hotel.
+
+Cada cambio de estado (alta de cliente o habitación, cambio de estado de
+una habitación, reservación, cancelación, pago) se anota primero en
+`bitacora.wal` como UNA línea con fsync, antes de confirmarlo a quien lo
+pidió. Una línea puede traer varios registros (por ejemplo la reservación
+y su habitación, o todo un grupo), así que esos cambios sobreviven o se
+pierden juntos.
+
+Formato de cada línea:
+
+    <crc32 en hex, 8 dígitos> {"lsn": 17, "cambios": [["reservas.json", {...}], ...]}
+
+Los archivos de datos (`clientes.json`, `reservas.json`, ... con sus
+diarios, ver almacenamiento.py) quedan al día en cada punto de control:
+
+    1. los cambios anotados desde el último punto de control se anexan a
+       sus archivos (una escritura por archivo),
+    2. `punto_control.json` se reemplaza atómicamente con el último LSN
+       aplicado (archivo temporal + fsync + rename),
+    3. la bitácora se vacía.
+
+Al arrancar, `recuperar` descarta la cola dañada de la bitácora (línea
+cortada o con CRC que no coincide), vuelve a aplicar las líneas con LSN
+mayor al del punto de control y hace un punto de control. Reaplicar es
+inocuo porque al cargar gana la última versión de cada ID, así que una
+caída en cualquier paso no pierde ni corrompe datos confirmados. El
+trabajo de recuperación depende de `punto_control_cada`, no del tamaño
+del historial.
+"""
+import json
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from hotel_sena.almacenamiento import escribir_atomico, obtener_almacen
+from hotel_sena.metricas import medido
+
+Cambio = Tuple[str, Dict]  # (archivo de datos, registro)
+
+
+class Bitacora:
+    """WAL de un directorio de datos."""
+
+    def __init__(self, directorio: str = "data", punto_control_cada: int = 1000):
+        self.directorio = directorio
+        self.ruta = os.path.join(directorio, "bitacora.wal")
+        self.ruta_control = os.path.join(directorio, "punto_control.json")
+        self.punto_control_cada = punto_control_cada
+        self._lsn = 0                        # último LSN anotado
+        self._pendientes: List[Cambio] = []  # cambios anotados desde el último punto de control
+        self._lineas = 0
+        self._archivo = None
+        self._candado = threading.Lock()
+
+    # ----------------------------------------------------------
+    # Escritura
+    # ----------------------------------------------------------
+    @medido("bitacora.anotar")
+    def anotar(self, cambios: Iterable[Cambio]) -> int:
+        """Anota los cambios como una sola entrada durable y devuelve su LSN."""
+        cambios = [(archivo, registro) for archivo, registro in cambios]
+        if not cambios:
+            raise ValueError("No hay cambios para anotar en la bitácora.")
+        with self._candado:
+            self._abrir()
+            lsn = self._lsn + 1
+            self._archivo.write(_linea(lsn, cambios))
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._lsn = lsn
+            self._pendientes.extend(cambios)
+            self._lineas += 1
+            if self.punto_control_cada and self._lineas >= self.punto_control_cada:
+                try:
+                    self._punto_control()
+                except OSError:
+                    pass  # la entrada ya es durable; el punto de control se reintenta en la próxima
+            return lsn
+
+    def punto_control(self) -> None:
+        """Lleva los cambios pendientes a los archivos de datos y vacía la bitácora."""
+        with self._candado:
+            self._abrir()
+            self._punto_control()
+
+    def cerrar(self) -> None:
+        """Punto de control final y cierre del archivo."""
+        with self._candado:
+            if self._archivo is None:
+                return
+            self._punto_control()
+            self._archivo.close()
+            self._archivo = None
+
+    @medido("bitacora.punto_control")
+    def _punto_control(self) -> None:
+        if self._lineas:
+            por_archivo: Dict[str, List[Dict]] = {}
+            for archivo, registro in self._pendientes:
+                por_archivo.setdefault(archivo, []).append(registro)
+            for archivo, registros in por_archivo.items():
+                obtener_almacen(os.path.join(self.directorio, archivo)).agregar_lote(registros)
+            escribir_atomico(self.ruta_control, json.dumps({"lsn": self._lsn}))
+            self._pendientes = []
+            self._lineas = 0
+        if self._archivo.tell():
+            self._archivo.seek(0)
+            self._archivo.truncate()
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+
+    # ----------------------------------------------------------
+    # Recuperación
+    # ----------------------------------------------------------
+    def recuperar(self) -> int:
+        """
+        Aplica a los archivos de datos lo que quedó en la bitácora tras una
+        caída. Devuelve cuántas entradas se reaplicaron.
+        """
+        with self._candado:
+            if self._archivo is not None:
+                return 0
+            return self._abrir()
+
+    def _abrir(self) -> int:
+        if self._archivo is not None:
+            return 0
+        os.makedirs(self.directorio or ".", exist_ok=True)
+        lsn_control = self._leer_control()
+        self._lsn = lsn_control
+
+        validas, largo_valido = [], 0
+        if os.path.exists(self.ruta):
+            for lsn, cambios, fin in _leer_bitacora(self.ruta):
+                largo_valido = fin
+                if lsn > lsn_control:  # las anteriores ya están en los archivos de datos
+                    validas.append(cambios)
+                    self._lsn = lsn
+            with open(self.ruta, "rb+") as f:
+                f.truncate(largo_valido)
+
+        self._archivo = open(self.ruta, "a", encoding="utf-8")
+        for cambios in validas:
+            self._pendientes.extend(cambios)
+        self._lineas = len(validas)
+        self._punto_control()
+        return len(validas)
+
+    def sin_aplicar(self) -> Iterator[Cambio]:
+        """
+        Cambios anotados después del último punto de control, en orden, sin
+        modificar ningún archivo. Sirve para leer los datos mientras otro
+        proceso (el servidor) los está usando.
+        """
+        if not os.path.exists(self.ruta):
+            return
+        lsn_control = self._leer_control()
+        for lsn, cambios, _ in _leer_bitacora(self.ruta):
+            if lsn > lsn_control:
+                yield from cambios
+
+    def _leer_control(self) -> int:
+        if not os.path.exists(self.ruta_control):
+            return 0
+        with open(self.ruta_control, "r", encoding="utf-8") as f:
+            try:
+                return int(json.load(f)["lsn"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                raise ValueError(f"El punto de control '{self.ruta_control}' está dañado.")
+
+
+def _linea(lsn: int, cambios: List[Cambio]) -> str:
+    cuerpo = json.dumps({"lsn": lsn, "cambios": cambios}, ensure_ascii=False)
+    return f"{zlib.crc32(cuerpo.encode('utf-8')):08x} {cuerpo}\n"
+
+
+def _leer_bitacora(ruta: str) -> Iterator[Tuple[int, List[Cambio], int]]:
+    """
+    Entradas válidas (lsn, cambios, posición donde termina la línea) hasta
+    la primera línea cortada, dañada o con LSN repetido o fuera de orden.
+    """
+    fin, anterior = 0, 0
+    with open(ruta, "rb") as f:
+        for linea in f:
+            if not linea.endswith(b"\n") or len(linea) < 10 or linea[8:9] != b" ":
+                return
+            cuerpo = linea[9:-1]
+            try:
+                if int(linea[:8], 16) != zlib.crc32(cuerpo):
+                    return
+                entrada = json.loads(cuerpo.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                return
+            if entrada["lsn"] <= anterior:
+                return  # lo que sigue no es confiable
+            fin += len(linea)
+            anterior = entrada["lsn"]
+            yield entrada["lsn"], [(archivo, registro) for archivo, registro in entrada["cambios"]], fin
@@ -0,0 +1,291 @@
+"""
+Índice de búsqueda de clientes por nombre, correo y teléfono.
+
+    - Búsqueda por prefijo: "mar gom" encuentra a "María Gómez". Cada
+      palabra de la consulta debe ser el comienzo de alguna palabra del
+      cliente. Usa una lista ordenada de (palabra, id) y búsqueda binaria.
+    - Sin tildes ni mayúsculas: "pena" encuentra a "Peña" y "jose" a "José".
+    - Búsqueda aproximada por trigramas: "santaana rodriges" encuentra a
+      "Santana Rodríguez" cuando no hay coincidencias exactas suficientes.
+      Primero se buscan las palabras parecidas en el vocabulario de nombres
+      y luego los clientes que las usan.
+
+El índice se actualiza con los eventos "cliente_registrado" y
+"cliente_actualizado" que emite `Cliente` (ver eventos.py). Los cambios
+quedan pendientes y se aplican todos juntos en la siguiente búsqueda, así
+que registrar o cargar miles de clientes no paga el costo del índice uno
+por uno.
+"""
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from hotel_sena.eventos import suscribir
+from hotel_sena.metricas import medido
+
+
+_PALABRA = re.compile(r"[^\W_]+")
+
+
+def normalizar(texto) -> str:
+    """Minúsculas y sin tildes: 'Peña Gómez' -> 'pena gomez'."""
+    texto = str(texto)
+    if texto.isascii():
+        return texto.lower()
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+def _palabras(texto: str) -> List[str]:
+    """Palabras alfanuméricas de un texto ya normalizado."""
+    return _PALABRA.findall(texto)
+
+
+def _trigramas(palabra: str) -> Set[str]:
+    marcada = f"${palabra}$"
+    return {marcada[i:i + 3] for i in range(len(marcada) - 2)}
+
+
+class IndiceBusqueda:
+    """Índice en memoria: id del cliente -> palabras de búsqueda."""
+
+    # Las altas van a una lista ordenada chica que se fusiona con la
+    # principal cuando crece más de 1/16 de ella (insertar directamente en
+    # la principal movería cientos de miles de elementos por palabra).
+    MINIMO_RECIENTES = 4096
+
+    def __init__(self, similitud_minima: float = 0.4, sugerencias: int = 5):
+        self.similitud_minima = similitud_minima
+        self.sugerencias = sugerencias
+        self._palabras: Dict[int, Tuple[str, ...]] = {}       # id -> palabras para prefijos
+        self._nombres: Dict[int, Tuple[str, ...]] = {}        # id -> palabras del nombre
+        self._ordenadas: List[Tuple[str, int]] = []           # (palabra, id) ordenadas
+        self._recientes: List[Tuple[str, int]] = []           # altas aún no fusionadas, ordenadas
+        self._vocabulario: Dict[str, Set[int]] = {}           # palabra de nombre -> clientes que la usan
+        self._trigramas: Dict[str, Set[str]] = {}             # trigrama -> palabras del vocabulario
+        self._pendientes: Dict[int, Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]] = {}
+
+    # ----------------------------------------------------------
+    # Mantenimiento
+    # ----------------------------------------------------------
+    @staticmethod
+    def _documento(nombre: str, correo: str, telefono) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        correo = normalizar(correo)
+        nombres = tuple(dict.fromkeys(_palabras(normalizar(nombre))))
+        usuario = _palabras(correo.split("@", 1)[0])
+        # El correo completo y el teléfono solo se buscan por prefijo.
+        palabras = tuple(dict.fromkeys(nombres + tuple(usuario) + (correo, str(telefono).strip())))
+        return palabras, nombres
+
+    def indexar(self, id_cliente: int, nombre: str, correo: str, telefono) -> None:
+        """Agrega o actualiza un cliente (se aplica en la próxima búsqueda)."""
+        documento = self._documento(nombre, correo, telefono)
+        if id_cliente not in self._pendientes and self._palabras.get(id_cliente) == documento[0]:
+            return
+        self._pendientes[id_cliente] = documento
+
+    def quitar(self, id_cliente: int) -> None:
+        self._pendientes[id_cliente] = None
+
+    def al_cambiar_cliente(self, cliente) -> None:
+        """Suscriptor de "cliente_registrado" y "cliente_actualizado" (ver eventos.py)."""
+        self.indexar(cliente.id_cliente, cliente.nombre, cliente.correo, cliente.telefono)
+
+    def reiniciar(self) -> None:
+        self._palabras.clear()
+        self._nombres.clear()
+        self._ordenadas.clear()
+        self._recientes.clear()
+        self._vocabulario.clear()
+        self._trigramas.clear()
+        self._pendientes.clear()
+
+    def __len__(self) -> int:
+        self._aplicar_pendientes()
+        return len(self._palabras)
+
+    def _aplicar_pendientes(self) -> None:
+        if not self._pendientes:
+            return
+        pendientes, self._pendientes = self._pendientes, {}
+        # Muchos cambios de golpe (carga inicial): reconstruir y ordenar una vez.
+        if len(pendientes) > len(self._palabras) // 8:
+            for id_cliente, documento in pendientes.items():
+                if documento is None:
+                    self._palabras.pop(id_cliente, None)
+                    self._nombres.pop(id_cliente, None)
+                else:
+                    self._palabras[id_cliente], self._nombres[id_cliente] = documento
+            self._reconstruir()
+            return
+        for id_cliente, documento in pendientes.items():
+            self._desindexar(id_cliente)
+            if documento is not None:
+                self._indexar(id_cliente, *documento)
+
+    @medido("busqueda.reconstruir")
+    def _reconstruir(self) -> None:
+        self._ordenadas = sorted((p, i) for i, palabras in self._palabras.items() for p in palabras)
+        self._recientes = []
+        self._vocabulario.clear()
+        self._trigramas.clear()
+        for id_cliente, nombres in self._nombres.items():
+            for palabra in nombres:
+                self._usar_palabra(palabra, id_cliente)
+
+    def _usar_palabra(self, palabra: str, id_cliente: int) -> None:
+        clientes = self._vocabulario.get(palabra)
+        if clientes is None:
+            clientes = self._vocabulario[palabra] = set()
+            for t in _trigramas(palabra):
+                self._trigramas.setdefault(t, set()).add(palabra)
+        clientes.add(id_cliente)
+
+    def _soltar_palabra(self, palabra: str, id_cliente: int) -> None:
+        """El vocabulario solo guarda palabras que algún cliente usa."""
+        clientes = self._vocabulario.get(palabra)
+        if clientes is None:
+            return
+        clientes.discard(id_cliente)
+        if not clientes:
+            del self._vocabulario[palabra]
+            for t in _trigramas(palabra):
+                self._trigramas[t].discard(palabra)
+
+    def _indexar(self, id_cliente: int, palabras: Tuple[str, ...], nombres: Tuple[str, ...]) -> None:
+        self._palabras[id_cliente] = palabras
+        self._nombres[id_cliente] = nombres
+        for p in palabras:
+            insort(self._recientes, (p, id_cliente))
+        if len(self._recientes) > max(self.MINIMO_RECIENTES, len(self._ordenadas) // 16):
+            self._ordenadas = sorted(self._ordenadas + self._recientes)  # dos tramos ordenados: O(n)
+            self._recientes = []
+        for p in nombres:
+            self._usar_palabra(p, id_cliente)
+
+    def _desindexar(self, id_cliente: int) -> None:
+        palabras = self._palabras.pop(id_cliente, None)
+        if palabras is None:
+            return
+        for p in palabras:
+            for lista in (self._recientes, self._ordenadas):
+                i = bisect_left(lista, (p, id_cliente))
+                if i < len(lista) and lista[i] == (p, id_cliente):
+                    del lista[i]
+                    break
+        for p in self._nombres.pop(id_cliente):
+            self._soltar_palabra(p, id_cliente)
+
+    # ----------------------------------------------------------
+    # Búsqueda
+    # ----------------------------------------------------------
+    @medido("busqueda.buscar")
+    def buscar(self, consulta: str, limite: int = 10, aproximada: bool = True) -> List[int]:
+        """
+        IDs de los clientes que coinciden con la consulta: primero los que
+        coinciden por prefijo y, si faltan, los de nombre más parecido.
+        """
+        self._aplicar_pendientes()
+        terminos = normalizar(consulta).split()
+        if not terminos or limite < 1:
+            return []
+        encontrados = self._por_prefijo(terminos, limite)
+        if aproximada and len(encontrados) < limite:
+            vistos = set(encontrados)
+            for id_cliente in self._aproximados(_palabras(" ".join(terminos)), limite + len(encontrados)):
+                if id_cliente not in vistos:
+                    encontrados.append(id_cliente)
+                    if len(encontrados) == limite:
+                        break
+        return encontrados
+
+    def _rangos(self, prefijo: str) -> List[Tuple[List, int, int]]:
+        """Tramos (lista, inicio, fin) de las entradas cuya palabra empieza por `prefijo`."""
+        limite = (prefijo + "\U0010ffff",)
+        tramos = []
+        for lista in (self._ordenadas, self._recientes):
+            inicio = bisect_left(lista, (prefijo,))
+            tramos.append((lista, inicio, bisect_left(lista, limite, inicio)))
+        return tramos
+
+    def _ids(self, prefijo: str):
+        for lista, inicio, fin in self._rangos(prefijo):
+            for i in range(inicio, fin):
+                yield lista[i][1]
+
+    def _por_prefijo(self, terminos: List[str], limite: int) -> List[int]:
+        # Se recorre el rango del término más selectivo y se verifican los demás.
+        def tamano(termino: str) -> int:
+            return sum(fin - inicio for _, inicio, fin in self._rangos(termino))
+
+        terminos = sorted(terminos, key=tamano)
+        otros = terminos[1:]
+        encontrados, vistos = [], set()
+        for id_cliente in self._ids(terminos[0]):
+            if id_cliente in vistos:
+                continue
+            vistos.add(id_cliente)
+            palabras = self._palabras[id_cliente]
+            if all(any(p.startswith(t) for p in palabras) for t in otros):
+                encontrados.append(id_cliente)
+                if len(encontrados) == limite:
+                    break
+        return encontrados
+
+    def parecidas(self, termino: str) -> Dict[str, float]:
+        """
+        Palabras de nombres parecidas a `termino` (coeficiente de Dice sobre
+        trigramas), con su similitud. Se busca en el vocabulario de palabras
+        distintas, que es mucho más chico que la cantidad de clientes.
+        """
+        self._aplicar_pendientes()
+        consulta = _trigramas(termino)
+        comunes: Dict[str, int] = {}
+        for t in consulta:
+            for palabra in self._trigramas.get(t, ()):
+                comunes[palabra] = comunes.get(palabra, 0) + 1
+        similitudes = sorted(
+            ((2 * c / (len(consulta) + len(_trigramas(p))), p) for p, c in comunes.items()),
+            reverse=True,
+        )
+        return {p: s for s, p in similitudes[:self.sugerencias] if s >= self.similitud_minima}
+
+    def _aproximados(self, terminos: List[str], limite: int) -> List[int]:
+        """
+        Clientes cuyo nombre tiene, para cada término, una palabra parecida.
+        Se intersectan los conjuntos de clientes de cada término y se
+        recorren empezando por las palabras más parecidas del primero.
+        """
+        opciones = [self.parecidas(t) for t in terminos]
+        if not terminos or not all(opciones):
+            return []
+        candidatos = None  # con un solo término sirve cualquier cliente de sus palabras
+        if len(opciones) > 1:
+            conjuntos = [set().union(*(self._vocabulario[p] for p in o)) for o in opciones]
+            candidatos = set.intersection(*sorted(conjuntos, key=len))
+
+        base = opciones[0]
+        puntajes, vistos = [], set()
+        for palabra in sorted(base, key=base.get, reverse=True):
+            clientes = self._vocabulario[palabra]
+            for id_cliente in (clientes if candidatos is None else clientes & candidatos):
+                if id_cliente in vistos:
+                    continue
+                vistos.add(id_cliente)
+                nombres = self._nombres[id_cliente]
+                puntaje = sum(max(o.get(p, 0.0) for p in nombres) for o in opciones)
+                puntajes.append((-puntaje, id_cliente))
+                if len(puntajes) >= limite:
+                    break
+            if len(puntajes) >= limite:
+                break
+        puntajes.sort()
+        return [id_cliente for _, id_cliente in puntajes]
+
+
+# Índice compartido de clientes, al día con los eventos de `Cliente`
+# (cada ServicioHotel tiene el suyo, conectado a su propio canal).
+indice_clientes = IndiceBusqueda()
+suscribir("cliente_registrado", indice_clientes.al_cambiar_cliente)
+suscribir("cliente_actualizado", indice_clientes.al_cambiar_cliente)
@@ -0,0 +1,207 @@
+"""
+Caché de consultas de disponibilidad y cotizaciones.
+
+Las búsquedas de disponibilidad y las cotizaciones se repiten para las
+mismas fechas una y otra vez (varias terminales, el sitio web). Esta
+caché guarda sus resultados:
+
+    disponibilidad: (ingreso, salida, tipo)          -> habitaciones libres
+    cotización:     (id_habitacion, ingreso, salida) -> precio total
+
+con un máximo de entradas (se desaloja la usada hace más tiempo) y un
+tiempo de vida como red de seguridad.
+
+No se vacía entera ante cada cambio: escucha los eventos del sistema (ver
+eventos.py) y descarta solo las entradas afectadas:
+
+    reserva_registrada / reserva_liberada
+        disponibilidad de ese tipo (y sin tipo) que se cruza con las fechas
+    habitacion_agregada
+        disponibilidad de ese tipo (y sin tipo), cualquier fecha
+    precio_actualizado
+        cotizaciones de esa habitación
+    tarifas_actualizadas
+        cotizaciones del tipo (o de todos) que se cruzan con las noches cambiadas
+    indice_reiniciado
+        todo
+
+El estado de una habitación (reservada, ocupada, disponible) no entra en
+la clave: la disponibilidad es por fechas y los resultados son las mismas
+habitaciones en memoria, así que siempre muestran su estado actual.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from hotel_sena.disponibilidad import a_ordinal
+from hotel_sena.eventos import CanalEventos, canal_global
+from hotel_sena.metricas import contar
+
+_DISPONIBILIDAD = "d"
+_COTIZACION = "c"
+
+
+def _cruza(ingreso: int, salida: int, desde: Optional[int], hasta: Optional[int]) -> bool:
+    """¿El rango [ingreso, salida) toca alguna noche de [desde, hasta)? None = sin límite."""
+    return (desde is None or salida > desde) and (hasta is None or ingreso < hasta)
+
+
+class CacheConsultas:
+    """Caché LRU con tiempo de vida e invalidación por eventos."""
+
+    def __init__(self, capacidad: int = 4096, ttl: float = 300.0, reloj: Callable[[], float] = time.monotonic,
+                 canal: CanalEventos = canal_global):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1.")
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._reloj = reloj
+        # clave -> (vence, valor, grupo); el orden es el de uso (la última es la más reciente)
+        self._entradas: "OrderedDict[Tuple, Tuple[float, object, Tuple]]" = OrderedDict()
+        # índices para invalidar sin recorrer toda la caché
+        self._por_tipo: Dict[Tuple[str, Optional[str]], Dict[Tuple, None]] = {}
+        self._por_habitacion: Dict[int, Dict[Tuple, None]] = {}
+        self._candado = threading.RLock()
+
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidadas = 0
+        self.expiradas = 0
+        self.desalojadas = 0
+
+        self._suscripciones = {
+            "reserva_registrada": self._al_cambiar_reservas,
+            "reserva_liberada": self._al_cambiar_reservas,
+            "habitacion_agregada": self._al_agregar_habitacion,
+            "precio_actualizado": self._al_cambiar_precio,
+            "tarifas_actualizadas": self._al_cambiar_tarifas,
+            "indice_reiniciado": self.limpiar,
+        }
+        self.canal = canal
+        for evento, funcion in self._suscripciones.items():
+            canal.suscribir(evento, funcion)
+
+    def desconectar(self) -> None:
+        """Deja de escuchar los eventos del sistema (para cachés temporales)."""
+        for evento, funcion in self._suscripciones.items():
+            self.canal.desuscribir(evento, funcion)
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def disponibilidad(self, fecha_ingreso, fecha_salida, tipo: Optional[str],
+                       calcular: Callable[[], List]) -> List:
+        """Habitaciones libres guardadas o, si no están, `calcular()` (y se guardan)."""
+        clave_tipo = tipo.strip().lower() if tipo else None
+        clave = (_DISPONIBILIDAD, a_ordinal(fecha_ingreso), a_ordinal(fecha_salida), clave_tipo)
+        return list(self._obtener(clave, calcular, clave_tipo, None))
+
+    def cotizacion(self, habitacion, fecha_ingreso, fecha_salida, calcular: Callable[[], float]) -> float:
+        """Precio total guardado para esa habitación y fechas o, si no está, `calcular()`."""
+        clave = (_COTIZACION, a_ordinal(fecha_ingreso), a_ordinal(fecha_salida), habitacion.id_habitacion)
+        return self._obtener(clave, calcular, habitacion.tipo.strip().lower(), habitacion.id_habitacion)
+
+    def _obtener(self, clave: Tuple, calcular: Callable, clave_tipo: Optional[str],
+                 id_habitacion: Optional[int]):
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                vence, valor, _ = entrada
+                if vence > self._reloj():
+                    self._entradas.move_to_end(clave)
+                    self.aciertos += 1
+                    contar("cache_consultas.aciertos")
+                    return valor
+                self._quitar(clave)
+                self.expiradas += 1
+
+            self.fallos += 1
+            contar("cache_consultas.fallos")
+            valor = calcular()
+            grupo = (clave[0], clave_tipo)
+            self._entradas[clave] = (self._reloj() + self.ttl, valor, grupo)
+            self._por_tipo.setdefault(grupo, {})[clave] = None
+            if id_habitacion is not None:
+                self._por_habitacion.setdefault(id_habitacion, {})[clave] = None
+            while len(self._entradas) > self.capacidad:
+                self._quitar(next(iter(self._entradas)))
+                self.desalojadas += 1
+            return valor
+
+    # ----------------------------------------------------------
+    # Invalidación
+    # ----------------------------------------------------------
+    def _quitar(self, clave: Tuple) -> None:
+        _, _, grupo = self._entradas.pop(clave)
+        claves = self._por_tipo[grupo]
+        del claves[clave]
+        if not claves:
+            del self._por_tipo[grupo]
+        if clave[0] == _COTIZACION:
+            id_habitacion = clave[3]
+            claves = self._por_habitacion[id_habitacion]
+            del claves[clave]
+            if not claves:
+                del self._por_habitacion[id_habitacion]
+
+    def _invalidar(self, claves: List[Hashable]) -> None:
+        for clave in claves:
+            if clave in self._entradas:
+                self._quitar(clave)
+                self.invalidadas += 1
+
+    def _del_grupo(self, tipo_entrada: str, clave_tipo: Optional[str], desde: Optional[int] = None,
+                   hasta: Optional[int] = None) -> List[Tuple]:
+        grupo = self._por_tipo.get((tipo_entrada, clave_tipo), {})
+        return [c for c in grupo if _cruza(c[1], c[2], desde, hasta)]
+
+    def _al_cambiar_reservas(self, habitacion, ingreso: int, salida: int, **_) -> None:
+        clave_tipo = habitacion.tipo.strip().lower()
+        with self._candado:
+            self._invalidar(self._del_grupo(_DISPONIBILIDAD, clave_tipo, ingreso, salida)
+                            + self._del_grupo(_DISPONIBILIDAD, None, ingreso, salida))
+
+    def _al_agregar_habitacion(self, habitacion) -> None:
+        clave_tipo = habitacion.tipo.strip().lower()
+        with self._candado:
+            self._invalidar(self._del_grupo(_DISPONIBILIDAD, clave_tipo) + self._del_grupo(_DISPONIBILIDAD, None))
+
+    def _al_cambiar_precio(self, habitacion, anterior) -> None:
+        with self._candado:
+            self._invalidar(list(self._por_habitacion.get(habitacion.id_habitacion, {})))
+
+    def _al_cambiar_tarifas(self, tipo: Optional[str], desde: Optional[int], hasta: Optional[int]) -> None:
+        with self._candado:
+            if tipo is None:
+                grupos = [k[1] for k in self._por_tipo if k[0] == _COTIZACION]
+            else:
+                grupos = [tipo]
+            claves = []
+            for clave_tipo in grupos:
+                claves.extend(self._del_grupo(_COTIZACION, clave_tipo, desde, hasta))
+            self._invalidar(claves)
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self.invalidadas += len(self._entradas)
+            self._entradas.clear()
+            self._por_tipo.clear()
+            self._por_habitacion.clear()
+
+    # ----------------------------------------------------------
+    # Estadísticas
+    # ----------------------------------------------------------
+    def estadisticas(self) -> Dict[str, float]:
+        with self._candado:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._entradas),
+                "capacidad": self.capacidad,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "invalidadas": self.invalidadas,
+                "expiradas": self.expiradas,
+                "desalojadas": self.desalojadas,
+            }
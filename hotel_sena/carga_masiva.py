@@ -0,0 +1,303 @@
+import csv
+import json
+import os
+import tempfile
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from hotel_sena.Cliente import Cliente
+from hotel_sena.Habitaciones import Habitacion
+from hotel_sena.reservacion import Reservacion
+from hotel_sena.disponibilidad import indice_disponibilidad
+from hotel_sena.eventos import CanalEventos, canal_global
+from hotel_sena.listados import filtrar_clientes, filtrar_habitaciones, filtrar_reservaciones
+
+
+class ResultadoImportacion:
+    """Resumen de una importación: filas importadas y errores por fila."""
+
+    def __init__(self, max_errores: int = 1000):
+        self.importados = 0
+        self.total_errores = 0
+        self.max_errores = max_errores
+        self.errores: List[Tuple[int, str]] = []  # (línea, mensaje), solo los primeros `max_errores`
+
+    def registrar_error(self, linea: int, error: Exception) -> None:
+        self.total_errores += 1
+        if len(self.errores) < self.max_errores:
+            self.errores.append((linea, str(error)))
+
+    def __str__(self) -> str:
+        return f"{self.importados} registros importados, {self.total_errores} filas con error"
+
+
+# ---------------------------------------------------------
+# Lectura y escritura en streaming (CSV / JSONL)
+# ---------------------------------------------------------
+def _formato(ruta: str) -> str:
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato no soportado: '{ruta}' (use .csv o .jsonl).")
+
+
+def leer_filas(ruta: str) -> Iterator[Tuple[int, object]]:
+    """
+    Recorre el archivo fila por fila sin cargarlo completo.
+    Devuelve (número de línea, dict) o (número de línea, excepción) si la fila no se pudo leer.
+    """
+    formato = _formato(ruta)
+    with open(ruta, "r", encoding="utf-8", newline="") as f:
+        if formato == "csv":
+            lector = csv.DictReader(f)
+            for fila in lector:
+                yield lector.line_num, fila
+        else:
+            for numero, linea in enumerate(f, start=1):
+                if not linea.strip():
+                    continue
+                try:
+                    yield numero, json.loads(linea)
+                except json.JSONDecodeError as e:
+                    yield numero, ValueError(f"JSON inválido: {e.msg}")
+
+
+def en_lotes(iterable: Iterable, tamano: int) -> Iterator[List]:
+    """Agrupa un iterable en listas de a lo sumo `tamano` elementos."""
+    it = iter(iterable)
+    while True:
+        lote = list(islice(it, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def exportar(registros: Iterable[Dict], ruta: str) -> int:
+    """Escribe los registros (diccionarios) en CSV o JSONL a medida que llegan."""
+    formato = _formato(ruta)
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+
+    escritos = 0
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        escritor = None
+        for registro in registros:
+            if formato == "csv":
+                if escritor is None:
+                    escritor = csv.DictWriter(f, fieldnames=list(registro))
+                    escritor.writeheader()
+                escritor.writerow(registro)
+            else:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            escritos += 1
+    return escritos
+
+
+# ---------------------------------------------------------
+# Importación genérica por lotes
+# ---------------------------------------------------------
+def _importar(ruta: str, registro, construir: Callable[[Dict], object],
+              confirmar: Callable[[Iterable[Dict]], object], tamano_lote: int, max_errores: int,
+              al_agregar: Callable[[object], None] = None, deshacer: Callable[[object], None] = None,
+              al_confirmar: Callable[[object], None] = None) -> ResultadoImportacion:
+    """
+    Valida cada fila con la clase del modelo (`construir`) y la agrega al registro.
+    Las filas válidas se acumulan en un archivo temporal y se persisten juntas al
+    final con una sola llamada a `confirmar(registros)` (por ejemplo, una entrada
+    de la bitácora del servicio). Si ocurre un error inesperado, se quitan del
+    registro los objetos ya agregados (llamando a `deshacer`) y no se persiste
+    nada. `al_confirmar` se llama para cada objeto una vez persistido.
+    """
+    resultado = ResultadoImportacion(max_errores)
+    agregados = []  # solo IDs, para poder deshacer
+    descriptor, temporal = tempfile.mkstemp(prefix="importando-", suffix=".jsonl")
+
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as pendiente:
+            for lote in en_lotes(leer_filas(ruta), tamano_lote):
+                lineas = []
+                for numero, fila in lote:
+                    try:
+                        if isinstance(fila, Exception):
+                            raise fila
+                        obj = construir(fila)
+                        registro.agregar(obj)
+                    except (ValueError, KeyError, TypeError) as e:
+                        if isinstance(e, KeyError):
+                            e = ValueError(f"Falta la columna {e}.")
+                        resultado.registrar_error(numero, e)
+                        continue
+                    if al_agregar:
+                        al_agregar(obj)
+                    agregados.append(getattr(obj, registro.campo_id))
+                    lineas.append(json.dumps(obj.to_dict(), ensure_ascii=False) + "\n")
+                pendiente.writelines(lineas)
+
+        # Confirmación: una sola escritura
+        if agregados:
+            confirmar(_leer_temporal(temporal))
+    except BaseException:
+        for pk in reversed(agregados):
+            obj = registro.quitar(pk)
+            if obj is not None and deshacer:
+                deshacer(obj)
+        raise
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+    if al_confirmar:
+        for pk in agregados:
+            al_confirmar(registro.obtener(pk))
+    resultado.importados = len(agregados)
+    return resultado
+
+
+def _leer_temporal(ruta: str) -> Iterator[Dict]:
+    with open(ruta, "r", encoding="utf-8") as f:
+        for linea in f:
+            yield json.loads(linea)
+
+
+def _entero_o(valor, por_defecto):
+    return int(valor) if valor not in (None, "") else por_defecto
+
+
+def _id_nuevo(fila: Dict, campo: str, registro) -> int:
+    """
+    El ID de la fila (o el próximo libre si no trae); ValueError si ya está
+    en el registro. El próximo libre no se reserva: `registro.agregar` lo da
+    por usado solo si la fila resulta válida, así no quedan huecos.
+    """
+    pk = _entero_o(fila.get(campo), None)
+    if pk is None:
+        pk = registro.proximo_id()
+    if pk in registro:
+        raise ValueError(f"Ya existe un registro con {campo}={pk}.")
+    return pk
+
+
+# ---------------------------------------------------------
+# Importadores por entidad
+# ---------------------------------------------------------
+# `confirmar` recibe los registros válidos (diccionarios `to_dict`) y los
+# persiste de una vez: ServicioHotel.importar los anota en su bitácora.
+def importar_clientes(ruta: str, clientes, confirmar: Callable[[Iterable[Dict]], object],
+                      tamano_lote: int = 1000, max_errores: int = 1000,
+                      canal: CanalEventos = canal_global) -> ResultadoImportacion:
+    """
+    Columnas: nombre, correo, telefono y opcionalmente id_cliente.
+    "cliente_registrado" se avisa por `canal` solo después de confirmar.
+    """
+    def construir(fila: Dict) -> Cliente:
+        id_cliente = _id_nuevo(fila, "id_cliente", clientes)
+        return Cliente(id_cliente, fila["nombre"], fila["correo"], fila["telefono"], canal=None)
+
+    return _importar(ruta, clientes, construir, confirmar, tamano_lote, max_errores,
+                     al_confirmar=lambda cliente: canal.emitir("cliente_registrado", cliente=cliente))
+
+
+def importar_habitaciones(ruta: str, habitaciones, confirmar: Callable[[Iterable[Dict]], object],
+                          tamano_lote: int = 1000, max_errores: int = 1000,
+                          indice=indice_disponibilidad) -> ResultadoImportacion:
+    """
+    Columnas: tipo, precio y opcionalmente id_habitacion y estado.
+    Las habitaciones entran al índice de disponibilidad después de confirmar.
+    """
+    def construir(fila: Dict) -> Habitacion:
+        id_hab = _id_nuevo(fila, "id_habitacion", habitaciones)
+        tipo = str(fila["tipo"]).strip().capitalize()
+        if not tipo:
+            raise ValueError("El tipo de habitación no puede estar vacío.")
+        habitacion = Habitacion(id_hab, tipo, fila["precio"], fila.get("estado") or "disponible")
+        if habitacion.precio < 0:
+            raise ValueError("El precio no puede ser negativo.")
+        return habitacion
+
+    return _importar(ruta, habitaciones, construir, confirmar, tamano_lote, max_errores,
+                     al_confirmar=indice.agregar_habitacion)
+
+
+def importar_reservaciones(ruta: str, clientes, habitaciones, reservas,
+                           confirmar: Callable[[Iterable[Dict]], object], tamano_lote: int = 1000,
+                           max_errores: int = 1000, indice=indice_disponibilidad) -> ResultadoImportacion:
+    """
+    Columnas: id_cliente, id_habitacion, fecha_ingreso, fecha_salida y
+    opcionalmente id_reserva, precio (por defecto el de la habitación),
+    precio_total (por defecto noches × precio) y estado (activa, pagada,
+    finalizada o cancelada; por defecto activa).
+    """
+    estados = {}  # id_reserva -> estado de su habitación antes de crearla
+
+    def construir(fila: Dict) -> Reservacion:
+        cliente = clientes.obtener(int(fila["id_cliente"]))
+        if cliente is None:
+            raise ValueError(f"Cliente #{fila['id_cliente']} no encontrado.")
+        habitacion = habitaciones.obtener(int(fila["id_habitacion"]))
+        if habitacion is None:
+            raise ValueError(f"Habitación #{fila['id_habitacion']} no encontrada.")
+        id_reserva = _id_nuevo(fila, "id_reserva", reservas)
+        precio = float(fila["precio"]) if fila.get("precio") not in (None, "") else habitacion.precio
+        anterior = habitacion.estado
+        reserva = Reservacion(
+            id_reserva=id_reserva,
+            cliente=cliente,
+            habitacion=habitacion,
+            fecha_ingreso=fila["fecha_ingreso"],
+            fecha_salida=fila["fecha_salida"],
+            precio=precio,
+            estado=fila.get("estado") or "activa",
+            precio_total=float(fila["precio_total"]) if fila.get("precio_total") not in (None, "") else None,
+            indice=indice,
+        )
+        estados[id_reserva] = anterior
+        return reserva
+
+    def al_agregar(reserva: Reservacion) -> None:
+        reserva.cliente.registrar_reserva(reserva.id_reserva, mostrar=False)
+
+    def deshacer(reserva: Reservacion) -> None:
+        if reserva.id_reserva in reserva.cliente.reservas:
+            reserva.cliente.reservas.remove(reserva.id_reserva)
+        indice.liberar(
+            reserva.habitacion.id_habitacion, reserva.ingreso, reserva.salida, reserva.id_reserva
+        )
+        # Se deshacen en orden inverso: la habitación queda como antes de la primera.
+        reserva.habitacion.estado = estados[reserva.id_reserva]
+
+    return _importar(ruta, reservas, construir, confirmar, tamano_lote, max_errores,
+                     al_agregar=al_agregar, deshacer=deshacer)
+
+
+# ---------------------------------------------------------
+# Exportadores por entidad
+# ---------------------------------------------------------
+def fila_reserva(reserva: Reservacion) -> Dict:
+    """Fila plana de una reservación con las mismas columnas que acepta el importador."""
+    return {
+        "id_reserva": reserva.id_reserva,
+        "id_cliente": reserva.cliente.id_cliente,
+        "id_habitacion": reserva.habitacion.id_habitacion,
+        "fecha_ingreso": reserva.fecha_ingreso.strftime("%Y-%m-%d"),
+        "fecha_salida": reserva.fecha_salida.strftime("%Y-%m-%d"),
+        "precio": reserva.precio,
+        "precio_total": reserva.calcular_precio_total(),
+        "estado": reserva.estado,
+    }
+
+
+# Los exportadores aceptan los mismos filtros y claves de orden que los
+# listados del menú (ver listados.py), p. ej. estado="activa", desde=..., orden="ingreso".
+def exportar_clientes(clientes: Iterable[Cliente], ruta: str, **filtros) -> int:
+    return exportar((c.to_dict() for c in filtrar_clientes(clientes, **filtros)), ruta)
+
+
+def exportar_habitaciones(habitaciones: Iterable[Habitacion], ruta: str, **filtros) -> int:
+    return exportar((h.to_dict() for h in filtrar_habitaciones(habitaciones, **filtros)), ruta)
+
+
+def exportar_reservaciones(reservas: Iterable[Reservacion], ruta: str, **filtros) -> int:
+    return exportar((fila_reserva(r) for r in filtrar_reservaciones(reservas, **filtros)), ruta)
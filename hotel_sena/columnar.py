@@ -0,0 +1,166 @@
+import struct
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+ESTADOS = ["activa", "cancelada"]
+
+
+class TablaReservasColumnar:
+    """
+    Tabla de reservaciones en columnas (`array.array`) para reportes sobre
+    millones de estadías históricas.
+
+    Cada reservación ocupa 39 bytes repartidos en arreglos tipados, frente a
+    varios cientos de bytes de un objeto `Reservacion` con sus diccionarios.
+    Los textos que se repiten (tipo de habitación, estado) se guardan como
+    códigos pequeños apuntando a una tabla de valores.
+    """
+
+    # nombre de la columna -> código de tipo de `array`
+    COLUMNAS = {
+        "id_reserva": "q",
+        "id_cliente": "q",
+        "id_habitacion": "i",
+        "ingreso": "i",   # ordinal del día
+        "salida": "i",    # ordinal del día (exclusivo)
+        "precio": "d",    # precio promedio por noche (total cotizado / noches)
+        "tipo": "h",      # código en `self.tipos`
+        "estado": "b",    # código en `self.estados`
+    }
+
+    _CABECERA = struct.Struct("<4sIq")  # firma, versión, cantidad de filas
+    _FIRMA = b"HSRC"
+
+    def __init__(self):
+        for nombre, codigo in self.COLUMNAS.items():
+            setattr(self, nombre, array(codigo))
+        self.tipos: List[str] = []
+        self.estados: List[str] = list(ESTADOS)
+        self._codigo_tipo: Dict[str, int] = {}
+        self._codigo_estado: Dict[str, int] = {e: i for i, e in enumerate(self.estados)}
+        self._ordenada = True  # los IDs se agregan en orden creciente
+
+    # ----------------------------------------------------------
+    # Carga
+    # ----------------------------------------------------------
+    def _codigo(self, valor: str, tabla: List[str], codigos: Dict[str, int]) -> int:
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(tabla)
+            tabla.append(valor)
+        return codigo
+
+    def agregar_fila(self, id_reserva: int, id_cliente: int, id_habitacion: int, ingreso: int,
+                     salida: int, precio: float, tipo: str, estado: str) -> None:
+        if self._ordenada and self.id_reserva and id_reserva <= self.id_reserva[-1]:
+            self._ordenada = False
+        self.id_reserva.append(id_reserva)
+        self.id_cliente.append(id_cliente)
+        self.id_habitacion.append(id_habitacion)
+        self.ingreso.append(ingreso)
+        self.salida.append(salida)
+        self.precio.append(precio)
+        self.tipo.append(self._codigo(tipo, self.tipos, self._codigo_tipo))
+        self.estado.append(self._codigo(estado, self.estados, self._codigo_estado))
+
+    def agregar(self, reserva) -> None:
+        """Agrega un objeto `Reservacion`."""
+        self.agregar_fila(reserva.id_reserva, reserva.cliente.id_cliente, reserva.habitacion.id_habitacion,
+                          reserva.ingreso, reserva.salida, reserva.calcular_precio_total() / reserva.noches,
+                          reserva.habitacion.tipo, reserva.estado)
+
+    def agregar_registro(self, registro: Dict, tipo: str) -> None:
+        """Agrega un registro persistido (`Reservacion.to_dict`) sin construir el objeto."""
+        ingreso = date.fromisoformat(registro["Ingreso"]).toordinal()
+        salida = date.fromisoformat(registro["Salida"]).toordinal()
+        total = registro.get("Precio total")
+        precio = total / (salida - ingreso) if total is not None else registro["Precio por día"]
+        self.agregar_fila(registro["ID"], registro.get("ID Cliente") or 0, registro["Habitación"],
+                          ingreso, salida, precio, tipo, registro["Estado"].lower())
+
+    @classmethod
+    def desde_reservas(cls, reservas: Iterable) -> "TablaReservasColumnar":
+        tabla = cls()
+        for reserva in reservas:
+            tabla.agregar(reserva)
+        return tabla
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.id_reserva)
+
+    def posicion(self, id_reserva: int) -> Optional[int]:
+        """Fila de una reservación (búsqueda binaria si los IDs están en orden)."""
+        if self._ordenada:
+            i = bisect_left(self.id_reserva, id_reserva)
+            return i if i < len(self.id_reserva) and self.id_reserva[i] == id_reserva else None
+        try:
+            return self.id_reserva.index(id_reserva)
+        except ValueError:
+            return None
+
+    def fila(self, i: int) -> Dict:
+        return {
+            "id_reserva": self.id_reserva[i],
+            "id_cliente": self.id_cliente[i],
+            "id_habitacion": self.id_habitacion[i],
+            "fecha_ingreso": date.fromordinal(self.ingreso[i]).isoformat(),
+            "fecha_salida": date.fromordinal(self.salida[i]).isoformat(),
+            "precio": self.precio[i],
+            "tipo": self.tipos[self.tipo[i]],
+            "estado": self.estados[self.estado[i]],
+        }
+
+    def filas(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self.fila(i)
+
+    def actualizar_estado(self, id_reserva: int, estado: str) -> bool:
+        i = self.posicion(id_reserva)
+        if i is None:
+            return False
+        self.estado[i] = self._codigo(estado, self.estados, self._codigo_estado)
+        return True
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados por los datos de las columnas."""
+        return sum(len(col) * col.itemsize for col in (getattr(self, n) for n in self.COLUMNAS))
+
+    # ----------------------------------------------------------
+    # Archivo binario
+    # ----------------------------------------------------------
+    def guardar(self, ruta: str) -> None:
+        """Guarda la tabla en binario: cabecera + tablas de códigos + columnas seguidas."""
+        with open(ruta, "wb") as f:
+            f.write(self._CABECERA.pack(self._FIRMA, 1, len(self)))
+            for valores in (self.tipos, self.estados):
+                texto = "\n".join(valores).encode("utf-8")
+                f.write(struct.pack("<I", len(texto)) + texto)
+            for nombre in self.COLUMNAS:
+                getattr(self, nombre).tofile(f)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "TablaReservasColumnar":
+        tabla = cls()
+        with open(ruta, "rb") as f:
+            firma, _version, filas = cls._CABECERA.unpack(f.read(cls._CABECERA.size))
+            if firma != cls._FIRMA:
+                raise ValueError(f"'{ruta}' no es una tabla de reservaciones.")
+            listas = []
+            for _ in range(2):
+                (largo,) = struct.unpack("<I", f.read(4))
+                texto = f.read(largo).decode("utf-8")
+                listas.append(texto.split("\n") if texto else [])
+            tabla.tipos, tabla.estados = listas
+            tabla._codigo_tipo = {t: i for i, t in enumerate(tabla.tipos)}
+            tabla._codigo_estado = {e: i for i, e in enumerate(tabla.estados)}
+            for nombre in cls.COLUMNAS:
+                getattr(tabla, nombre).fromfile(f, filas)
+        ids = tabla.id_reserva
+        tabla._ordenada = all(ids[i] < ids[i + 1] for i in range(len(ids) - 1))
+        return tabla
@@ -0,0 +1,173 @@
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from hotel_sena.eventos import CanalEventos, canal_global
+
+
+def a_ordinal(fecha) -> int:
+    """Convierte 'YYYY-MM-DD', date o datetime al ordinal del día."""
+    if isinstance(fecha, int):
+        return fecha
+    if isinstance(fecha, date):  # incluye datetime
+        return fecha.toordinal()
+    if len(fecha) == 10 and fecha[4] == "-" and fecha[7] == "-":
+        try:
+            return date.fromisoformat(fecha).toordinal()  # mucho más rápido que strptime
+        except ValueError:
+            pass
+    return datetime.strptime(fecha, "%Y-%m-%d").toordinal()
+
+
+class IndiceDisponibilidad:
+    """
+    Índice de disponibilidad por rango de fechas.
+
+    Cada habitación guarda una lista de reservas activas ordenada por fecha
+    de ingreso: [(ingreso, salida, id_reserva), ...] con fechas como ordinales
+    y salida exclusiva (la noche de salida no se cobra ni se ocupa). Como las
+    reservas de una misma habitación nunca se solapan, la lista también queda
+    ordenada por salida y basta una búsqueda binaria para saber si un rango
+    está libre: O(log reservas) por habitación.
+
+    Los cambios se avisan por `canal` (ver eventos.py) a las cachés y al
+    motor de tarifas que trabajan sobre este índice.
+    """
+
+    def __init__(self, canal: CanalEventos = canal_global):
+        self.canal = canal
+        self._habitaciones: Dict[int, object] = {}
+        self._por_tipo: Dict[str, List[int]] = {}
+        self._reservas: Dict[int, List[Tuple[int, int, int]]] = {}
+
+    # ----------------------------------------------------------
+    # Habitaciones
+    # ----------------------------------------------------------
+    def agregar_habitacion(self, habitacion) -> None:
+        """
+        Registra una habitación en el índice (si no estaba ya). Lanza
+        ValueError si ya hay otra habitación con el mismo ID.
+        """
+        registrada = self._habitaciones.get(habitacion.id_habitacion)
+        if registrada is habitacion:
+            return
+        if registrada is not None:
+            raise ValueError(f"Ya hay otra habitación con el ID {habitacion.id_habitacion} en el índice.")
+        self._habitaciones[habitacion.id_habitacion] = habitacion
+        self._por_tipo.setdefault(_clave_tipo(habitacion.tipo), []).append(habitacion.id_habitacion)
+        self._reservas[habitacion.id_habitacion] = []
+        self.canal.emitir("habitacion_agregada", habitacion=habitacion)
+
+    def reiniciar(self) -> None:
+        """Vacía el índice (habitaciones y reservas)."""
+        self._habitaciones.clear()
+        self._por_tipo.clear()
+        self._reservas.clear()
+        self.canal.emitir("indice_reiniciado")
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def esta_libre(self, id_habitacion: int, fecha_ingreso, fecha_salida) -> bool:
+        """Devuelve True si la habitación no tiene reservas que se crucen con el rango."""
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        reservas = self._reservas.get(id_habitacion)
+        if not reservas:
+            return True
+        # Última reserva que empieza antes de `salida`: es la única que puede cruzarse.
+        i = bisect_left(reservas, (salida,))
+        return i == 0 or reservas[i - 1][1] <= ingreso
+
+    def habitaciones_disponibles(self, fecha_ingreso, fecha_salida, tipo: Optional[str] = None) -> List:
+        """Habitaciones (del tipo indicado, si se da) libres entre ingreso y salida."""
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        if salida <= ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+        if tipo is None:
+            ids = self._habitaciones.keys()
+        else:
+            ids = self._por_tipo.get(_clave_tipo(tipo), [])
+        return [self._habitaciones[i] for i in ids if self.esta_libre(i, ingreso, salida)]
+
+    def habitaciones_de_tipo(self, tipo: str) -> List:
+        """Habitaciones registradas de un tipo (sin distinguir mayúsculas)."""
+        return [self._habitaciones[i] for i in self._por_tipo.get(_clave_tipo(tipo), [])]
+
+    def reservas_de(self, id_habitacion: int) -> List[Tuple[int, int, int]]:
+        """Reservas activas de una habitación como (ingreso, salida, id_reserva)."""
+        return list(self._reservas.get(id_habitacion, []))
+
+    def estado_segun_reservas(self, habitacion) -> str:
+        """
+        Estado que le corresponde a la habitación: "ocupada" no cambia (hay un
+        huésped adentro); si no, "reservada" si tiene reservas activas y
+        "disponible" si no tiene ninguna.
+        """
+        if habitacion.estado == "ocupada":
+            return "ocupada"
+        return "reservada" if self._reservas.get(habitacion.id_habitacion) else "disponible"
+
+    def reservas_en(self, id_habitacion: int, fecha_ingreso, fecha_salida) -> List[Tuple[int, int, int]]:
+        """Reservas de la habitación que se cruzan con el rango, como (ingreso, salida, id_reserva)."""
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        reservas = self._reservas.get(id_habitacion, [])
+        fin = bisect_left(reservas, (salida,))
+        inicio = fin
+        while inicio > 0 and reservas[inicio - 1][1] > ingreso:
+            inicio -= 1
+        return reservas[inicio:fin]
+
+    def hueco(self, id_habitacion: int, fecha_ingreso, fecha_salida) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Hueco libre de la habitación que contiene el rango (que debe estar
+        libre): (salida de la reserva anterior, ingreso de la siguiente),
+        con None si no hay reserva de ese lado.
+        """
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        reservas = self._reservas.get(id_habitacion, [])
+        i = bisect_left(reservas, (salida,))
+        anterior = reservas[i - 1][1] if i > 0 else None
+        siguiente = reservas[i][0] if i < len(reservas) else None
+        if anterior is not None and anterior > ingreso:
+            raise ValueError(f"La habitación #{id_habitacion} no está libre en esas fechas.")
+        return anterior, siguiente
+
+    # ----------------------------------------------------------
+    # Mantenimiento (lo llaman Reservacion.__init__ y Reservacion.cancelar)
+    # ----------------------------------------------------------
+    def registrar(self, habitacion, fecha_ingreso, fecha_salida, id_reserva: int) -> None:
+        """Bloquea el rango para la habitación. Lanza ValueError si ya está ocupado."""
+        self.agregar_habitacion(habitacion)
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        if not self.esta_libre(habitacion.id_habitacion, ingreso, salida):
+            raise ValueError(
+                f"La habitación #{habitacion.id_habitacion} ya está reservada en esas fechas."
+            )
+        insort(self._reservas[habitacion.id_habitacion], (ingreso, salida, id_reserva))
+        self.canal.emitir("reserva_registrada", habitacion=habitacion, ingreso=ingreso, salida=salida,
+                          id_reserva=id_reserva)
+
+    def liberar(self, id_habitacion: int, fecha_ingreso, fecha_salida, id_reserva: int) -> None:
+        """Quita la reserva del índice (no falla si no estaba)."""
+        reservas = self._reservas.get(id_habitacion)
+        if not reservas:
+            return
+        entrada = (a_ordinal(fecha_ingreso), a_ordinal(fecha_salida), id_reserva)
+        i = bisect_left(reservas, entrada)
+        if i < len(reservas) and reservas[i] == entrada:
+            del reservas[i]
+            self.canal.emitir("reserva_liberada", habitacion=self._habitaciones[id_habitacion],
+                              ingreso=entrada[0], salida=entrada[1], id_reserva=id_reserva)
+
+
+def _clave_tipo(tipo: str) -> str:
+    return tipo.strip().lower()
+
+
+# Índice compartido por los módulos del sistema (cada ServicioHotel tiene el suyo).
+indice_disponibilidad = IndiceDisponibilidad()
+
+
+def habitaciones_disponibles(fecha_ingreso, fecha_salida, tipo: Optional[str] = None) -> List:
+    """Consulta el índice compartido: habitaciones libres entre dos fechas."""
+    return indice_disponibilidad.habitaciones_disponibles(fecha_ingreso, fecha_salida, tipo)
@@ -0,0 +1,62 @@
+"""
+Avisos entre módulos del sistema (publicar / suscribir, en el mismo proceso).
+
+Los módulos del modelo emiten eventos cuando cambia algo que otros
+guardan en caché, sin tener que importarlos:
+
+    habitacion_agregada   (habitacion)
+    precio_actualizado    (habitacion, anterior)
+    reserva_registrada    (habitacion, ingreso, salida, id_reserva)
+    reserva_liberada      (habitacion, ingreso, salida, id_reserva)
+    indice_reiniciado     ()
+    cliente_registrado    (cliente)
+    cliente_actualizado   (cliente)
+    tarifas_actualizadas  (tipo, desde, hasta)   None = todos los tipos / sin límite
+
+Las fechas van como ordinales. Los suscriptores se llaman en orden de
+suscripción y en el hilo de quien emite el evento.
+"""
+from typing import Callable, Dict, List
+
+
+class CanalEventos:
+    """
+    Suscriptores de un grupo de objetos que se avisan entre sí. Cada
+    `ServicioHotel` tiene el suyo, así que dos servicios en el mismo proceso
+    no se invalidan las cachés ni se programan reservas entre ellos.
+    """
+
+    def __init__(self):
+        self._suscriptores: Dict[str, List[Callable]] = {}
+
+    def suscribir(self, evento: str, funcion: Callable) -> None:
+        """Llama a `funcion(**datos)` cada vez que se emita `evento`."""
+        self._suscriptores.setdefault(evento, []).append(funcion)
+
+    def desuscribir(self, evento: str, funcion: Callable) -> None:
+        """Deja de avisar a `funcion` (no falla si no estaba suscrita)."""
+        funciones = self._suscriptores.get(evento, [])
+        if funcion in funciones:
+            funciones.remove(funcion)
+
+    def emitir(self, evento: str, **datos) -> None:
+        for funcion in self._suscriptores.get(evento, ()):
+            funcion(**datos)
+
+
+# Canal del proceso: el de los índices compartidos (indice_disponibilidad,
+# motor_tarifas, indice_clientes) y de los objetos creados sin servicio.
+canal_global = CanalEventos()
+
+
+def suscribir(evento: str, funcion: Callable) -> None:
+    """Suscribe `funcion` en el canal del proceso."""
+    canal_global.suscribir(evento, funcion)
+
+
+def desuscribir(evento: str, funcion: Callable) -> None:
+    canal_global.desuscribir(evento, funcion)
+
+
+def emitir(evento: str, **datos) -> None:
+    canal_global.emitir(evento, **datos)
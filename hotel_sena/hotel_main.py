@@ -0,0 +1,163 @@
+"""
+Punto de entrada del Hotel Sena.
+
+    hotel-sena                          menú de consola (igual que `python -m hotel_sena.Hotel_Sena`)
+    hotel-sena servidor [--puerto ...]  servidor HTTP/JSON (ver servidor_http.py)
+    hotel-sena llegadas [--fecha F]     huéspedes que llegan ese día (por defecto hoy)
+    hotel-sena salidas [--fecha F]      huéspedes que se van ese día
+    hotel-sena importar ENTIDAD RUTA    clientes, habitaciones o reservaciones desde .csv/.jsonl
+    hotel-sena exportar ENTIDAD RUTA    los mismos, con filtros opcionales (--estado, --desde, ...)
+
+También funciona como `python -m hotel_sena ...`.
+
+Cada orden importa solo lo que usa. `llegadas` y `salidas` no cargan el
+modelo ni arman índices: recorren en flujo el archivo de reservaciones y
+la parte de la bitácora que aún no llegó a él, sin modificar nada, así
+que responden en decenas de milisegundos y se pueden usar con el
+servidor andando. `importar` y `exportar` sí cargan el sistema y pasan por
+ServicioHotel (candado y bitácora), así que van con el servidor detenido.
+
+Con la variable de entorno HOTEL_ALMACEN=sqlite los archivos de datos se
+guardan en `data/hotel_sena.db` (ver almacen_sqlite.py) en lugar de los
+diarios JSON.
+"""
+import argparse
+import os
+import sys
+from datetime import date
+from itertools import chain
+from typing import Dict, List
+
+# Estados de las reservaciones que ocupan sus noches (ver Reservacion.VIGENTES);
+# repetido aquí para no importar el modelo.
+_VIGENTES = ("activa", "pagada")
+
+
+def reservas_del_dia(directorio: str, fecha: str, campo: str = "Ingreso") -> List[Dict]:
+    """
+    Reservaciones vigentes cuyo `campo` ("Ingreso" o "Salida") es `fecha`,
+    según la última versión de cada una, ordenadas por habitación.
+    """
+    from hotel_sena.almacenamiento import obtener_almacen
+    from hotel_sena.bitacora import Bitacora
+
+    # Lo que falta aplicar de la bitácora es más nuevo que los archivos de
+    # datos: se lee antes (por si el servidor hace un punto de control
+    # mientras tanto) y se aplica después.
+    recientes = [r for archivo, r in Bitacora(directorio).sin_aplicar() if archivo == "reservas.json"]
+    # Tras la salida la reservación queda "finalizada", pero sigue siendo una salida de ese día.
+    estados = _VIGENTES if campo == "Ingreso" else _VIGENTES + ("finalizada",)
+    elegidas: Dict[int, Dict] = {}
+    # Las fechas de una reservación no cambian entre versiones, así que
+    # todas sus versiones contienen `fecha` y el filtro de texto es seguro.
+    almacen = obtener_almacen(os.path.join(directorio, "reservas.json"))
+    for registro in chain(almacen.leer(contiene=fecha), recientes):
+        if registro.get(campo) == fecha and str(registro.get("Estado", "")).lower() in estados:
+            elegidas[registro["ID"]] = registro
+        else:
+            elegidas.pop(registro.get("ID"), None)  # una versión posterior la cambió
+    return sorted(elegidas.values(), key=lambda r: (r["Habitación"], r["ID"]))
+
+
+def _listar_dia(args, campo: str) -> int:
+    try:
+        fecha = date.fromisoformat(args.fecha).isoformat() if args.fecha else date.today().isoformat()
+    except ValueError:
+        print("Formato o valor de fecha inválido. Ejemplo correcto: 2025-10-02")
+        return 2
+    reservas = reservas_del_dia(args.datos, fecha, campo)
+    titulo = "Llegadas" if campo == "Ingreso" else "Salidas"
+    print(f"{titulo} del {fecha}: {len(reservas)}")
+    for r in reservas:
+        print(f"  Habitación {r['Habitación']:>4} | Reservación #{r['ID']:<6} | {r['Cliente']} "
+              f"| {r['Ingreso']} -> {r['Salida']} | {r['Estado']}")
+    return 0
+
+
+# Opciones de `exportar` que se pasan como filtros (ver listados.py)
+_FILTROS = ("texto", "tipo", "estado", "desde", "hasta", "orden")
+
+
+def _importar(args) -> int:
+    from hotel_sena.servicio import ServicioHotel
+
+    servicio = ServicioHotel(args.datos)
+    servicio.cargar()
+    try:
+        resultado = servicio.importar(args.entidad, args.ruta)
+    except (OSError, ValueError) as e:
+        print(f"No se pudo importar: {e}")
+        return 1
+    finally:
+        servicio.cerrar()
+    print(f"{args.entidad.capitalize()}: {resultado}")
+    for linea, mensaje in resultado.errores:
+        print(f"  Línea {linea}: {mensaje}")
+    return 0
+
+
+def _exportar(args) -> int:
+    from hotel_sena.servicio import ServicioHotel
+
+    filtros = {f: getattr(args, "filtro_" + f) for f in _FILTROS if getattr(args, "filtro_" + f) is not None}
+    servicio = ServicioHotel(args.datos)
+    servicio.cargar()
+    try:
+        escritos = servicio.exportar(args.entidad, args.ruta, **filtros)
+    except TypeError:
+        print(f"Filtro no válido para {args.entidad}: {', '.join(filtros)}")
+        return 2
+    except (OSError, ValueError) as e:
+        print(f"No se pudo exportar: {e}")
+        return 1
+    finally:
+        servicio.cerrar()
+    print(f"{escritos} {args.entidad} exportados a {args.ruta}")
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if os.environ.get("HOTEL_ALMACEN") == "sqlite":
+        from hotel_sena.almacen_sqlite import AlmacenSQLite
+        from hotel_sena.almacenamiento import configurar_almacenamiento
+        configurar_almacenamiento(AlmacenSQLite)
+    if argv and argv[0] == "servidor":
+        from hotel_sena.servidor_http import main as servidor
+        servidor(argv[1:])
+        return 0
+
+    parser = argparse.ArgumentParser(prog="hotel-sena", description="Sistema de gestión del Hotel Sena.")
+    ordenes = parser.add_subparsers(dest="orden")
+    ordenes.add_parser("menu", help="Menú de consola (por defecto)")
+    ordenes.add_parser("servidor", help="Servidor HTTP/JSON (acepta las opciones de servidor_http.py)")
+    for orden, ayuda in (("llegadas", "Huéspedes que llegan ese día"), ("salidas", "Huéspedes que se van ese día")):
+        sub = ordenes.add_parser(orden, help=ayuda)
+        sub.add_argument("--fecha", help="YYYY-MM-DD (por defecto, hoy)")
+        sub.add_argument("--datos", default="data", help="Directorio de los archivos de datos")
+    for orden, ayuda in (("importar", "Importa registros desde un archivo .csv o .jsonl"),
+                         ("exportar", "Exporta registros a un archivo .csv o .jsonl")):
+        sub = ordenes.add_parser(orden, help=ayuda)
+        sub.add_argument("entidad", choices=("clientes", "habitaciones", "reservaciones"))
+        sub.add_argument("ruta", help="Archivo .csv o .jsonl")
+        sub.add_argument("--datos", default="data", help="Directorio de los archivos de datos")
+        if orden == "exportar":
+            for filtro in _FILTROS:
+                sub.add_argument(f"--{filtro}", dest="filtro_" + filtro)
+    args = parser.parse_args(argv)
+
+    if args.orden == "llegadas":
+        return _listar_dia(args, "Ingreso")
+    if args.orden == "salidas":
+        return _listar_dia(args, "Salida")
+    if args.orden == "importar":
+        return _importar(args)
+    if args.orden == "exportar":
+        return _exportar(args)
+    from hotel_sena.Hotel_Sena import main as menu
+    menu()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
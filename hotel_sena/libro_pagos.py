@@ -0,0 +1,96 @@
+"""
+Libro de pagos: cada intento de cobro y cada cambio de estado de un pago.
+
+`ServicioHotel` anota un movimiento cuando un pago se registra
+("pendiente", antes de llamar a la pasarela) y otro cuando la pasarela
+responde ("aprobado", "fallido" o "rechazado"). Los movimientos viajan en
+la misma entrada de la bitácora que el pago y la reservación, así que se
+guardan o se pierden juntos, y llegan a `libro_pagos.json` en lotes en
+cada punto de control (ver bitacora.py). El libro no se carga en memoria:
+solo lo recorre la conciliación.
+
+Un pago pasa por cada estado una sola vez, así que (ID Pago, Estado)
+identifica al movimiento; si la recuperación de la bitácora reaplica un
+lote, los repetidos no cambian el resultado.
+
+`conciliar` recorre el libro una vez y las reservaciones una vez e informa:
+
+    sin_pagar         reservaciones vigentes o terminadas sin ningún intento de pago
+    fallidas          con intentos, pero ninguno aprobado (incluye cobros que
+                      quedaron "pendiente" por una caída a mitad de camino)
+    pago_doble        con más de un pago aprobado
+    canceladas_pagas  canceladas que tienen un pago aprobado (hay que devolverlo)
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+
+class MovimientoPago:
+    """Foto de un pago en el momento de un cambio de estado."""
+
+    __slots__ = ("id_pago", "id_reserva", "clave", "estado", "monto", "metodo_pago", "registrado")
+
+    def __init__(self, pago):
+        self.id_pago = pago.id_pago
+        self.id_reserva = pago.id_reserva
+        self.clave = pago.clave
+        self.estado = pago.estado
+        self.monto = pago.monto
+        self.metodo_pago = pago.metodo_pago
+        self.registrado = datetime.now().isoformat(timespec="seconds")
+
+    def to_dict(self) -> Dict:
+        return {
+            "ID Pago": self.id_pago,
+            "ID Reserva": self.id_reserva,
+            "Clave": self.clave,
+            "Estado": self.estado,
+            "Monto": self.monto,
+            "Método": self.metodo_pago,
+            "Registrado": self.registrado,
+        }
+
+
+def conciliar(movimientos: Iterable[Dict], reservas: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Cruza el libro de pagos (registros de `MovimientoPago.to_dict`) con las
+    reservaciones (registros de `Reservacion.to_dict`). Cada fila trae
+    id_reserva, estado, total, pagado, aprobados e intentos.
+    """
+    # 1. Último estado de cada pago (el libro está en orden de escritura)
+    pagos: Dict[int, tuple] = {}
+    for movimiento in movimientos:
+        pagos[movimiento["ID Pago"]] = (movimiento["ID Reserva"], movimiento["Estado"], movimiento["Monto"])
+
+    # 2. Totales por reservación: [intentos, aprobados, monto aprobado]
+    por_reserva: Dict[int, List] = {}
+    for id_reserva, estado, monto in pagos.values():
+        if id_reserva is None:
+            continue
+        totales = por_reserva.setdefault(id_reserva, [0, 0, 0.0])
+        totales[0] += 1
+        if estado == "aprobado":
+            totales[1] += 1
+            totales[2] += monto
+
+    # 3. Una pasada por las reservaciones
+    informe = {"sin_pagar": [], "fallidas": [], "pago_doble": [], "canceladas_pagas": []}
+    for reserva in reservas:
+        intentos, aprobados, pagado = por_reserva.get(reserva["ID"], (0, 0, 0.0))
+        estado = reserva["Estado"].lower()
+        fila = {
+            "id_reserva": reserva["ID"],
+            "estado": estado,
+            "total": reserva.get("Precio total"),
+            "pagado": pagado,
+            "aprobados": aprobados,
+            "intentos": intentos,
+        }
+        if estado == "cancelada":
+            if aprobados:
+                informe["canceladas_pagas"].append(fila)
+        elif aprobados > 1:
+            informe["pago_doble"].append(fila)
+        elif not aprobados:
+            informe["fallidas" if intentos else "sin_pagar"].append(fila)
+    return informe
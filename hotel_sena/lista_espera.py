@@ -0,0 +1,210 @@
+"""
+Lista de espera con cupo de prioridad por tipo de habitación.
+
+Cuando no hay una habitación del tipo pedido libre en esas fechas (ni
+siquiera moviendo otras reservaciones, ver `ServicioHotel.solicitar_habitacion`),
+la solicitud queda anotada aquí:
+
+    "prioritaria"  se atiende antes que las demás cuando se libera lugar.
+                   Cada tipo admite hasta `prioridad[tipo]` solicitudes así
+                   por noche (0 si no se configuró).
+    "espera"       se atiende si se libera lugar y no hay una prioritaria
+                   que lo llene.
+
+Ninguna de las dos es una reservación: no ocupa noches ni se cuenta en la
+disponibilidad, y el hotel nunca acepta más reservaciones que habitaciones
+(no hay sobreventa). El cupo solo limita cuántas solicitudes por noche se
+le pueden prometer al cliente como las primeras de la fila.
+
+Las solicitudes pendientes de cada tipo se guardan ordenadas por fecha de
+ingreso. Cuando una cancelación deja libre un hueco [desde, hasta) en una
+habitación, `mejor` busca con bisect solo las solicitudes que empiezan
+dentro del hueco y elige la que mejor lo llena: primero las prioritarias,
+luego la estadía más larga, luego la más antigua.
+
+Después pasan a "asignada" (con su reservación), "retirada" o "vencida"
+(su fecha de ingreso pasó sin lugar).
+"""
+import json
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from hotel_sena.registro import AsignadorIds
+
+PENDIENTES = ("prioritaria", "espera")
+
+
+def _clave_tipo(tipo: str) -> str:
+    return tipo.strip().lower()
+
+
+class SolicitudEspera:
+    """Pedido de una habitación de un tipo para un rango de fechas (ordinales)."""
+
+    __slots__ = ("id_espera", "id_cliente", "tipo", "ingreso", "salida", "estado", "creada", "id_reserva")
+
+    def __init__(self, id_espera: int, id_cliente: int, tipo: str, ingreso: int, salida: int,
+                 estado: str = "espera", creada: str = None, id_reserva: int = None):
+        self.id_espera = id_espera
+        self.id_cliente = id_cliente
+        self.tipo = tipo
+        self.ingreso = ingreso
+        self.salida = salida
+        self.estado = estado
+        self.creada = creada or datetime.now().isoformat(timespec="seconds")
+        self.id_reserva = id_reserva
+
+    @property
+    def noches(self) -> int:
+        return self.salida - self.ingreso
+
+    @classmethod
+    def desde_registro(cls, registro: Dict) -> "SolicitudEspera":
+        return cls(
+            registro["ID Espera"], registro["ID Cliente"], registro["Tipo"],
+            datetime.strptime(registro["Ingreso"], "%Y-%m-%d").toordinal(),
+            datetime.strptime(registro["Salida"], "%Y-%m-%d").toordinal(),
+            registro["Estado"], registro.get("Creada"), registro.get("ID Reserva"),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "ID Espera": self.id_espera,
+            "ID Cliente": self.id_cliente,
+            "Tipo": self.tipo,
+            "Ingreso": datetime.fromordinal(self.ingreso).strftime("%Y-%m-%d"),
+            "Salida": datetime.fromordinal(self.salida).strftime("%Y-%m-%d"),
+            "Estado": self.estado,
+            "Creada": self.creada,
+            "ID Reserva": self.id_reserva,
+        }
+
+
+class ListaEspera:
+    """Solicitudes pendientes por tipo, ordenadas por ingreso, y cupos de prioridad por noche."""
+
+    def __init__(self):
+        self.prioridad: Dict[str, int] = {}                     # tipo -> solicitudes prioritarias por noche
+        self._solicitudes: Dict[int, SolicitudEspera] = {}      # todas, por ID
+        self._por_tipo: Dict[str, List[Tuple[int, int]]] = {}   # tipo -> [(ingreso, id)] de las pendientes
+        self._prioritarias: Dict[str, Dict[int, int]] = {}      # tipo -> noche -> solicitudes prioritarias
+        self._ids = AsignadorIds()
+
+    # ----------------------------------------------------------
+    # Configuración y carga
+    # ----------------------------------------------------------
+    def configurar_prioridad(self, tipo: str, cantidad: int) -> None:
+        """Cuántas solicitudes de `tipo` se pueden confirmar sin habitación por noche."""
+        cantidad = int(cantidad)
+        if cantidad < 0:
+            raise ValueError("El cupo de prioridad no puede ser negativo.")
+        self.prioridad[_clave_tipo(tipo)] = cantidad
+
+    def cargar_prioridad(self, ruta: str = "data/prioridad_espera.json") -> None:
+        """Lee los cupos de un archivo {"tipo": cantidad, ...}."""
+        with open(ruta, "r", encoding="utf-8") as f:
+            for tipo, cantidad in json.load(f).items():
+                self.configurar_prioridad(tipo, cantidad)
+
+    def cargar(self, registros: Iterable[Dict]) -> int:
+        """Carga los registros persistidos (gana la última versión de cada ID)."""
+        ultimos = {}
+        for registro in registros:
+            ultimos[registro["ID Espera"]] = registro
+        for registro in ultimos.values():
+            solicitud = SolicitudEspera.desde_registro(registro)
+            self._ids.observar(solicitud.id_espera)
+            self._solicitudes[solicitud.id_espera] = solicitud
+            if solicitud.estado in PENDIENTES:
+                self._indexar(solicitud)
+        return len(ultimos)
+
+    # ----------------------------------------------------------
+    # Altas y cambios de estado
+    # ----------------------------------------------------------
+    def nueva(self, id_cliente: int, tipo: str, ingreso: int, salida: int) -> SolicitudEspera:
+        """Anota una solicitud: "prioritaria" si queda cupo en todas sus noches, si no "espera"."""
+        estado = "prioritaria" if self.cabe_prioridad(tipo, ingreso, salida) else "espera"
+        solicitud = SolicitudEspera(self._ids.siguiente(), id_cliente, tipo, ingreso, salida, estado)
+        self._solicitudes[solicitud.id_espera] = solicitud
+        self._indexar(solicitud)
+        return solicitud
+
+    def cerrar(self, solicitud: SolicitudEspera, estado: str, id_reserva: int = None) -> None:
+        """La saca de las pendientes ("asignada", "retirada" o "vencida")."""
+        if solicitud.estado in PENDIENTES:
+            self._desindexar(solicitud)
+        solicitud.estado = estado
+        solicitud.id_reserva = id_reserva
+
+    def reabrir(self, solicitud: SolicitudEspera, estado: str) -> None:
+        """Deshace `cerrar` (si no se pudo anotar el cambio)."""
+        solicitud.estado = estado
+        solicitud.id_reserva = None
+        self._indexar(solicitud)
+
+    def quitar(self, solicitud: SolicitudEspera) -> None:
+        """Deshace `nueva`."""
+        if solicitud.estado in PENDIENTES:
+            self._desindexar(solicitud)
+        self._solicitudes.pop(solicitud.id_espera, None)
+
+    def _indexar(self, solicitud: SolicitudEspera) -> None:
+        clave = _clave_tipo(solicitud.tipo)
+        insort(self._por_tipo.setdefault(clave, []), (solicitud.ingreso, solicitud.id_espera))
+        if solicitud.estado == "prioritaria":
+            noches = self._prioritarias.setdefault(clave, {})
+            for noche in range(solicitud.ingreso, solicitud.salida):
+                noches[noche] = noches.get(noche, 0) + 1
+
+    def _desindexar(self, solicitud: SolicitudEspera) -> None:
+        clave = _clave_tipo(solicitud.tipo)
+        lista = self._por_tipo[clave]
+        i = bisect_left(lista, (solicitud.ingreso, solicitud.id_espera))
+        del lista[i]
+        if solicitud.estado == "prioritaria":
+            noches = self._prioritarias[clave]
+            for noche in range(solicitud.ingreso, solicitud.salida):
+                noches[noche] -= 1
+                if not noches[noche]:
+                    del noches[noche]
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def obtener(self, id_espera: int) -> Optional[SolicitudEspera]:
+        return self._solicitudes.get(id_espera)
+
+    def cabe_prioridad(self, tipo: str, ingreso: int, salida: int) -> bool:
+        clave = _clave_tipo(tipo)
+        cupo = self.prioridad.get(clave, 0)
+        noches = self._prioritarias.get(clave, {})
+        return cupo > 0 and all(noches.get(n, 0) < cupo for n in range(ingreso, salida))
+
+    def mejor(self, tipo: str, desde: int, hasta: Optional[int]) -> Optional[SolicitudEspera]:
+        """
+        La solicitud pendiente de `tipo` que mejor llena el hueco [desde,
+        hasta) (None = sin límite): solo se revisan las que empiezan dentro.
+        """
+        lista = self._por_tipo.get(_clave_tipo(tipo), [])
+        inicio = bisect_left(lista, (desde,))
+        fin = len(lista) if hasta is None else bisect_left(lista, (hasta,), inicio)
+        elegida, mejor_orden = None, None
+        for i in range(inicio, fin):
+            solicitud = self._solicitudes[lista[i][1]]
+            if hasta is not None and solicitud.salida > hasta:
+                continue
+            orden = (solicitud.estado != "prioritaria", -solicitud.noches, solicitud.id_espera)
+            if mejor_orden is None or orden < mejor_orden:
+                elegida, mejor_orden = solicitud, orden
+        return elegida
+
+    def pendientes(self, tipo: Optional[str] = None) -> List[SolicitudEspera]:
+        """Pendientes (del tipo, si se da): prioritarias primero, luego por antigüedad."""
+        claves = [_clave_tipo(tipo)] if tipo else list(self._por_tipo)
+        solicitudes = [self._solicitudes[i] for c in claves for _, i in self._por_tipo.get(c, [])]
+        return sorted(solicitudes, key=lambda s: (s.estado != "prioritaria", s.id_espera))
+
+    def __len__(self) -> int:
+        return sum(len(lista) for lista in self._por_tipo.values())
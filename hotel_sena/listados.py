@@ -0,0 +1,164 @@
+"""
+Listados filtrados, ordenados y paginados de clientes, habitaciones y
+reservaciones.
+
+Los filtros son generadores: recorren los registros a medida que se
+piden los elementos, así que la primera página sale sin construir la
+lista completa. Solo ordenar por una clave distinta al orden de registro
+obliga a materializar los resultados filtrados.
+
+Estos mismos iteradores alimentan el menú (una escritura por página),
+el servidor HTTP y las exportaciones JSON/CSV de `carga_masiva`.
+"""
+import sys
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from hotel_sena.disponibilidad import a_ordinal
+
+
+# nombre de la clave de orden -> función sobre el objeto
+ORDEN_CLIENTES: Dict[str, Callable] = {
+    "id": lambda c: c.id_cliente,
+    "nombre": lambda c: c.nombre,
+    "correo": lambda c: c.correo,
+}
+
+ORDEN_HABITACIONES: Dict[str, Callable] = {
+    "id": lambda h: h.id_habitacion,
+    "tipo": lambda h: h.tipo,
+    "precio": lambda h: h.precio,
+    "estado": lambda h: h.estado,
+}
+
+ORDEN_RESERVACIONES: Dict[str, Callable] = {
+    "id": lambda r: r.id_reserva,
+    "ingreso": lambda r: r.ingreso,
+    "salida": lambda r: r.salida,
+    "precio": lambda r: r.precio,
+    "total": lambda r: r.calcular_precio_total(),
+    "cliente": lambda r: r.cliente.nombre,
+    "habitacion": lambda r: r.habitacion.id_habitacion,
+}
+
+
+def _ordenar(elementos: Iterable, claves: Dict[str, Callable], orden: Optional[str],
+             descendente: bool) -> Iterable:
+    if not orden:
+        return elementos
+    if orden not in claves:
+        raise ValueError(f"Orden '{orden}' no válido. Opciones: {', '.join(claves)}.")
+    return sorted(elementos, key=claves[orden], reverse=descendente)
+
+
+# ---------------------------------------------------------
+# Filtros
+# ---------------------------------------------------------
+def filtrar_clientes(clientes: Iterable, texto: Optional[str] = None, orden: Optional[str] = None,
+                     descendente: bool = False) -> Iterator:
+    """Clientes cuyo nombre o correo contiene `texto` (sin distinguir mayúsculas)."""
+    texto = texto.strip().lower() if texto else None
+    elegidos = (
+        c for c in clientes
+        if not texto or texto in c.nombre.lower() or texto in c.correo
+    )
+    return iter(_ordenar(elegidos, ORDEN_CLIENTES, orden, descendente))
+
+
+def filtrar_habitaciones(habitaciones: Iterable, tipo: Optional[str] = None, estado: Optional[str] = None,
+                         orden: Optional[str] = None, descendente: bool = False) -> Iterator:
+    """Habitaciones de un tipo y/o estado. Con un registro usa su índice por tipo."""
+    tipo = tipo.strip().lower() if tipo else None
+    estado = estado.strip().lower() if estado else None
+    fuente = habitaciones.por_tipo(tipo) if tipo and hasattr(habitaciones, "por_tipo") else habitaciones
+    elegidas = (
+        h for h in fuente
+        if (not tipo or h.tipo.lower() == tipo) and (not estado or h.estado.lower() == estado)
+    )
+    return iter(_ordenar(elegidas, ORDEN_HABITACIONES, orden, descendente))
+
+
+def filtrar_reservaciones(reservas: Iterable, desde=None, hasta=None, estado: Optional[str] = None,
+                          id_cliente: Optional[int] = None, tipo: Optional[str] = None,
+                          id_habitacion: Optional[int] = None, orden: Optional[str] = None,
+                          descendente: bool = False) -> Iterator:
+    """
+    Reservaciones que se cruzan con el rango `desde`-`hasta` (ambos días
+    incluidos; cualquiera de los dos puede omitirse) y cumplen los demás
+    filtros. Con un registro, el filtro por cliente o habitación usa sus
+    índices en lugar de recorrerlo todo.
+    """
+    inicio = a_ordinal(desde) if desde else None
+    fin = a_ordinal(hasta) + 1 if hasta else None  # exclusivo
+    if inicio is not None and fin is not None and fin <= inicio:
+        raise ValueError("La fecha final del listado no puede ser anterior a la inicial.")
+    estado = estado.strip().lower() if estado else None
+    tipo = tipo.strip().lower() if tipo else None
+
+    fuente = reservas
+    if id_cliente is not None and hasattr(reservas, "por_cliente"):
+        fuente = reservas.por_cliente(id_cliente)
+    elif id_habitacion is not None and hasattr(reservas, "por_habitacion"):
+        fuente = reservas.por_habitacion(id_habitacion)
+
+    elegidas = (
+        r for r in fuente
+        if (inicio is None or r.salida > inicio)
+        and (fin is None or r.ingreso < fin)
+        and (not estado or r.estado == estado)
+        and (id_cliente is None or r.cliente.id_cliente == id_cliente)
+        and (id_habitacion is None or r.habitacion.id_habitacion == id_habitacion)
+        and (not tipo or r.habitacion.tipo.lower() == tipo)
+    )
+    return iter(_ordenar(elegidas, ORDEN_RESERVACIONES, orden, descendente))
+
+
+# ---------------------------------------------------------
+# Paginación
+# ---------------------------------------------------------
+def paginar(elementos: Iterable, tamano: int = 20) -> Iterator[List]:
+    """Agrupa los elementos en páginas de `tamano` sin recorrer más de lo necesario."""
+    if tamano < 1:
+        raise ValueError("El tamaño de página debe ser al menos 1.")
+    iterador = iter(elementos)
+    while True:
+        pagina = list(islice(iterador, tamano))
+        if not pagina:
+            return
+        yield pagina
+
+
+def pagina(elementos: Iterable, numero: int = 1, tamano: int = 20) -> List:
+    """Solo la página `numero` (desde 1), saltando las anteriores sin guardarlas."""
+    if numero < 1 or tamano < 1:
+        raise ValueError("La página y su tamaño deben ser al menos 1.")
+    inicio = (numero - 1) * tamano
+    return list(islice(elementos, inicio, inicio + tamano))
+
+
+def escribir_paginas(elementos: Iterable, formatear: Callable[[object], str], tamano: int = 20,
+                     salida: TextIO = None, continuar: Callable[[int], bool] = None) -> int:
+    """
+    Escribe los elementos página por página con una sola escritura por página.
+
+    `continuar(numero_pagina)` se llama entre páginas (no después de la
+    última); si devuelve False el listado se corta. Devuelve la cantidad de
+    elementos mostrados.
+    """
+    salida = salida or sys.stdout
+    mostrados = 0
+    paginas = paginar(elementos, tamano)
+    actual = next(paginas, None)
+    numero = 0
+    while actual is not None:
+        numero += 1
+        siguiente = next(paginas, None)
+        bloque = "".join(formatear(e) + "\n" for e in actual)
+        pie = f"-- Página {numero} (registros {mostrados + 1}-{mostrados + len(actual)})"
+        mostrados += len(actual)
+        salida.write(bloque + pie + (" --\n" if siguiente is not None else ", fin del listado --\n"))
+        salida.flush()
+        if siguiente is not None and continuar is not None and not continuar(numero):
+            break
+        actual = siguiente
+    return mostrados
@@ -0,0 +1,274 @@
+"""
+Métricas de rendimiento de las operaciones frecuentes.
+
+Las funciones del modelo, el almacenamiento y el servicio se marcan con
+`@medido("nombre")` (o un bloque `with medir("nombre"):`). Con las
+métricas activas cada llamada suma a:
+
+    - un contador de llamadas y de errores (excepciones),
+    - la suma y el máximo de la latencia,
+    - una ventana de las últimas MUESTRAS latencias, de donde salen
+      p50 / p95 / p99.
+
+Desactivadas (lo normal), la envoltura solo revisa una variable global y
+llama a la función original. Se activan con `activar()`, con la variable
+de entorno HOTEL_METRICAS=1, desde el menú (opción 10) o con
+`servidor_http.py --metricas`.
+
+`perfilar(cada=N)` además corre una de cada N llamadas medidas bajo
+cProfile (un hilo a la vez); `reporte_perfil()` muestra las funciones
+que más tiempo acumularon.
+
+Los resultados se consultan con `tabla()` (consola) o `texto_prometheus()`
+(formato de exposición de Prometheus, lo sirve GET /metricas).
+"""
+import os
+import threading
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+from itertools import count
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+MUESTRAS = 2048  # latencias recientes por operación para calcular percentiles
+PERCENTILES = (0.5, 0.95, 0.99)
+
+activo = os.environ.get("HOTEL_METRICAS") == "1"
+
+
+class Latencias:
+    """Contadores y latencias (en segundos) de una operación."""
+
+    __slots__ = ("llamadas", "errores", "suma", "maximo", "muestras")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.suma = 0.0
+        self.maximo = 0.0
+        self.muestras = deque(maxlen=MUESTRAS)
+
+    def percentiles(self) -> Dict[float, float]:
+        """Percentiles de la ventana de muestras (rango más cercano)."""
+        ordenadas = sorted(self.muestras)
+        if not ordenadas:
+            return {p: 0.0 for p in PERCENTILES}
+        return {p: ordenadas[min(len(ordenadas) - 1, int(p * len(ordenadas)))] for p in PERCENTILES}
+
+
+_candado = threading.Lock()
+_latencias: Dict[str, Latencias] = {}
+_contadores: Dict[str, int] = {}
+
+# cProfile y pstats se importan al pedir el primer perfil (son lentos de cargar).
+_perfil: Optional["cProfile.Profile"] = None
+_perfil_cada = 0
+_candado_perfil = threading.Lock()  # cProfile no admite dos perfiles activos a la vez
+_llamadas_perfil = count(1)
+
+
+# ---------------------------------------------------------
+# Encendido / apagado
+# ---------------------------------------------------------
+def activar(encendido: bool = True) -> None:
+    global activo
+    activo = encendido
+
+
+def reiniciar() -> None:
+    """Borra todas las métricas acumuladas (y el perfil, si hay uno)."""
+    with _candado:
+        _latencias.clear()
+        _contadores.clear()
+    if _perfil is not None:
+        perfilar(_perfil_cada)
+
+
+def perfilar(cada: int = 100) -> None:
+    """Perfila una de cada `cada` llamadas medidas con cProfile; `cada=0` lo apaga."""
+    global _perfil, _perfil_cada
+    if cada < 0:
+        raise ValueError("La frecuencia de perfilado no puede ser negativa.")
+    with _candado_perfil:
+        if cada:
+            import cProfile
+            _perfil = cProfile.Profile()
+        else:
+            _perfil = None
+        _perfil_cada = cada
+
+
+# ---------------------------------------------------------
+# Registro de mediciones
+# ---------------------------------------------------------
+def registrar(nombre: str, segundos: float, error: bool = False) -> None:
+    with _candado:
+        latencias = _latencias.get(nombre)
+        if latencias is None:
+            latencias = _latencias[nombre] = Latencias()
+        latencias.llamadas += 1
+        latencias.errores += error
+        latencias.suma += segundos
+        if segundos > latencias.maximo:
+            latencias.maximo = segundos
+        latencias.muestras.append(segundos)
+
+
+def contar(nombre: str, cantidad: int = 1) -> None:
+    """Suma a un contador simple (solo con las métricas activas)."""
+    if activo:
+        with _candado:
+            _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+
+def _tomar_perfil() -> Optional["cProfile.Profile"]:
+    perfil, cada = _perfil, _perfil_cada  # otro hilo puede apagar el perfilado entre medio
+    if perfil is None or not cada or next(_llamadas_perfil) % cada:
+        return None
+    # Si otro hilo (o una llamada externa de este mismo) ya perfila, esta se salta.
+    if not _candado_perfil.acquire(blocking=False):
+        return None
+    if perfil is not _perfil:  # se reinició mientras tanto
+        _candado_perfil.release()
+        return None
+    return perfil
+
+
+def _ejecutar(nombre: str, funcion: Callable, args, kwargs):
+    perfil = _tomar_perfil()
+    error = True
+    inicio = perf_counter()
+    try:
+        if perfil is None:
+            resultado = funcion(*args, **kwargs)
+        else:
+            resultado = perfil.runcall(funcion, *args, **kwargs)
+        error = False
+        return resultado
+    finally:
+        registrar(nombre, perf_counter() - inicio, error)
+        if perfil is not None:
+            _candado_perfil.release()
+
+
+def medido(nombre: str) -> Callable:
+    """Decorador que mide cada llamada a la función bajo `nombre`."""
+    def decorador(funcion: Callable) -> Callable:
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not activo:
+                return funcion(*args, **kwargs)
+            return _ejecutar(nombre, funcion, args, kwargs)
+        return envoltura
+    return decorador
+
+
+class _Cronometro:
+    __slots__ = ("nombre", "inicio")
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        registrar(self.nombre, perf_counter() - self.inicio, tipo is not None)
+        return False
+
+
+_SIN_MEDIR = nullcontext()
+
+
+def medir(nombre: str):
+    """Mide un bloque: `with medir("almacen.compactar"): ...`."""
+    return _Cronometro(nombre) if activo else _SIN_MEDIR
+
+
+# ---------------------------------------------------------
+# Consulta
+# ---------------------------------------------------------
+def instantanea() -> Dict[str, Dict]:
+    """Copia de las métricas: operación -> llamadas, errores, suma, máximo y percentiles."""
+    with _candado:
+        copia = {
+            nombre: (l.llamadas, l.errores, l.suma, l.maximo, list(l.muestras))
+            for nombre, l in _latencias.items()
+        }
+        contadores = dict(_contadores)
+    resultado = {}
+    for nombre, (llamadas, errores, suma, maximo, muestras) in sorted(copia.items()):
+        latencias = Latencias()
+        latencias.muestras.extend(muestras)
+        resultado[nombre] = {
+            "llamadas": llamadas,
+            "errores": errores,
+            "suma": suma,
+            "maximo": maximo,
+            "percentiles": latencias.percentiles(),
+        }
+    return {"operaciones": resultado, "contadores": dict(sorted(contadores.items()))}
+
+
+def tabla() -> str:
+    """Resumen legible para la consola (tiempos en milisegundos)."""
+    datos = instantanea()
+    lineas = [f"{'Operación':30} {'Llamadas':>9} {'Errores':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'Máx':>9}"]
+    for nombre, m in datos["operaciones"].items():
+        p = m["percentiles"]
+        lineas.append(
+            f"{nombre:30} {m['llamadas']:>9} {m['errores']:>8} "
+            + " ".join(f"{v * 1000:>9.3f}" for v in (p[0.5], p[0.95], p[0.99], m["maximo"]))
+        )
+    for nombre, valor in datos["contadores"].items():
+        lineas.append(f"{nombre:30} {valor:>9}")
+    return "\n".join(lineas)
+
+
+def _etiqueta(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def texto_prometheus() -> str:
+    """Métricas en el formato de texto de Prometheus (versión 0.0.4)."""
+    datos = instantanea()
+    lineas = [
+        "# HELP hotel_operacion_segundos Latencia de las operaciones del hotel (ventana reciente).",
+        "# TYPE hotel_operacion_segundos summary",
+    ]
+    for nombre, m in datos["operaciones"].items():
+        etiqueta = f'operacion="{_etiqueta(nombre)}"'
+        for p, valor in m["percentiles"].items():
+            lineas.append(f'hotel_operacion_segundos{{{etiqueta},quantile="{p}"}} {valor:.9f}')
+        lineas.append(f"hotel_operacion_segundos_sum{{{etiqueta}}} {m['suma']:.9f}")
+        lineas.append(f"hotel_operacion_segundos_count{{{etiqueta}}} {m['llamadas']}")
+    lineas += [
+        "# HELP hotel_operacion_errores_total Llamadas que terminaron en excepción.",
+        "# TYPE hotel_operacion_errores_total counter",
+    ]
+    for nombre, m in datos["operaciones"].items():
+        lineas.append(f'hotel_operacion_errores_total{{operacion="{_etiqueta(nombre)}"}} {m["errores"]}')
+    lineas += [
+        "# HELP hotel_eventos_total Contadores de eventos internos.",
+        "# TYPE hotel_eventos_total counter",
+    ]
+    for nombre, valor in datos["contadores"].items():
+        lineas.append(f'hotel_eventos_total{{nombre="{_etiqueta(nombre)}"}} {valor}')
+    return "\n".join(lineas) + "\n"
+
+
+def reporte_perfil(limite: int = 25, orden: str = "cumulative") -> str:
+    """Funciones con más tiempo en las llamadas perfiladas (vacío si no se perfila)."""
+    with _candado_perfil:
+        if _perfil is None:
+            return ""
+        import io
+        import pstats
+        salida = io.StringIO()
+        try:
+            pstats.Stats(_perfil, stream=salida).sort_stats(orden).print_stats(limite)
+        except TypeError:  # todavía no se perfiló ninguna llamada
+            return ""
+    return salida.getvalue()
@@ -0,0 +1,130 @@
+import asyncio
+import random
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.metricas import medido
+
+
+class ErrorPasarelaTransitorio(Exception):
+    """Falla temporal de la pasarela (caída, congestión): el pago se puede reintentar."""
+
+
+# ---------------------------------------------------------
+# Pasarelas de pago
+# ---------------------------------------------------------
+class PasarelaPago:
+    """Interfaz de una pasarela de pago. `autorizar` devuelve True si aprueba el cobro."""
+
+    async def autorizar(self, pago) -> bool:
+        raise NotImplementedError
+
+
+class PasarelaSimulada(PasarelaPago):
+    """
+    Pasarela local que reemplaza a tarjeta/nequi/daviplata/paypal.
+    Espera `latencia` segundos sin bloquear el bucle de eventos y aprueba
+    con probabilidad `tasa_exito`. Con `tasa_falla_transitoria` > 0 también
+    simula caídas que el procesador reintenta.
+    """
+
+    def __init__(self, latencia: float = 1.5, tasa_exito: float = 0.5,
+                 tasa_falla_transitoria: float = 0.0, semilla: Optional[int] = None):
+        self.latencia = latencia
+        self.tasa_exito = tasa_exito
+        self.tasa_falla_transitoria = tasa_falla_transitoria
+        self._azar = random.Random(semilla)
+
+    async def autorizar(self, pago) -> bool:
+        await asyncio.sleep(self.latencia)
+        if self._azar.random() < self.tasa_falla_transitoria:
+            raise ErrorPasarelaTransitorio(f"La pasarela '{pago.metodo_pago}' no respondió.")
+        return self._azar.random() < self.tasa_exito
+
+
+# ---------------------------------------------------------
+# Procesador asíncrono
+# ---------------------------------------------------------
+class ProcesadorPagos:
+    """
+    Procesa pagos de forma concurrente con asyncio.
+
+    - `pasarelas`: pasarela por método de pago (por defecto una simulada para todos).
+    - `limites`: máximo de pagos simultáneos por método.
+    - `timeout`: segundos máximos por intento.
+    - `reintentos` y `espera_base`: reintentos con espera exponencial
+      (espera_base, 2*espera_base, ...) ante timeouts o fallas transitorias.
+      Un rechazo de la pasarela no se reintenta.
+
+    Al terminar, el estado queda en `pago.estado` ("aprobado", "fallido" o
+    "rechazado") y todos los pagos de un lote se guardan con una sola escritura
+    en `ruta_archivo` (con `ruta_archivo=None` no se guardan: los persiste
+    quien llama, como `ServicioHotel` con su bitácora).
+    """
+
+    def __init__(self, pasarelas: Dict[str, PasarelaPago] = None, limites: Dict[str, int] = None,
+                 limite_por_defecto: int = 20, timeout: float = 10.0, reintentos: int = 3,
+                 espera_base: float = 0.2, ruta_archivo: Optional[str] = "data/pagos.json"):
+        self.pasarelas = dict(pasarelas or {})
+        self.pasarela_por_defecto = PasarelaSimulada()
+        self.limites = dict(limites or {})
+        self.limite_por_defecto = limite_por_defecto
+        self.timeout = timeout
+        self.reintentos = reintentos
+        self.espera_base = espera_base
+        self.ruta_archivo = ruta_archivo
+
+    # ----------------------------------------------------------
+    # API asíncrona
+    # ----------------------------------------------------------
+    async def procesar(self, pagos: Iterable) -> List:
+        """Procesa todos los pagos en paralelo, los persiste y los devuelve."""
+        pagos = list(pagos)
+        # Los semáforos pertenecen al bucle de eventos actual.
+        semaforos = {}
+        await asyncio.gather(*(self._procesar_uno(p, semaforos) for p in pagos))
+        if self.ruta_archivo:
+            obtener_almacen(self.ruta_archivo).agregar_lote(p.to_dict() for p in pagos)
+        return pagos
+
+    async def _procesar_uno(self, pago, semaforos: Dict) -> None:
+        if pago.metodo_pago not in pago.METODOS_VALIDOS:
+            pago.estado = "rechazado"
+            return
+
+        semaforo = semaforos.get(pago.metodo_pago)
+        if semaforo is None:
+            limite = self.limites.get(pago.metodo_pago, self.limite_por_defecto)
+            semaforo = semaforos[pago.metodo_pago] = asyncio.Semaphore(limite)
+        pasarela = self.pasarelas.get(pago.metodo_pago, self.pasarela_por_defecto)
+
+        async with semaforo:
+            for intento in range(self.reintentos + 1):
+                try:
+                    aprobado = await asyncio.wait_for(pasarela.autorizar(pago), self.timeout)
+                    pago.estado = "aprobado" if aprobado else "fallido"
+                    break
+                except (asyncio.TimeoutError, ErrorPasarelaTransitorio):
+                    if intento == self.reintentos:
+                        pago.estado = "fallido"
+                        break
+                    await asyncio.sleep(self.espera_base * (2 ** intento))
+        pago.fecha = date.today().isoformat()
+
+    # ----------------------------------------------------------
+    # API síncrona (para el menú de consola)
+    # ----------------------------------------------------------
+    @medido("pagos.procesar_lote")
+    def procesar_sync(self, pagos: Iterable) -> List:
+        """Ejecuta `procesar` desde código síncrono."""
+        return asyncio.run(self.procesar(pagos))
+
+
+# Procesador compartido por los módulos del sistema.
+procesador_pagos = ProcesadorPagos()
+
+
+def procesar_pagos(pagos: Iterable) -> List:
+    """Procesa un lote de pagos con el procesador compartido (llamada bloqueante)."""
+    return procesador_pagos.procesar_sync(pagos)
@@ -0,0 +1,240 @@
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+
+class AsignadorIds:
+    """Entrega IDs crecientes que nunca se repiten, aunque se borren registros."""
+
+    def __init__(self, inicio: int = 1):
+        self._siguiente = inicio
+
+    def siguiente(self) -> int:
+        """Devuelve un ID nuevo."""
+        id_nuevo = self._siguiente
+        self._siguiente += 1
+        return id_nuevo
+
+    def proximo(self) -> int:
+        """El ID que entregará `siguiente`, sin gastarlo."""
+        return self._siguiente
+
+    def observar(self, id_existente: int) -> None:
+        """Avanza el contador para no repetir un ID que ya está en uso (ej. al cargar datos)."""
+        if isinstance(id_existente, int) and id_existente >= self._siguiente:
+            self._siguiente = id_existente + 1
+
+
+class _Pendiente:
+    """Registro persistido que todavía no se convirtió en objeto."""
+
+    __slots__ = ("crudo",)
+
+    def __init__(self, crudo: Dict):
+        self.crudo = crudo
+
+
+class Registro:
+    """
+    Colección de objetos indexada por clave primaria (diccionario) con
+    índices secundarios opcionales. Todas las búsquedas son O(1).
+
+    `indices` asocia un nombre con una función que extrae la clave del
+    objeto, por ejemplo {"correo": lambda c: c.correo}. Si un atributo
+    indexado cambia, hay que llamar a `reindexar(obj)`.
+
+    También admite carga perezosa: `agregar_perezoso` guarda el registro
+    crudo (diccionario) con sus claves ya calculadas, y el objeto se
+    construye con `hidratar(crudo)` solo la primera vez que se accede.
+    """
+
+    def __init__(self, campo_id: str, indices: Dict[str, Callable[[object], Hashable]] = None):
+        self.campo_id = campo_id
+        self._datos: Dict[int, object] = {}
+        self._extractores = dict(indices or {})
+        self._indices: Dict[str, Dict[Hashable, Dict[int, None]]] = {n: {} for n in self._extractores}
+        self._claves: Dict[int, Dict[str, Hashable]] = {}
+        self._ids = AsignadorIds()
+        self.hidratar: Optional[Callable[[Dict], object]] = None
+
+    # ----------------------------------------------------------
+    # IDs
+    # ----------------------------------------------------------
+    def siguiente_id(self) -> int:
+        """Reserva un ID nuevo para el próximo objeto."""
+        return self._ids.siguiente()
+
+    def proximo_id(self) -> int:
+        """El ID que tendría el próximo objeto, sin reservarlo (`agregar` lo da por usado)."""
+        return self._ids.proximo()
+
+    # ----------------------------------------------------------
+    # Altas, bajas y cambios
+    # ----------------------------------------------------------
+    def agregar(self, obj) -> None:
+        """Agrega un objeto. Lanza ValueError si su ID ya existe."""
+        pk = getattr(obj, self.campo_id)
+        if pk in self._datos:
+            raise ValueError(f"Ya existe un registro con {self.campo_id}={pk}.")
+        self._datos[pk] = obj
+        self._ids.observar(pk)
+        self._indexar(pk, obj)
+
+    def agregar_perezoso(self, pk: int, crudo: Dict, claves: Dict[str, Hashable]) -> None:
+        """Registra un objeto sin construirlo; `claves` trae los valores de los índices secundarios."""
+        if pk in self._datos:
+            raise ValueError(f"Ya existe un registro con {self.campo_id}={pk}.")
+        self._datos[pk] = _Pendiente(crudo)
+        self._ids.observar(pk)
+        for nombre, valor in claves.items():
+            self._indices[nombre].setdefault(valor, {})[pk] = None
+        self._claves[pk] = dict(claves)
+
+    def quitar(self, pk: int):
+        """Elimina y devuelve el objeto con ese ID (o None si no existe)."""
+        obj = self.obtener(pk)
+        if obj is not None:
+            del self._datos[pk]
+            self._desindexar(pk)
+        return obj
+
+    def reindexar(self, obj) -> None:
+        """Actualiza los índices secundarios tras modificar el objeto."""
+        pk = getattr(obj, self.campo_id)
+        if pk in self._datos:
+            self._desindexar(pk)
+            self._indexar(pk, obj)
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def obtener(self, pk: int, default=None):
+        """Busca por clave primaria (construyendo el objeto si estaba pendiente)."""
+        obj = self._datos.get(pk, default)
+        if obj.__class__ is _Pendiente:
+            obj = self._datos[pk] = self.hidratar(obj.crudo)
+        return obj
+
+    def ids(self, indice: str, valor: Hashable) -> List[int]:
+        """IDs cuyo índice secundario `indice` vale `valor` (sin construir objetos)."""
+        return list(self._indices[indice].get(valor, {}))
+
+    def buscar(self, indice: str, valor: Hashable) -> List:
+        """Todos los objetos cuyo índice secundario `indice` vale `valor`."""
+        return [self.obtener(pk) for pk in self.ids(indice, valor)]
+
+    def primero(self, indice: str, valor: Hashable) -> Optional[object]:
+        """El primer objeto (en orden de alta) con ese valor en el índice, o None."""
+        for pk in self._indices[indice].get(valor, {}):
+            return self.obtener(pk)
+        return None
+
+    def crudo(self, pk: int) -> Optional[Dict]:
+        """El registro persistible de `pk` sin forzar la construcción del objeto."""
+        obj = self._datos.get(pk)
+        if obj is None:
+            return None
+        return obj.crudo if obj.__class__ is _Pendiente else obj.to_dict()
+
+    def crudos(self) -> Iterator[Dict]:
+        """Recorre los registros persistibles de todos los objetos sin construir los pendientes."""
+        for pk in list(self._datos):
+            registro = self.crudo(pk)
+            if registro is not None:
+                yield registro
+
+    def pendientes(self) -> int:
+        """Cantidad de registros cargados que aún no se han construido."""
+        return sum(1 for obj in self._datos.values() if obj.__class__ is _Pendiente)
+
+    def contar(self, indice: str, valor: Hashable) -> int:
+        return len(self._indices[indice].get(valor, {}))
+
+    def __iter__(self) -> Iterator:
+        for pk in list(self._datos):
+            obj = self.obtener(pk)
+            if obj is not None:
+                yield obj
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def __contains__(self, pk) -> bool:
+        return pk in self._datos
+
+    # ----------------------------------------------------------
+    # Índices secundarios (diccionarios usados como conjuntos ordenados)
+    # ----------------------------------------------------------
+    def _indexar(self, pk: int, obj) -> None:
+        claves = {}
+        for nombre, extraer in self._extractores.items():
+            valor = extraer(obj)
+            claves[nombre] = valor
+            self._indices[nombre].setdefault(valor, {})[pk] = None
+        self._claves[pk] = claves
+
+    def _desindexar(self, pk: int) -> None:
+        for nombre, valor in self._claves.pop(pk, {}).items():
+            grupo = self._indices[nombre].get(valor)
+            if grupo is not None:
+                grupo.pop(pk, None)
+                if not grupo:
+                    del self._indices[nombre][valor]
+
+
+# ---------------------------------------------------------
+# Registros concretos del hotel
+# ---------------------------------------------------------
+class RegistroClientes(Registro):
+    """Clientes por ID, correo y teléfono."""
+
+    def __init__(self):
+        super().__init__("id_cliente", {
+            "correo": lambda c: c.correo,
+            "telefono": lambda c: c.telefono,
+        })
+
+    def por_correo(self, correo: str):
+        return self.primero("correo", correo.strip().lower())
+
+    def por_telefono(self, telefono) -> List:
+        return self.buscar("telefono", str(telefono).strip())
+
+
+class RegistroHabitaciones(Registro):
+    """Habitaciones por ID y tipo."""
+
+    def __init__(self):
+        super().__init__("id_habitacion", {
+            "tipo": lambda h: h.tipo.strip().lower(),
+        })
+
+    def por_tipo(self, tipo: str) -> List:
+        return self.buscar("tipo", tipo.strip().lower())
+
+
+class RegistroReservas(Registro):
+    """Reservaciones por ID, cliente y habitación."""
+
+    def __init__(self):
+        super().__init__("id_reserva", {
+            "cliente": lambda r: r.cliente.id_cliente,
+            "habitacion": lambda r: r.habitacion.id_habitacion,
+        })
+
+    def por_cliente(self, id_cliente: int) -> List:
+        return self.buscar("cliente", id_cliente)
+
+    def por_habitacion(self, id_habitacion: int) -> List:
+        return self.buscar("habitacion", id_habitacion)
+
+
+class RegistroPagos(Registro):
+    """Pagos por ID, reservación y clave de idempotencia."""
+
+    def __init__(self):
+        super().__init__("id_pago", {
+            "reserva": lambda p: p.id_reserva,
+            "clave": lambda p: p.clave,
+        })
+
+    def por_reserva(self, id_reserva: int) -> List:
+        return self.buscar("reserva", id_reserva)
@@ -0,0 +1,132 @@
+from datetime import date, datetime
+
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.disponibilidad import indice_disponibilidad
+from hotel_sena.metricas import medido
+
+class Reservacion:
+    """Clase que representa una reservación de hotel."""
+
+    # Estados que ocupan sus noches: "activa" y, una vez cobrada, "pagada".
+    # Después pasan a "finalizada" (salida del huésped) o "cancelada".
+    VIGENTES = ("activa", "pagada")
+    ESTADOS_VALIDOS = {"activa", "pagada", "finalizada", "cancelada"}
+
+    # Sin __dict__ por instancia; las fechas se guardan como ordinales (int).
+    __slots__ = ("id_reserva", "cliente", "habitacion", "ingreso", "salida", "precio", "estado", "precio_total")
+
+    @medido("reservacion.crear")
+    def __init__(self, id_reserva, cliente, habitacion, fecha_ingreso, fecha_salida, precio, estado="activa",
+                 precio_total=None, indice=indice_disponibilidad):
+        self.id_reserva = id_reserva
+        self.cliente = cliente
+        self.habitacion = habitacion
+
+        # Validación de fechas
+        self.ingreso = datetime.strptime(fecha_ingreso, "%Y-%m-%d").toordinal()
+        self.salida = datetime.strptime(fecha_salida, "%Y-%m-%d").toordinal()
+        if self.salida <= self.ingreso:
+            raise ValueError(" La fecha de salida debe ser posterior a la de ingreso.")
+
+        self.precio = precio
+        self.precio_total = precio_total  # cotización del motor de tarifas (None = noches × precio)
+        self.estado = estado.lower()
+        if self.estado not in self.ESTADOS_VALIDOS:
+            raise ValueError(f"Estado de reservación '{estado}' no válido. "
+                             f"Opciones: {', '.join(sorted(self.ESTADOS_VALIDOS))}.")
+
+        # Bloquear el rango de fechas en el índice de disponibilidad
+        # (lanza ValueError si la habitación ya está reservada esas noches)
+        if self.estado in self.VIGENTES:
+            indice.registrar(self.habitacion, self.ingreso, self.salida, self.id_reserva)
+
+        # Cambiar estado de la habitación automáticamente (si hay un huésped, sigue "ocupada")
+        self.habitacion.estado = indice.estado_segun_reservas(self.habitacion)
+
+    @classmethod
+    def desde_registro(cls, registro, cliente, habitacion):
+        """
+        Reconstruye una reservación a partir de su registro persistido (`to_dict`).
+        No toca el índice de disponibilidad ni el estado de la habitación:
+        quien carga los datos ya los dejó al día.
+        """
+        reserva = cls.__new__(cls)
+        reserva.id_reserva = registro["ID"]
+        reserva.cliente = cliente
+        reserva.habitacion = habitacion
+        reserva.ingreso = date.fromisoformat(registro["Ingreso"]).toordinal()
+        reserva.salida = date.fromisoformat(registro["Salida"]).toordinal()
+        reserva.precio = registro["Precio por día"]
+        reserva.precio_total = registro.get("Precio total")
+        reserva.estado = registro["Estado"].lower()
+        return reserva
+
+    @property
+    def fecha_ingreso(self) -> datetime:
+        return datetime.fromordinal(self.ingreso)
+
+    @property
+    def fecha_salida(self) -> datetime:
+        return datetime.fromordinal(self.salida)
+
+    @property
+    def noches(self) -> int:
+        return self.salida - self.ingreso
+
+    def calcular_precio_total(self):
+        """Costo total: la cotización guardada al reservar o, si no hay, noches × precio por día."""
+        if self.precio_total is not None:
+            return self.precio_total
+        return self.noches * self.precio
+
+    def cancelar(self, mostrar=True, indice=indice_disponibilidad):
+        """Cancela la reservación si está activa. Devuelve True si se canceló."""
+        if self.estado == "activa":
+            self.estado = "cancelada"
+            indice.liberar(
+                self.habitacion.id_habitacion, self.ingreso, self.salida, self.id_reserva
+            )
+            self.habitacion.estado = indice.estado_segun_reservas(self.habitacion)
+            if mostrar:
+                print(f" Reservación #{self.id_reserva} cancelada correctamente.")
+            return True
+        if mostrar:
+            print(f"La reservación #{self.id_reserva} ya estaba cancelada.")
+        return False
+
+    def mostrar_reservacion(self):
+        """Devuelve los datos de la reservación como diccionario."""
+        return {
+            "ID": self.id_reserva,
+            "Cliente": self.cliente.nombre,
+            "Habitación": self.habitacion.id_habitacion,
+            "Ingreso": self.fecha_ingreso.strftime("%Y-%m-%d"),
+            "Salida": self.fecha_salida.strftime("%Y-%m-%d"),
+            "Precio por día": self.precio,
+            "Precio total": self.calcular_precio_total(),
+            "Estado": self.estado
+        }
+
+    def formato_consola(self):
+        """Ficha de la reservación en formato elegante, como un solo bloque de texto."""
+        info = self.mostrar_reservacion()
+        lineas = ["\n" + "="*40, "         RESERVACIÓN DE HOTEL", "="*40]
+        lineas += [f"{k:15}: {v}" for k, v in info.items()]
+        lineas.append("="*40 + "\n")
+        return "\n".join(lineas)
+
+    def mostrar_en_consola(self):
+        """Muestra la reservación en formato elegante."""
+        print(self.formato_consola())
+
+    def to_dict(self):
+        """Registro persistible: los datos de `mostrar_reservacion` más el ID del cliente."""
+        data = self.mostrar_reservacion()
+        data["ID Cliente"] = self.cliente.id_cliente
+        return data
+
+    @medido("reservacion.guardar_json")
+    def guardar_json(self, ruta_archivo="data/reservas.json"):
+        """Anexa la reservación al diario de reservas (ver almacenamiento.DiarioJSONL)."""
+        obtener_almacen(ruta_archivo).agregar(self.to_dict())
+        print(f" Reservación #{self.id_reserva} guardada correctamente en {ruta_archivo}")
@@ -0,0 +1,330 @@
+"""
+Modo multi-sede: cada hotel de la cadena corre en su propio proceso.
+
+Cada sede es un `ServicioHotel` con su propia carpeta de datos
+(`data/sedes/<sede>/`, con bitácora y puntos de control). Sus índices son
+de la instancia, así que varias sedes podrían convivir en un proceso, pero
+cada servicio trabaja bajo su candado y el GIL no deja que dos avancen a la
+vez: para usar varios núcleos cada sede corre en su propio proceso.
+
+Ese proceso es un `ProcessPoolExecutor` de un solo trabajador por sede: el
+servicio se crea al arrancar el trabajador (`_iniciar_sede`) y queda en
+memoria entre pedidos. Un único pool para toda la cadena repartiría los
+pedidos de una sede entre procesos que no tienen sus datos cargados.
+`EnrutadorSedes` reparte las operaciones:
+
+    - Las operaciones de una sede (habitaciones, reservaciones, pagos) van
+      al pool de esa sede. Varios hilos pueden usar el enrutador a la
+      vez; cada sede atiende un pedido a la vez, en orden de llegada, y
+      las sedes entre sí trabajan en paralelo.
+    - Las consultas de toda la cadena (disponibilidad, historial de un
+      cliente) se envían a todas las sedes antes de esperar respuestas,
+      así que se resuelven en paralelo; luego se mezclan los resultados
+      (ya ordenados en cada sede).
+
+Los clientes se identifican por correo en toda la cadena: la primera vez
+que un cliente reserva en una sede se registra en ella.
+
+Uso:
+    with EnrutadorSedes(["bogota", "medellin", "cali"]) as cadena:
+        cadena.registrar_habitacion("bogota", "Doble", 180000)
+        libres = cadena.disponibilidad("2025-12-20", "2025-12-23", "doble")
+        cadena.crear_reservacion("bogota", cliente, libres[0]["id_habitacion"], "2025-12-20", "2025-12-23")
+
+Prueba de escalamiento:
+    python -m hotel_sena.sedes --sedes 4 --reservas 500
+"""
+import argparse
+import heapq
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional
+
+from hotel_sena.servicio import ErrorNoEncontrado, ServicioHotel
+from hotel_sena.servidor_http import json_pago, json_reserva
+
+
+# ---------------------------------------------------------
+# Operaciones que ejecuta cada sede (en su proceso)
+# ---------------------------------------------------------
+def _cliente_en_sede(servicio: ServicioHotel, datos: Dict):
+    """El cliente de la sede con ese correo; si no existe, se registra."""
+    correo = str(datos.get("correo", "")).strip().lower()
+    cliente = servicio.clientes.primero("correo", correo)
+    if cliente is None:
+        cliente = servicio.registrar_cliente(datos.get("nombre", ""), correo, datos.get("telefono", ""))
+    return cliente
+
+
+def _registrar_habitacion(servicio: ServicioHotel, tipo: str, precio) -> Dict:
+    return servicio.registrar_habitacion(tipo, precio).to_dict()
+
+
+def _disponibilidad(servicio: ServicioHotel, fecha_ingreso: str, fecha_salida: str,
+                    tipo: Optional[str]) -> List[Dict]:
+    libres = [dict(h.to_dict(), precio_total=total)
+              for h, total in servicio.cotizar_disponibles(fecha_ingreso, fecha_salida, tipo)]
+    return sorted(libres, key=lambda h: (h["precio_total"], h["id_habitacion"]))
+
+
+def _crear_reservacion(servicio: ServicioHotel, cliente: Dict, id_habitacion: int, fecha_ingreso: str,
+                       fecha_salida: str) -> Dict:
+    with servicio.candado:
+        id_cliente = _cliente_en_sede(servicio, cliente).id_cliente
+        return json_reserva(servicio.crear_reservacion(id_cliente, id_habitacion, fecha_ingreso, fecha_salida))
+
+
+def _cancelar_reservacion(servicio: ServicioHotel, id_reserva: int) -> Dict:
+    return json_reserva(servicio.cancelar_reservacion(id_reserva))
+
+
+def _procesar_pago(servicio: ServicioHotel, id_reserva: int, metodo: str, clave: Optional[str]) -> Dict:
+    return json_pago(servicio.procesar_pago(id_reserva, metodo, clave))
+
+
+def _historial_cliente(servicio: ServicioHotel, correo: str) -> List[Dict]:
+    cliente = servicio.clientes.primero("correo", str(correo).strip().lower())
+    if cliente is None:
+        return []
+    reservas = servicio.listar_reservaciones(id_cliente=cliente.id_cliente, orden="ingreso")
+    return [json_reserva(r) for r in reservas]
+
+
+def _resumen(servicio: ServicioHotel) -> Dict[str, int]:
+    return {
+        "clientes": len(servicio.clientes),
+        "habitaciones": len(servicio.habitaciones),
+        "reservas": len(servicio.reservas),
+        "pagos": len(servicio.pagos),
+    }
+
+
+_OPERACIONES = {
+    "registrar_habitacion": _registrar_habitacion,
+    "disponibilidad": _disponibilidad,
+    "crear_reservacion": _crear_reservacion,
+    "cancelar_reservacion": _cancelar_reservacion,
+    "procesar_pago": _procesar_pago,
+    "historial_cliente": _historial_cliente,
+    "resumen": _resumen,
+}
+
+
+def _transportable(error: Exception) -> Exception:
+    """Los errores esperados viajan tal cual; el resto, como RuntimeError con su descripción."""
+    if isinstance(error, (ValueError, ErrorNoEncontrado)):
+        return error
+    return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+# Servicio de la sede que atiende este proceso (lo crea `_iniciar_sede`)
+_servicio: Optional[ServicioHotel] = None
+
+
+def _iniciar_sede(directorio: str) -> None:
+    """Inicializador del trabajador de una sede."""
+    global _servicio
+    _servicio = ServicioHotel(directorio)
+
+
+def _cargar() -> Dict[str, int]:
+    try:
+        return _servicio.cargar()
+    except Exception as e:
+        raise _transportable(e)
+
+
+def _cerrar() -> None:
+    _servicio.cerrar()
+
+
+def _ejecutar(operacion: str, *args):
+    """Corre una operación de `_OPERACIONES` en el proceso de la sede."""
+    try:
+        _servicio.avanzar_estancias()  # ingresos y salidas vencidos (ver agenda.py)
+        return _OPERACIONES[operacion](_servicio, *args)
+    except Exception as e:
+        raise _transportable(e)
+
+
+# ---------------------------------------------------------
+# Enrutador
+# ---------------------------------------------------------
+class EnrutadorSedes:
+    """Arranca un pool de un proceso por sede y le envía las operaciones que le corresponden."""
+
+    def __init__(self, sedes: Iterable[str], directorio: str = "data/sedes"):
+        self.sedes = list(dict.fromkeys(s.strip().lower() for s in sedes))
+        if not self.sedes:
+            raise ValueError("Indique al menos una sede.")
+        for sede in self.sedes:
+            if not re.fullmatch(r"[a-z0-9_-]+", sede):
+                raise ValueError(f"Nombre de sede no válido: '{sede}' (use letras, números, '-' o '_').")
+        self.directorio = directorio
+        self.cargados: Dict[str, Dict[str, int]] = {}
+        self._pools: Dict[str, ProcessPoolExecutor] = {}
+
+    # ----------------------------------------------------------
+    # Ciclo de vida
+    # ----------------------------------------------------------
+    def iniciar(self) -> Dict[str, Dict[str, int]]:
+        """Arranca las sedes (cargan sus datos en paralelo) y devuelve lo que cargó cada una."""
+        contexto = multiprocessing.get_context("spawn")  # cada sede empieza con el proceso limpio
+        for sede in self.sedes:
+            self._pools[sede] = ProcessPoolExecutor(1, mp_context=contexto, initializer=_iniciar_sede,
+                                                    initargs=(os.path.join(self.directorio, sede),))
+        try:
+            futuros = {sede: pool.submit(_cargar) for sede, pool in self._pools.items()}
+            for sede, futuro in futuros.items():
+                self.cargados[sede] = futuro.result()
+        except BaseException:
+            self.cerrar()
+            raise
+        return self.cargados
+
+    def cerrar(self, espera: float = 10.0) -> None:
+        """Pide a cada sede que haga su punto de control y apaga los pools."""
+        futuros = []
+        for pool in self._pools.values():
+            try:
+                futuros.append(pool.submit(_cerrar))
+            except RuntimeError:  # pool roto o ya apagado
+                pass
+        wait(futuros, timeout=espera)
+        for pool in self._pools.values():
+            pool.shutdown()
+        self._pools.clear()
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # ----------------------------------------------------------
+    # Envío de operaciones
+    # ----------------------------------------------------------
+    def _pool(self, sede: str):
+        sede = sede.strip().lower()
+        if sede not in self._pools:
+            raise ErrorNoEncontrado(f"Sede '{sede}' no encontrada.")
+        return sede, self._pools[sede]
+
+    def llamar(self, sede: str, operacion: str, *args):
+        """Ejecuta una operación en el proceso de una sede y devuelve su resultado."""
+        if operacion not in _OPERACIONES:
+            raise ValueError(f"Operación '{operacion}' no válida.")
+        _, pool = self._pool(sede)
+        return pool.submit(_ejecutar, operacion, *args).result()
+
+    def difundir(self, operacion: str, *args, sedes: Iterable[str] = None) -> Dict[str, object]:
+        """
+        Ejecuta la operación en varias sedes (todas por defecto) a la vez:
+        envía a todas y después junta las respuestas. Si alguna falla, se
+        lanza su error después de recibir las demás.
+        """
+        if operacion not in _OPERACIONES:
+            raise ValueError(f"Operación '{operacion}' no válida.")
+        elegidas = dict(self._pool(s) for s in (self.sedes if sedes is None else sedes))
+        futuros = {sede: pool.submit(_ejecutar, operacion, *args) for sede, pool in elegidas.items()}
+        wait(futuros.values())
+        return {sede: futuro.result() for sede, futuro in futuros.items()}
+
+    # ----------------------------------------------------------
+    # Operaciones de una sede
+    # ----------------------------------------------------------
+    def registrar_habitacion(self, sede: str, tipo: str, precio) -> Dict:
+        return dict(self.llamar(sede, "registrar_habitacion", tipo, precio), sede=sede)
+
+    def crear_reservacion(self, sede: str, cliente: Dict, id_habitacion: int, fecha_ingreso: str,
+                          fecha_salida: str) -> Dict:
+        """`cliente` trae nombre, correo y teléfono (se registra en la sede si hace falta)."""
+        reserva = self.llamar(sede, "crear_reservacion", cliente, id_habitacion, fecha_ingreso, fecha_salida)
+        return dict(reserva, sede=sede)
+
+    def cancelar_reservacion(self, sede: str, id_reserva: int) -> Dict:
+        return dict(self.llamar(sede, "cancelar_reservacion", id_reserva), sede=sede)
+
+    def procesar_pago(self, sede: str, id_reserva: int, metodo: str, clave: Optional[str] = None) -> Dict:
+        return dict(self.llamar(sede, "procesar_pago", id_reserva, metodo, clave), sede=sede)
+
+    # ----------------------------------------------------------
+    # Consultas de toda la cadena
+    # ----------------------------------------------------------
+    def disponibilidad(self, fecha_ingreso: str, fecha_salida: str, tipo: Optional[str] = None,
+                       sedes: Iterable[str] = None) -> List[Dict]:
+        """Habitaciones libres en todas las sedes, de la más barata a la más cara."""
+        por_sede = self.difundir("disponibilidad", fecha_ingreso, fecha_salida, tipo, sedes=sedes)
+        return list(heapq.merge(
+            *([dict(h, sede=sede) for h in libres] for sede, libres in por_sede.items()),
+            key=lambda h: h["precio_total"],
+        ))
+
+    def historial_cliente(self, correo: str) -> List[Dict]:
+        """Reservaciones del cliente en toda la cadena, por fecha de ingreso."""
+        por_sede = self.difundir("historial_cliente", correo)
+        return list(heapq.merge(
+            *([dict(r, sede=sede) for r in reservas] for sede, reservas in por_sede.items()),
+            key=lambda r: r["fecha_ingreso"],
+        ))
+
+    def resumen(self) -> Dict[str, Dict[str, int]]:
+        return self.difundir("resumen")
+
+
+# ---------------------------------------------------------
+# Prueba de escalamiento
+# ---------------------------------------------------------
+def _reservar_en_sede(cadena: EnrutadorSedes, sede: str, reservas: int, habitaciones: int) -> None:
+    for i in range(reservas):
+        cliente = {"nombre": f"Huesped {sede}", "correo": f"huesped{i % 50}.{sede}@gmail.com",
+                   "telefono": "3001234567"}
+        noche = 1 + (i // habitaciones) * 2  # cada vuelta por las habitaciones ocupa dos noches nuevas
+        ingreso = time.strftime("%Y-%m-%d", time.gmtime(1893456000 + noche * 86400))
+        salida = time.strftime("%Y-%m-%d", time.gmtime(1893456000 + (noche + 1) * 86400))
+        cadena.crear_reservacion(sede, cliente, 1 + i % habitaciones, ingreso, salida)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Prueba del modo multi-sede (un proceso por sede).")
+    parser.add_argument("--sedes", type=int, default=4, help="Cantidad de sedes (procesos)")
+    parser.add_argument("--reservas", type=int, default=500, help="Reservaciones por sede")
+    parser.add_argument("--habitaciones", type=int, default=50, help="Habitaciones por sede")
+    args = parser.parse_args(argv)
+
+    nombres = [f"sede{n + 1}" for n in range(args.sedes)]
+    with tempfile.TemporaryDirectory(prefix="hotel_sena_sedes_") as directorio:
+        with EnrutadorSedes(nombres, directorio) as cadena:
+            for sede in nombres:
+                for n in range(args.habitaciones):
+                    cadena.registrar_habitacion(sede, ("Sencilla", "Doble", "Suite")[n % 3], 100000 + 1000 * n)
+
+            hilos = [threading.Thread(target=_reservar_en_sede, args=(cadena, s, args.reservas, args.habitaciones))
+                     for s in nombres]
+            inicio = time.perf_counter()
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+            segundos = time.perf_counter() - inicio
+            total = args.reservas * args.sedes
+            print(f"{args.sedes} sede(s): {total} reservaciones en {segundos:.2f} s ({total / segundos:,.0f} por segundo)")
+
+            inicio = time.perf_counter()
+            libres = cadena.disponibilidad("2030-12-01", "2030-12-05")
+            print(f"Disponibilidad en toda la cadena: {len(libres)} habitaciones en "
+                  f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+            inicio = time.perf_counter()
+            historial = cadena.historial_cliente(f"huesped0.{nombres[0]}@gmail.com")
+            print(f"Historial de un cliente: {len(historial)} reservaciones en "
+                  f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
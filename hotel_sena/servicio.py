@@ -0,0 +1,901 @@
+import os
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hotel_sena.agenda import INGRESO, AgendaEstancias
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.arranque import cargar_estado
+from hotel_sena.bitacora import Bitacora
+from hotel_sena.busqueda import IndiceBusqueda
+from hotel_sena.cache_consultas import CacheConsultas
+from hotel_sena.carga_masiva import (ResultadoImportacion, exportar_clientes, exportar_habitaciones,
+                          exportar_reservaciones, importar_clientes, importar_habitaciones,
+                          importar_reservaciones)
+from hotel_sena.Cliente import Cliente
+from hotel_sena.Habitaciones import Habitacion
+from hotel_sena.libro_pagos import MovimientoPago, conciliar
+from hotel_sena.lista_espera import PENDIENTES, ListaEspera, SolicitudEspera
+from hotel_sena.listados import filtrar_clientes, filtrar_habitaciones, filtrar_reservaciones, pagina as pagina_de
+from hotel_sena.metricas import medido
+from hotel_sena.Pagos import Pago
+from hotel_sena.procesador_pagos import ProcesadorPagos
+from hotel_sena.registro import RegistroClientes, RegistroHabitaciones, RegistroPagos, RegistroReservas
+from hotel_sena.reservacion import Reservacion
+from hotel_sena.disponibilidad import IndiceDisponibilidad, a_ordinal
+from hotel_sena.eventos import CanalEventos
+from hotel_sena.tarifas import MotorTarifas
+
+
+class ErrorNoEncontrado(LookupError):
+    """El cliente, la habitación o la reservación pedida no existe."""
+
+
+# Archivo de datos de cada tipo de objeto (ver bitacora.py)
+_ARCHIVOS = {
+    Cliente: "clientes.json",
+    Habitacion: "habitaciones.json",
+    Reservacion: "reservas.json",
+    Pago: "pagos.json",
+    MovimientoPago: "libro_pagos.json",
+    SolicitudEspera: "lista_espera.json",
+}
+
+# Sobrante "infinito" de un hueco sin reserva de ese lado (ver ServicioHotel._mejor_hueco)
+_LEJOS = 100000
+
+
+class ServicioHotel:
+    """
+    Operaciones del hotel sin interfaz (sin `input` ni `print`), para que las
+    usen tanto el menú de consola como el servidor HTTP.
+
+    Todo acceso al estado compartido pasa por un candado reentrante, así que
+    varias terminales (hilos) pueden usar la misma instancia. Los datos
+    inválidos se informan con ValueError y los IDs inexistentes con
+    ErrorNoEncontrado.
+
+    Cada cambio se anota en la bitácora (ver bitacora.py) antes de
+    devolverlo; si la escritura falla, el cambio en memoria se deshace.
+
+    El índice de disponibilidad, el motor de tarifas y el índice de
+    búsqueda de clientes son de cada instancia (se crean vacíos si no se
+    pasan), igual que los registros, y se avisan los cambios por su propio
+    canal de eventos: dos servicios en el mismo proceso no se mezclan.
+    """
+
+    def __init__(self, directorio: str = "data", procesador: ProcesadorPagos = None,
+                 punto_control_cada: int = 1000, reloj: Callable[[], date] = date.today,
+                 indice: IndiceDisponibilidad = None, tarifas: MotorTarifas = None,
+                 busqueda: IndiceBusqueda = None):
+        self.directorio = directorio
+        self.indice = indice or IndiceDisponibilidad(CanalEventos())
+        self.eventos = self.indice.canal
+        self.tarifas = tarifas or MotorTarifas(self.indice)
+        if self.tarifas.indice is not self.indice:
+            raise ValueError("El motor de tarifas debe usar el índice de disponibilidad del servicio.")
+        self.busqueda = busqueda or IndiceBusqueda()
+        self.eventos.suscribir("cliente_registrado", self.busqueda.al_cambiar_cliente)
+        self.eventos.suscribir("cliente_actualizado", self.busqueda.al_cambiar_cliente)
+        self.clientes = RegistroClientes()
+        self.habitaciones = RegistroHabitaciones()
+        self.reservas = RegistroReservas()
+        self.pagos = RegistroPagos()
+        # Los pagos los persiste el servicio a través de la bitácora.
+        self.procesador = procesador or ProcesadorPagos(ruta_archivo=None)
+        self.bitacora = Bitacora(directorio, punto_control_cada)
+        self.cache = CacheConsultas(canal=self.eventos)
+        self.agenda = AgendaEstancias(reloj, self.eventos)
+        self.espera = ListaEspera()
+        self._cobrando = set()  # reservaciones con un pago esperando a la pasarela
+        self.candado = threading.RLock()
+
+    def _ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio, nombre)
+
+    @medido("servicio.cargar")
+    def cargar(self) -> Dict[str, int]:
+        """
+        Recupera el estado persistido: primero reaplica lo que haya quedado
+        en la bitácora y luego carga los archivos de datos (ver
+        arranque.cargar_estado), la lista de espera y las reglas de tarifas
+        y los cupos de prioridad de la lista de espera, si existen.
+        """
+        with self.candado:
+            self.bitacora.recuperar()
+            if os.path.exists(self._ruta("tarifas.json")):
+                self.tarifas.cargar_reglas(self._ruta("tarifas.json"))
+            if os.path.exists(self._ruta("prioridad_espera.json")):
+                self.espera.cargar_prioridad(self._ruta("prioridad_espera.json"))
+            cargados = cargar_estado(self.clientes, self.habitaciones, self.reservas, self.pagos, self.directorio,
+                                     self.indice, self.busqueda)
+            self.espera.cargar(obtener_almacen(self._ruta("lista_espera.json")).cargar())
+            cargados["espera"] = len(self.espera)
+            return cargados
+
+    def cerrar(self) -> None:
+        """Punto de control final: deja los archivos de datos al día y la bitácora vacía."""
+        with self.candado:
+            self.bitacora.cerrar()
+
+    def _anotar(self, *objetos) -> None:
+        """Anota la versión actual de los objetos como una sola entrada de la bitácora."""
+        self.bitacora.anotar((_ARCHIVOS[type(o)], o.to_dict()) for o in objetos)
+
+    def _anotar_reservas(self, reservas: List[Reservacion], *otros) -> None:
+        """
+        Anota reservaciones nuevas o modificadas junto con los demás objetos
+        del cambio, dentro de `reservando` del almacén de reservas: con un
+        backend compartido entre procesos (ver almacen_sqlite.py) el cruce
+        de fechas con lo que escribieron los demás se verifica ahí, y si lo
+        hay se lanza ValueError sin anotar nada.
+        """
+        almacen = obtener_almacen(self._ruta("reservas.json"))
+        with almacen.reservando([reserva.to_dict() for reserva in reservas]):
+            self._anotar(*reservas, *otros)
+
+    # ----------------------------------------------------------
+    # Altas
+    # ----------------------------------------------------------
+    @medido("servicio.registrar_cliente")
+    def registrar_cliente(self, nombre: str, correo: str, telefono) -> Cliente:
+        with self.candado:
+            cliente = Cliente(self.clientes.siguiente_id(), nombre, correo, telefono, self.eventos)
+            try:
+                self._anotar(cliente)
+            except Exception:
+                self.busqueda.quitar(cliente.id_cliente)
+                raise
+            self.clientes.agregar(cliente)
+            return cliente
+
+    @medido("servicio.actualizar_cliente")
+    def actualizar_cliente(self, id_cliente: int, nombre: str = None, correo: str = None,
+                           telefono=None) -> Cliente:
+        """
+        Cambia los datos indicados del cliente (los vacíos no se tocan) y
+        mantiene al día sus índices por correo y teléfono y la búsqueda.
+        """
+        with self.candado:
+            cliente = self.obtener_cliente(id_cliente)
+            anteriores = (cliente.nombre, cliente.correo, cliente.telefono)
+            cliente.actualizar_info(nombre, correo, telefono, mostrar=False, canal=self.eventos)
+            try:
+                self._anotar(cliente)
+            except Exception:
+                cliente.nombre, cliente.correo, cliente.telefono = anteriores
+                self.busqueda.al_cambiar_cliente(cliente)
+                raise
+            self.clientes.reindexar(cliente)
+            return cliente
+
+    @medido("servicio.registrar_habitacion")
+    def registrar_habitacion(self, tipo: str, precio) -> Habitacion:
+        tipo = str(tipo).strip().capitalize()
+        if not tipo:
+            raise ValueError("El tipo de habitación no puede estar vacío.")
+        try:
+            precio = float(precio)
+        except (TypeError, ValueError):
+            raise ValueError("El precio debe ser un número válido.")
+        if precio < 0:
+            raise ValueError("El precio no puede ser negativo.")
+
+        with self.candado:
+            habitacion = Habitacion(self.habitaciones.siguiente_id(), tipo, precio)
+            self._anotar(habitacion)
+            self.habitaciones.agregar(habitacion)
+            self.indice.agregar_habitacion(habitacion)
+            return habitacion
+
+    @medido("servicio.cambiar_estado_habitacion")
+    def cambiar_estado_habitacion(self, id_habitacion: int, estado: str) -> Habitacion:
+        estado = str(estado).strip().lower()
+        if estado not in Habitacion.ESTADOS_VALIDOS:
+            raise ValueError(f"Estado '{estado}' no válido. Opciones: {', '.join(sorted(Habitacion.ESTADOS_VALIDOS))}.")
+        with self.candado:
+            habitacion = self.obtener_habitacion(id_habitacion)
+            anterior, habitacion.estado = habitacion.estado, estado
+            try:
+                self._anotar(habitacion)
+            except Exception:
+                habitacion.estado = anterior
+                raise
+            return habitacion
+
+    # ----------------------------------------------------------
+    # Reservaciones
+    # ----------------------------------------------------------
+    @medido("servicio.habitaciones_disponibles")
+    def habitaciones_disponibles(self, fecha_ingreso: str, fecha_salida: str,
+                                 tipo: Optional[str] = None) -> List[Habitacion]:
+        with self.candado:
+            return self.cache.disponibilidad(
+                fecha_ingreso, fecha_salida, tipo,
+                lambda: self.indice.habitaciones_disponibles(fecha_ingreso, fecha_salida, tipo),
+            )
+
+    @medido("servicio.cotizar")
+    def cotizar(self, id_habitacion: int, fecha_ingreso: str, fecha_salida: str) -> float:
+        """Precio total de la estadía según las tarifas vigentes."""
+        with self.candado:
+            habitacion = self.obtener_habitacion(id_habitacion)
+            return self._cotizar(habitacion, fecha_ingreso, fecha_salida)
+
+    @medido("servicio.cotizar_disponibles")
+    def cotizar_disponibles(self, fecha_ingreso: str, fecha_salida: str,
+                            tipo: Optional[str] = None) -> List[Tuple[Habitacion, float]]:
+        """Habitaciones libres con el precio total de la estadía en cada una."""
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        with self.candado:
+            return [(h, self._cotizar(h, ingreso, salida))
+                    for h in self.habitaciones_disponibles(ingreso, salida, tipo)]
+
+    def _cotizar(self, habitacion: Habitacion, fecha_ingreso, fecha_salida) -> float:
+        return self.cache.cotizacion(
+            habitacion, fecha_ingreso, fecha_salida,
+            lambda: self.tarifas.cotizar_habitacion(habitacion, fecha_ingreso, fecha_salida),
+        )
+
+    @medido("servicio.crear_reservacion")
+    def crear_reservacion(self, id_cliente: int, id_habitacion: int, fecha_ingreso: str,
+                          fecha_salida: str) -> Reservacion:
+        """Crea la reservación si la habitación está libre en esas fechas."""
+        with self.candado:
+            cliente = self.obtener_cliente(id_cliente)
+            habitacion = self.obtener_habitacion(id_habitacion)
+            estados = {habitacion.id_habitacion: (habitacion, habitacion.estado)}
+            reserva = Reservacion(
+                id_reserva=self.reservas.siguiente_id(),
+                cliente=cliente,
+                habitacion=habitacion,
+                fecha_ingreso=fecha_ingreso,
+                fecha_salida=fecha_salida,
+                precio=habitacion.precio,
+                precio_total=self._cotizar(habitacion, fecha_ingreso, fecha_salida),
+                indice=self.indice,
+            )
+            try:
+                self.reservas.agregar(reserva)
+                cliente.registrar_reserva(reserva.id_reserva, mostrar=False)
+                self._anotar_reservas([reserva], habitacion)
+            except Exception:
+                self._deshacer_reservas([reserva], estados)
+                raise
+            return reserva
+
+    @medido("servicio.reservar_grupo")
+    def reservar_grupo(self, solicitudes: List[Dict]) -> List[Reservacion]:
+        """
+        Reserva varias habitaciones de una vez, todo o nada.
+
+        Cada solicitud es un diccionario con id_cliente, tipo, cantidad (1 si
+        se omite), fecha_ingreso y fecha_salida. Primero se valida todo y se
+        asignan las habitaciones (un recorrido por las habitaciones de cada
+        tipo, teniendo en cuenta las ya asignadas dentro del mismo grupo);
+        si alguna solicitud no se puede cumplir se lanza ValueError sin haber
+        tocado nada. Después se crean las reservaciones y se anotan en la
+        bitácora como una sola entrada; si algo falla en ese paso se deshace
+        todo.
+        """
+        if not solicitudes:
+            raise ValueError("La reservación de grupo no tiene solicitudes.")
+
+        with self.candado:
+            # 1. Validar
+            pedidos = []
+            for n, solicitud in enumerate(solicitudes, start=1):
+                try:
+                    cliente = self.obtener_cliente(int(solicitud["id_cliente"]))
+                    tipo = str(solicitud["tipo"]).strip()
+                    cantidad = int(solicitud.get("cantidad", 1))
+                    ingreso = a_ordinal(solicitud["fecha_ingreso"])
+                    salida = a_ordinal(solicitud["fecha_salida"])
+                except KeyError as e:
+                    raise ValueError(f"Solicitud {n}: falta el campo {e}.")
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Solicitud {n}: {e}")
+                if cantidad < 1:
+                    raise ValueError(f"Solicitud {n}: la cantidad debe ser al menos 1.")
+                if salida <= ingreso:
+                    raise ValueError(f"Solicitud {n}: la fecha de salida debe ser posterior a la de ingreso.")
+                pedidos.append((n, cliente, tipo, cantidad, ingreso, salida))
+
+            # 2. Asignar habitaciones sin modificar nada
+            asignadas: Dict[int, List] = {}  # id_habitacion -> [(ingreso, salida)] tomados por el grupo
+            plan = []
+            for n, cliente, tipo, cantidad, ingreso, salida in pedidos:
+                elegidas = []
+                for habitacion in self.indice.habitaciones_de_tipo(tipo):
+                    tomadas = asignadas.get(habitacion.id_habitacion, ())
+                    if (self.indice.esta_libre(habitacion.id_habitacion, ingreso, salida)
+                            and all(salida <= a or b <= ingreso for a, b in tomadas)):
+                        elegidas.append(habitacion)
+                        if len(elegidas) == cantidad:
+                            break
+                if len(elegidas) < cantidad:
+                    raise ValueError(
+                        f"Solicitud {n}: solo hay {len(elegidas)} habitación(es) '{tipo}' libres "
+                        f"de las {cantidad} pedidas en esas fechas."
+                    )
+                for habitacion in elegidas:
+                    asignadas.setdefault(habitacion.id_habitacion, []).append((ingreso, salida))
+                    plan.append((cliente, habitacion, ingreso, salida))
+
+            # 3. Confirmar todo junto (o deshacer)
+            creadas, estados = [], {}
+            try:
+                for cliente, habitacion, ingreso, salida in plan:
+                    estados.setdefault(habitacion.id_habitacion, (habitacion, habitacion.estado))
+                    fecha_ingreso = date.fromordinal(ingreso).isoformat()
+                    fecha_salida = date.fromordinal(salida).isoformat()
+                    reserva = Reservacion(
+                        id_reserva=self.reservas.siguiente_id(),
+                        cliente=cliente,
+                        habitacion=habitacion,
+                        fecha_ingreso=fecha_ingreso,
+                        fecha_salida=fecha_salida,
+                        precio=habitacion.precio,
+                        precio_total=self._cotizar(habitacion, ingreso, salida),
+                        indice=self.indice,
+                    )
+                    creadas.append(reserva)
+                    self.reservas.agregar(reserva)
+                    cliente.registrar_reserva(reserva.id_reserva, mostrar=False)
+                self._anotar_reservas(creadas, *(habitacion for habitacion, _ in estados.values()))
+            except Exception:
+                self._deshacer_reservas(creadas, estados)
+                raise
+            return creadas
+
+    def _deshacer_reservas(self, creadas: List[Reservacion], estados: Dict) -> None:
+        """Quita reservaciones recién creadas y devuelve las habitaciones a su estado anterior."""
+        for reserva in reversed(creadas):
+            self.indice.liberar(reserva.habitacion.id_habitacion, reserva.ingreso,
+                                reserva.salida, reserva.id_reserva)
+            self.reservas.quitar(reserva.id_reserva)
+            if reserva.id_reserva in reserva.cliente.reservas:
+                reserva.cliente.reservas.remove(reserva.id_reserva)
+        for habitacion, estado in estados.values():
+            habitacion.estado = estado
+
+    @medido("servicio.cancelar_reservacion")
+    def cancelar_reservacion(self, id_reserva: int) -> Reservacion:
+        """Cancela la reservación y ofrece las noches liberadas a la lista de espera."""
+        with self.candado:
+            reserva = self.obtener_reserva(id_reserva)
+            habitacion = reserva.habitacion
+            estado_habitacion = habitacion.estado
+            if reserva.estado == "pagada" or id_reserva in self._cobrando:
+                raise ValueError(f"La reservación #{id_reserva} ya tiene un pago; no se puede cancelar.")
+            if not reserva.cancelar(mostrar=False, indice=self.indice):
+                raise ValueError(f"La reservación #{id_reserva} no está activa.")
+            try:
+                self._anotar_reservas([reserva], habitacion)
+            except Exception:
+                reserva.estado = "activa"
+                habitacion.estado = estado_habitacion
+                self.indice.registrar(habitacion, reserva.ingreso, reserva.salida, reserva.id_reserva)
+                raise
+            try:
+                self._atender_espera(habitacion, reserva.ingreso, reserva.salida)
+            except OSError:
+                pass  # la cancelación ya quedó anotada; la espera se atiende en el próximo reacomodo
+            return reserva
+
+    # ----------------------------------------------------------
+    # Lista de espera
+    # ----------------------------------------------------------
+    @medido("servicio.solicitar_habitacion")
+    def solicitar_habitacion(self, id_cliente: int, tipo: str, fecha_ingreso: str, fecha_salida: str):
+        """
+        Reserva una habitación cualquiera de `tipo` o, si no hay lugar, anota
+        la solicitud en la lista de espera (ver lista_espera.py).
+
+        Se elige la habitación libre que deja el hueco más chico alrededor
+        de la estadía, para no partir los huecos grandes. Si ninguna está
+        libre, se prueba despejar una moviendo a otras habitaciones del
+        mismo tipo las reservaciones que estorban (ver `_ubicar`). Si
+        tampoco se puede, la solicitud queda como "prioritaria" si el tipo
+        tiene cupo en todas sus noches, o como "espera".
+
+        Devuelve la Reservacion creada o la SolicitudEspera anotada.
+        """
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        if salida <= ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+        with self.candado:
+            cliente = self.obtener_cliente(id_cliente)
+            habitaciones = self.indice.habitaciones_de_tipo(str(tipo))
+            if not habitaciones:
+                raise ValueError(f"No hay habitaciones de tipo '{tipo}'.")
+            lugar = self._ubicar(habitaciones, ingreso, salida)
+            if lugar is not None:
+                return self._reservar_ubicada(cliente, *lugar, ingreso, salida)
+            solicitud = self.espera.nueva(cliente.id_cliente, habitaciones[0].tipo, ingreso, salida)
+            try:
+                self._anotar(solicitud)
+            except Exception:
+                self.espera.quitar(solicitud)
+                raise
+            return solicitud
+
+    @medido("servicio.reacomodar_espera")
+    def reacomodar_espera(self, tipo: Optional[str] = None) -> Dict[str, List]:
+        """
+        Recorre las solicitudes pendientes (del tipo, si se da), prioritarias
+        primero, e intenta ubicar cada una como en `solicitar_habitacion`.
+        Las que ya pasaron su fecha de ingreso quedan "vencidas". Devuelve
+        {"asignadas": [Reservacion], "vencidas": [SolicitudEspera]}.
+        """
+        with self.candado:
+            hoy = self.agenda.hoy()
+            resultado = {"asignadas": [], "vencidas": []}
+            for solicitud in self.espera.pendientes(tipo):
+                if solicitud.ingreso < hoy:
+                    self._cerrar_espera(solicitud, "vencida")
+                    resultado["vencidas"].append(solicitud)
+                    continue
+                habitaciones = self.indice.habitaciones_de_tipo(solicitud.tipo)
+                lugar = self._ubicar(habitaciones, solicitud.ingreso, solicitud.salida)
+                if lugar is not None:
+                    cliente = self.obtener_cliente(solicitud.id_cliente)
+                    resultado["asignadas"].append(
+                        self._reservar_ubicada(cliente, *lugar, solicitud.ingreso, solicitud.salida, solicitud)
+                    )
+            return resultado
+
+    @medido("servicio.retirar_espera")
+    def retirar_espera(self, id_espera: int) -> SolicitudEspera:
+        """El cliente ya no quiere la habitación: la solicitud sale de la lista."""
+        with self.candado:
+            solicitud = self.obtener_espera(id_espera)
+            if solicitud.estado not in PENDIENTES:
+                raise ValueError(f"La solicitud #{id_espera} ya no está en espera ({solicitud.estado}).")
+            self._cerrar_espera(solicitud, "retirada")
+            return solicitud
+
+    def configurar_prioridad(self, tipo: str, cantidad: int) -> None:
+        """Cupo de solicitudes prioritarias por noche de un tipo (no se guarda; ver data/prioridad_espera.json)."""
+        with self.candado:
+            self.espera.configurar_prioridad(tipo, cantidad)
+
+    def _cerrar_espera(self, solicitud: SolicitudEspera, estado: str) -> None:
+        anterior = solicitud.estado
+        self.espera.cerrar(solicitud, estado)
+        try:
+            self._anotar(solicitud)
+        except Exception:
+            self.espera.reabrir(solicitud, anterior)
+            raise
+
+    def _atender_espera(self, habitacion: Habitacion, ingreso: int, salida: int) -> List[Reservacion]:
+        """
+        Ofrece a la lista de espera el hueco que quedó libre en la habitación
+        alrededor de [ingreso, salida). Se ubica la solicitud que mejor lo
+        llena (ver ListaEspera.mejor) y se repite con lo que sobra a cada
+        lado, hasta que no entre ninguna más.
+        """
+        if not len(self.espera):
+            return []
+        hoy = self.agenda.hoy()
+        anterior, siguiente = self.indice.hueco(habitacion.id_habitacion, ingreso, salida)
+        tramos = [(hoy if anterior is None else max(anterior, hoy), siguiente)]
+        asignadas = []
+        while tramos:
+            desde, hasta = tramos.pop()
+            if hasta is not None and hasta <= desde:
+                continue
+            solicitud = self.espera.mejor(habitacion.tipo, desde, hasta)
+            if solicitud is None:
+                continue
+            cliente = self.obtener_cliente(solicitud.id_cliente)
+            asignadas.append(self._reservar_ubicada(cliente, habitacion, [], solicitud.ingreso,
+                                                    solicitud.salida, solicitud))
+            tramos += [(desde, solicitud.ingreso), (solicitud.salida, hasta)]
+        return asignadas
+
+    def _ubicar(self, habitaciones: List[Habitacion], ingreso: int, salida: int):
+        """
+        Lugar para una estadía en alguna de las habitaciones (todas del mismo
+        tipo): (habitación, cambios) o None, donde cambios es la lista de
+        (reservación, habitación destino) que hay que mover antes.
+
+        Primero se busca una habitación libre (la de hueco más chico). Si no
+        hay, se prueba cada habitación empezando por la que tiene menos
+        reservaciones en el rango: si todas se pueden mover a otras
+        habitaciones libres en sus fechas, esa habitación sirve. Solo se
+        mueven reservaciones que todavía no empezaron.
+        """
+        libre = self._mejor_hueco(habitaciones, ingreso, salida)
+        if libre is not None:
+            return libre, []
+        hoy = self.agenda.hoy()
+        estorbos = {h.id_habitacion: self.indice.reservas_en(h.id_habitacion, ingreso, salida)
+                    for h in habitaciones}
+        for habitacion in sorted(habitaciones, key=lambda h: len(estorbos[h.id_habitacion])):
+            otras = [h for h in habitaciones if h is not habitacion]
+            tomadas: Dict[int, List[Tuple[int, int]]] = {}  # id_habitacion -> rangos ya prometidos
+            cambios = []
+            for inicio, fin, id_reserva in estorbos[habitacion.id_habitacion]:
+                reserva = self.reservas.obtener(id_reserva)
+                if inicio <= hoy or reserva is None or id_reserva in self._cobrando:
+                    break
+                destino = self._mejor_hueco(otras, inicio, fin, tomadas)
+                if destino is None:
+                    break
+                tomadas.setdefault(destino.id_habitacion, []).append((inicio, fin))
+                cambios.append((reserva, destino))
+            else:
+                return habitacion, cambios
+        return None
+
+    def _mejor_hueco(self, habitaciones: List[Habitacion], ingreso: int, salida: int,
+                     tomadas: Dict[int, List[Tuple[int, int]]] = None) -> Optional[Habitacion]:
+        """La habitación libre en el rango cuyo hueco libre alrededor es el más chico."""
+        mejor, menor = None, None
+        for habitacion in habitaciones:
+            id_habitacion = habitacion.id_habitacion
+            if not self.indice.esta_libre(id_habitacion, ingreso, salida):
+                continue
+            if tomadas and any(salida > a and b > ingreso for a, b in tomadas.get(id_habitacion, ())):
+                continue
+            anterior, siguiente = self.indice.hueco(id_habitacion, ingreso, salida)
+            sobrante = ((_LEJOS if anterior is None else ingreso - anterior)
+                        + (_LEJOS if siguiente is None else siguiente - salida))
+            if menor is None or sobrante < menor:
+                mejor, menor = habitacion, sobrante
+        return mejor
+
+    def _reservar_ubicada(self, cliente: Cliente, habitacion: Habitacion, cambios: List, ingreso: int,
+                          salida: int, solicitud: SolicitudEspera = None) -> Reservacion:
+        """
+        Mueve las reservaciones de `cambios` (ver `_ubicar`), crea la
+        reservación en la habitación y cierra la solicitud de espera, si la
+        hay. Todo se anota como una sola entrada de la bitácora; si falla,
+        se deshace todo.
+        """
+        estados = {habitacion.id_habitacion: (habitacion, habitacion.estado)}
+        for reserva, destino in cambios:
+            estados.setdefault(destino.id_habitacion, (destino, destino.estado))
+        estado_solicitud = solicitud.estado if solicitud is not None else None
+        movidas, creadas = [], []
+        try:
+            for reserva, destino in cambios:
+                movidas.append((reserva, reserva.habitacion))
+                self._mover(reserva, destino)
+            reserva = Reservacion(
+                id_reserva=self.reservas.siguiente_id(),
+                cliente=cliente,
+                habitacion=habitacion,
+                fecha_ingreso=date.fromordinal(ingreso).isoformat(),
+                fecha_salida=date.fromordinal(salida).isoformat(),
+                precio=habitacion.precio,
+                precio_total=self._cotizar(habitacion, ingreso, salida),
+                indice=self.indice,
+            )
+            creadas.append(reserva)
+            self.reservas.agregar(reserva)
+            cliente.registrar_reserva(reserva.id_reserva, mostrar=False)
+            cerradas = []
+            if solicitud is not None:
+                self.espera.cerrar(solicitud, "asignada", reserva.id_reserva)
+                cerradas.append(solicitud)
+            self._anotar_reservas([reserva, *(r for r, _ in movidas)], *(h for h, _ in estados.values()), *cerradas)
+        except Exception:
+            if solicitud is not None and solicitud.estado == "asignada":
+                self.espera.reabrir(solicitud, estado_solicitud)
+            self._deshacer_reservas(creadas, {})
+            for reserva, origen in reversed(movidas):
+                self._mover(reserva, origen)
+            for h, estado in estados.values():
+                h.estado = estado
+            raise
+        return reserva
+
+    def _mover(self, reserva: Reservacion, destino: Habitacion) -> None:
+        """Pasa la reservación (con sus mismas fechas y precio) a otra habitación."""
+        origen = reserva.habitacion
+        self.indice.liberar(origen.id_habitacion, reserva.ingreso, reserva.salida, reserva.id_reserva)
+        self.indice.registrar(destino, reserva.ingreso, reserva.salida, reserva.id_reserva)
+        reserva.habitacion = destino
+        self.reservas.reindexar(reserva)
+        origen.estado = self.indice.estado_segun_reservas(origen)
+        destino.estado = self.indice.estado_segun_reservas(destino)
+
+    # ----------------------------------------------------------
+    # Ingresos y salidas de huéspedes
+    # ----------------------------------------------------------
+    @medido("servicio.avanzar_estancias")
+    def avanzar_estancias(self, hasta=None) -> Dict[str, int]:
+        """
+        Aplica los ingresos y salidas programados hasta la fecha `hasta`
+        (por defecto, hoy según el reloj de la agenda; ver agenda.py):
+
+            ingreso: la habitación pasa a "ocupada".
+            salida:  la reservación queda "finalizada", sus noches se liberan
+                     y la habitación vuelve a "disponible" (o a "reservada"
+                     si tiene más reservaciones por delante).
+
+        Solo se revisan los eventos vencidos. Los cambios se anotan en la
+        bitácora como una sola entrada; si falla, se deshacen y los eventos
+        vuelven a la agenda. Devuelve cuántos ingresos y salidas se aplicaron.
+
+        `hasta` no puede ser posterior a hoy: finalizar una reservación no se
+        deshace, así que adelantar el calendario solo se hace con el reloj.
+        """
+        with self.candado:
+            hoy = self.agenda.hoy()
+            dia = hoy if hasta is None else a_ordinal(hasta)
+            if dia > hoy:
+                raise ValueError("No se pueden aplicar ingresos ni salidas de fechas futuras.")
+            aplicados = {"ingresos": 0, "salidas": 0}
+            if not self.agenda.hay_vencidos(dia):
+                return aplicados
+
+            eventos = self.agenda.vencidos(dia)
+            cambiados: Dict[int, object] = {}  # id(objeto) -> objeto, en orden de cambio
+            anteriores = []                    # (reserva, estado, habitacion, estado) para deshacer
+            try:
+                for _, evento, id_reserva, ingreso, salida in eventos:
+                    reserva = self.reservas.obtener(id_reserva)
+                    if (reserva is None or reserva.estado not in Reservacion.VIGENTES
+                            or (reserva.ingreso, reserva.salida) != (ingreso, salida)):
+                        continue  # cancelada, ya finalizada o de otro servicio
+                    habitacion = reserva.habitacion
+                    anteriores.append((reserva, reserva.estado, habitacion, habitacion.estado))
+                    if evento == INGRESO:
+                        if habitacion.ocupar():
+                            cambiados[id(habitacion)] = habitacion
+                            aplicados["ingresos"] += 1
+                        continue
+                    reserva.estado = "finalizada"
+                    self.indice.liberar(habitacion.id_habitacion, ingreso, salida, id_reserva)
+                    habitacion.liberar()
+                    habitacion.estado = self.indice.estado_segun_reservas(habitacion)
+                    cambiados[id(reserva)] = reserva
+                    cambiados[id(habitacion)] = habitacion
+                    aplicados["salidas"] += 1
+                if cambiados:
+                    self._anotar(*cambiados.values())
+            except Exception:
+                for reserva, estado_reserva, habitacion, estado_habitacion in reversed(anteriores):
+                    if reserva.estado == "finalizada" and estado_reserva in Reservacion.VIGENTES:
+                        self.indice.registrar(habitacion, reserva.ingreso, reserva.salida,
+                                              reserva.id_reserva)
+                    reserva.estado, habitacion.estado = estado_reserva, estado_habitacion
+                self.agenda.reprogramar(eventos)
+                raise
+            return aplicados
+
+    # ----------------------------------------------------------
+    # Pagos
+    # ----------------------------------------------------------
+    @medido("servicio.procesar_pago")
+    def procesar_pago(self, id_reserva: int, metodo: str, clave: Optional[str] = None) -> Pago:
+        """Cobra el total de una reservación activa (ver `procesar_pagos`)."""
+        return self.procesar_pagos([{"id_reserva": id_reserva, "metodo": metodo, "clave": clave}])[0]
+
+    @medido("servicio.procesar_pagos")
+    def procesar_pagos(self, solicitudes: List[Dict]) -> List[Pago]:
+        """
+        Cobra varias reservaciones de una vez. Cada solicitud es un
+        diccionario con id_reserva, metodo y, opcionalmente, clave.
+
+        - La clave de idempotencia la elige la terminal: si la repite (por
+          ejemplo al reintentar tras un corte), se devuelve el pago que ya
+          se hizo con esa clave en lugar de cobrar otra vez.
+        - Solo se cobran reservaciones "activa" sin otro cobro en curso; al
+          aprobarse el pago la reservación pasa a "pagada".
+        - Cada intento y cada cambio de estado queda en el libro de pagos
+          (ver libro_pagos.py). Los pagos nuevos y sus movimientos
+          "pendiente" se anotan en la bitácora en una sola entrada antes de
+          llamar a la pasarela, y los resultados en otra al terminar.
+
+        Se valida todo antes de registrar nada (ValueError si una solicitud
+        no se puede cobrar). La pasarela recibe todos los pagos juntos y se
+        llama fuera del candado para no frenar a las demás terminales.
+        """
+        if not solicitudes:
+            raise ValueError("No hay pagos para procesar.")
+
+        with self.candado:
+            resultado: List[Optional[Pago]] = []
+            nuevos: List[Pago] = []
+            por_clave: Dict[str, Pago] = {}
+            for n, solicitud in enumerate(solicitudes, start=1):
+                try:
+                    id_reserva = int(solicitud["id_reserva"])
+                    metodo = str(solicitud["metodo"])
+                except KeyError as e:
+                    raise ValueError(f"Pago {n}: falta el campo {e}.")
+                except (TypeError, ValueError):
+                    raise ValueError(f"Pago {n}: el ID de la reservación debe ser un número entero.")
+                clave = solicitud.get("clave")
+                if clave is not None:
+                    clave = str(clave).strip() or None
+                if clave is not None:
+                    previo = por_clave.get(clave) or self.pagos.primero("clave", clave)
+                    if previo is not None:
+                        if previo.id_reserva != id_reserva:
+                            raise ValueError(f"Pago {n}: la clave '{clave}' ya se usó para la "
+                                             f"reservación #{previo.id_reserva}.")
+                        resultado.append(previo)
+                        continue
+
+                reserva = self.obtener_reserva(id_reserva)
+                if reserva.estado == "pagada":
+                    raise ValueError(f"Pago {n}: la reservación #{id_reserva} ya está pagada.")
+                if reserva.estado != "activa":
+                    raise ValueError(f"Pago {n}: la reservación #{id_reserva} no está activa.")
+                if id_reserva in self._cobrando or any(p.id_reserva == id_reserva for p in nuevos):
+                    raise ValueError(f"Pago {n}: la reservación #{id_reserva} ya tiene un cobro en curso.")
+                pago = Pago(self.pagos.siguiente_id(), reserva.calcular_precio_total(), metodo, id_reserva, clave)
+                nuevos.append(pago)
+                resultado.append(pago)
+                if clave is not None:
+                    por_clave[clave] = pago
+
+            if not nuevos:
+                return resultado
+            for pago in nuevos:
+                self.pagos.agregar(pago)
+            try:
+                self._anotar(*nuevos, *(MovimientoPago(p) for p in nuevos))
+            except Exception:
+                for pago in nuevos:
+                    self.pagos.quitar(pago.id_pago)
+                raise
+            self._cobrando.update(p.id_reserva for p in nuevos)
+
+        try:
+            self.procesador.procesar_sync(nuevos)
+            with self.candado:
+                pagadas = []
+                for pago in nuevos:
+                    reserva = self.obtener_reserva(pago.id_reserva)
+                    # Si la salida del huésped llegó mientras tanto, la reservación ya está finalizada.
+                    if pago.estado == "aprobado" and reserva.estado == "activa":
+                        reserva.estado = "pagada"
+                        pagadas.append(reserva)
+                try:
+                    self._anotar(*nuevos, *pagadas, *(MovimientoPago(p) for p in nuevos))
+                except Exception:
+                    for reserva in pagadas:
+                        reserva.estado = "activa"
+                    raise
+        finally:
+            with self.candado:
+                self._cobrando.difference_update(p.id_reserva for p in nuevos)
+        return resultado
+
+    @medido("servicio.conciliar_pagos")
+    def conciliar_pagos(self) -> Dict[str, List[Dict]]:
+        """
+        Cruza el libro de pagos con las reservaciones (ver
+        libro_pagos.conciliar): estadías sin pagar, con cobros fallidos, con
+        pago doble y canceladas con pago. Primero se hace un punto de
+        control para que el libro en disco esté al día; el libro se lee en
+        flujo, sin cargarlo en memoria.
+        """
+        with self.candado:
+            self.bitacora.punto_control()
+            libro = obtener_almacen(self._ruta("libro_pagos.json"))
+            return conciliar(libro.cargar(), self.reservas.crudos())
+
+    # ----------------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------------
+    def obtener_cliente(self, id_cliente: int) -> Cliente:
+        with self.candado:
+            cliente = self.clientes.obtener(id_cliente)
+        if cliente is None:
+            raise ErrorNoEncontrado(f"Cliente #{id_cliente} no encontrado.")
+        return cliente
+
+    def obtener_habitacion(self, id_habitacion: int) -> Habitacion:
+        with self.candado:
+            habitacion = self.habitaciones.obtener(id_habitacion)
+        if habitacion is None:
+            raise ErrorNoEncontrado(f"Habitación #{id_habitacion} no encontrada.")
+        return habitacion
+
+    def obtener_reserva(self, id_reserva: int) -> Reservacion:
+        with self.candado:
+            reserva = self.reservas.obtener(id_reserva)
+        if reserva is None:
+            raise ErrorNoEncontrado(f"Reservación #{id_reserva} no encontrada.")
+        return reserva
+
+    def obtener_espera(self, id_espera: int) -> SolicitudEspera:
+        with self.candado:
+            solicitud = self.espera.obtener(id_espera)
+        if solicitud is None:
+            raise ErrorNoEncontrado(f"Solicitud de espera #{id_espera} no encontrada.")
+        return solicitud
+
+    def listar_espera(self, tipo: Optional[str] = None) -> List[SolicitudEspera]:
+        """Solicitudes pendientes (del tipo, si se da): prioritarias primero, luego por antigüedad."""
+        with self.candado:
+            return self.espera.pendientes(tipo)
+
+    @medido("servicio.buscar_clientes")
+    def buscar_clientes(self, consulta: str, limite: int = 10) -> List[Cliente]:
+        """Clientes por nombre, correo o teléfono (prefijos, sin tildes y aproximada; ver busqueda.py)."""
+        with self.candado:
+            encontrados = (self.clientes.obtener(i) for i in self.busqueda.buscar(consulta, limite))
+            return [c for c in encontrados if c is not None]
+
+    def listar_clientes(self, pagina: int = None, tamano: int = 20, **filtros) -> List[Cliente]:
+        """Clientes filtrados y ordenados (ver listados.filtrar_clientes); con `pagina`, solo esa página."""
+        with self.candado:
+            return self._listar(filtrar_clientes(self.clientes, **filtros), pagina, tamano)
+
+    def listar_habitaciones(self, pagina: int = None, tamano: int = 20, **filtros) -> List[Habitacion]:
+        with self.candado:
+            return self._listar(filtrar_habitaciones(self.habitaciones, **filtros), pagina, tamano)
+
+    def listar_reservaciones(self, pagina: int = None, tamano: int = 20, **filtros) -> List[Reservacion]:
+        with self.candado:
+            return self._listar(filtrar_reservaciones(self.reservas, **filtros), pagina, tamano)
+
+    @staticmethod
+    def _listar(elementos, numero: Optional[int], tamano: int) -> List:
+        return list(elementos) if numero is None else pagina_de(elementos, numero, tamano)
+
+    # ----------------------------------------------------------
+    # Importación y exportación en CSV / JSONL (ver carga_masiva.py)
+    # ----------------------------------------------------------
+    ENTIDADES = ("clientes", "habitaciones", "reservaciones")
+
+    @medido("servicio.importar")
+    def importar(self, entidad: str, ruta: str, tamano_lote: int = 1000,
+                 max_errores: int = 1000) -> ResultadoImportacion:
+        """
+        Importa clientes, habitaciones o reservaciones de un archivo .csv o
+        .jsonl. Las filas válidas (y las habitaciones que cambian de estado
+        por las reservaciones importadas) se anotan en la bitácora como una
+        sola entrada; si eso falla no queda ninguna. Las filas inválidas se
+        informan en el resultado.
+        """
+        with self.candado:
+            if entidad == "clientes":
+                return importar_clientes(ruta, self.clientes, self._confirmar_importacion(Cliente),
+                                         tamano_lote, max_errores, canal=self.eventos)
+            if entidad == "habitaciones":
+                return importar_habitaciones(ruta, self.habitaciones, self._confirmar_importacion(Habitacion),
+                                             tamano_lote, max_errores, indice=self.indice)
+            if entidad == "reservaciones":
+                return importar_reservaciones(ruta, self.clientes, self.habitaciones, self.reservas,
+                                              self._confirmar_importacion(Reservacion), tamano_lote,
+                                              max_errores, indice=self.indice)
+            raise ValueError(f"Entidad '{entidad}' no válida. Opciones: {', '.join(self.ENTIDADES)}.")
+
+    def _confirmar_importacion(self, clase) -> Callable:
+        archivo = _ARCHIVOS[clase]
+
+        def cambios(registros):
+            habitaciones = {}
+            for registro in registros:
+                yield archivo, registro
+                if clase is Reservacion:
+                    habitaciones.setdefault(registro["Habitación"])
+            for id_habitacion in habitaciones:
+                yield _ARCHIVOS[Habitacion], self.habitaciones.obtener(id_habitacion).to_dict()
+
+        return lambda registros: self.bitacora.anotar(cambios(registros))
+
+    @medido("servicio.exportar")
+    def exportar(self, entidad: str, ruta: str, **filtros) -> int:
+        """
+        Escribe en .csv o .jsonl los clientes, habitaciones o reservaciones
+        que pasan los filtros (los mismos de `listar_*`). Devuelve cuántos.
+        """
+        with self.candado:
+            if entidad == "clientes":
+                return exportar_clientes(self.clientes, ruta, **filtros)
+            if entidad == "habitaciones":
+                return exportar_habitaciones(self.habitaciones, ruta, **filtros)
+            if entidad == "reservaciones":
+                return exportar_reservaciones(self.reservas, ruta, **filtros)
+            raise ValueError(f"Entidad '{entidad}' no válida. Opciones: {', '.join(self.ENTIDADES)}.")
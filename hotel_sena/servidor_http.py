@@ -0,0 +1,340 @@
+"""
+Servidor HTTP/JSON del Hotel Sena (solo biblioteca estándar).
+
+Expone las operaciones de `servicio.ServicioHotel` para que varias
+terminales de recepción y el sitio web de reservas las usen a la vez.
+Cada petición se atiende en su propio hilo (`ThreadingHTTPServer`) y el
+servicio serializa el acceso al estado compartido con su candado.
+
+Rutas:
+    GET  /clientes[?texto=|?q=&limite=] GET  /clientes/<id>
+    GET  /habitaciones[?tipo=&estado=]  GET  /habitaciones/<id>
+    GET  /reservaciones[?desde=&hasta=&estado=&id_cliente=&id_habitacion=&tipo=]
+    GET  /reservaciones/<id>
+    GET  /disponibilidad?ingreso=YYYY-MM-DD&salida=YYYY-MM-DD[&tipo=]
+    GET  /metricas                      (texto de Prometheus, ver metricas.py)
+    GET  /cache                         (aciertos y fallos de la caché de consultas)
+    GET  /pagos/conciliacion            (estadías sin pagar, fallidas, con pago doble; ver libro_pagos.py)
+    GET  /espera[?tipo=]                (solicitudes pendientes; ver lista_espera.py)
+    POST /clientes                      {"nombre", "correo", "telefono"}
+    POST /clientes/<id>/datos           {"nombre", "correo", "telefono"} (solo los que cambian)
+    POST /habitaciones                  {"tipo", "precio"}
+    POST /habitaciones/<id>/estado      {"estado"}
+    POST /reservaciones                 {"id_cliente", "id_habitacion", "fecha_ingreso", "fecha_salida"}
+    POST /reservaciones/grupo           {"solicitudes": [{"id_cliente", "tipo", "cantidad",
+                                                          "fecha_ingreso", "fecha_salida"}, ...]}
+    POST /reservaciones/<id>/cancelar
+    POST /pagos                         {"id_reserva", "metodo", "clave"}   clave de idempotencia opcional
+    POST /pagos/lote                    {"pagos": [{"id_reserva", "metodo", "clave"}, ...]}
+    POST /estancias/avanzar             {"hasta"} (opcional, a lo sumo hoy; ingresos y salidas hasta esa fecha)
+    POST /espera                        {"id_cliente", "tipo", "fecha_ingreso", "fecha_salida"}
+                                        reserva cualquier habitación del tipo o anota la solicitud
+    POST /espera/<id>/retirar
+    POST /espera/reacomodar             {"tipo"} (opcional)
+
+Los listados aceptan además `orden`, `descendente`, `pagina` y `tamano`
+(ver listados.py).
+
+Un hilo aplica los ingresos y salidas de huéspedes del día (ver
+agenda.py) al arrancar y en cada cambio de día.
+
+Uso:
+    python -m hotel_sena.servidor_http --host 0.0.0.0 --puerto 8000
+"""
+import argparse
+import json
+import threading
+import traceback
+from datetime import datetime, time, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from hotel_sena import metricas
+from hotel_sena.carga_masiva import fila_reserva
+from hotel_sena.reservacion import Reservacion
+from hotel_sena.servicio import ErrorNoEncontrado, ServicioHotel
+
+
+# ---------------------------------------------------------
+# Representación JSON de los objetos del modelo
+# ---------------------------------------------------------
+def json_reserva(reserva) -> Dict:
+    datos = fila_reserva(reserva)
+    datos["precio_total"] = reserva.calcular_precio_total()
+    return datos
+
+
+def json_pago(pago) -> Dict:
+    return {
+        "id_pago": pago.id_pago,
+        "monto": pago.monto,
+        "metodo": pago.metodo_pago,
+        "estado": pago.estado,
+        "fecha": pago.fecha,
+        "id_reserva": pago.id_reserva,
+        "clave": pago.clave,
+    }
+
+
+def json_espera(solicitud) -> Dict:
+    datos = solicitud.to_dict()
+    return {
+        "id_espera": solicitud.id_espera,
+        "id_cliente": solicitud.id_cliente,
+        "tipo": solicitud.tipo,
+        "fecha_ingreso": datos["Ingreso"],
+        "fecha_salida": datos["Salida"],
+        "estado": solicitud.estado,
+        "creada": solicitud.creada,
+        "id_reserva": solicitud.id_reserva,
+    }
+
+
+def _entero(valor, campo: str) -> int:
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"El campo '{campo}' debe ser un número entero.")
+
+
+def _filtros(consulta: Dict[str, str], *permitidos: str) -> Dict:
+    """Filtros, orden y paginación de un listado a partir de la query string."""
+    filtros = {k: consulta[k] for k in permitidos if consulta.get(k)}
+    for campo in ("id_cliente", "id_habitacion"):
+        if campo in filtros:
+            filtros[campo] = _entero(filtros[campo], campo)
+    if consulta.get("orden"):
+        filtros["orden"] = consulta["orden"]
+        filtros["descendente"] = consulta.get("descendente", "").lower() in ("1", "true", "si", "sí")
+    if consulta.get("pagina"):
+        filtros["pagina"] = _entero(consulta["pagina"], "pagina")
+        filtros["tamano"] = _entero(consulta.get("tamano", 20), "tamano")
+    return filtros
+
+
+class ManejadorHotel(BaseHTTPRequestHandler):
+    """Traduce las peticiones HTTP a llamadas del servicio."""
+
+    servicio: ServicioHotel = None  # lo asigna crear_servidor
+    protocol_version = "HTTP/1.1"   # conexiones persistentes para los clientes de alto volumen
+
+    # ------------------------------------------------------
+    # Enrutamiento
+    # ------------------------------------------------------
+    def do_GET(self):
+        self._atender(self._rutas_get)
+
+    def do_POST(self):
+        self._atender(self._rutas_post)
+
+    def _atender(self, rutas) -> None:
+        url = urlsplit(self.path)
+        partes = [p for p in url.path.split("/") if p]
+        consulta = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            codigo, cuerpo = rutas(partes, consulta)
+        except ErrorNoEncontrado as e:
+            codigo, cuerpo = 404, {"error": str(e)}
+        except ValueError as e:
+            codigo, cuerpo = 400, {"error": str(e)}
+        except Exception:  # el servidor nunca debe caerse por una petición
+            # El detalle (mensajes, rutas de archivos) queda en el registro del servidor, no en la respuesta.
+            self.log_error("Error interno en %s %s", self.command, self.path)
+            traceback.print_exc()
+            codigo, cuerpo = 500, {"error": "Error interno del servidor."}
+        self._responder(codigo, cuerpo)
+
+    def _rutas_get(self, partes, consulta) -> Tuple[int, object]:
+        s = self.servicio
+        if partes == ["clientes"]:
+            if consulta.get("q"):
+                limite = _entero(consulta.get("limite", 10), "limite")
+                return 200, [c.to_dict() for c in s.buscar_clientes(consulta["q"], limite)]
+            return 200, [c.to_dict() for c in s.listar_clientes(**_filtros(consulta, "texto"))]
+        if partes == ["habitaciones"]:
+            return 200, [h.to_dict() for h in s.listar_habitaciones(**_filtros(consulta, "tipo", "estado"))]
+        if partes == ["reservaciones"]:
+            filtros = _filtros(consulta, "desde", "hasta", "estado", "id_cliente", "id_habitacion", "tipo")
+            return 200, [json_reserva(r) for r in s.listar_reservaciones(**filtros)]
+        if partes == ["disponibilidad"]:
+            if "ingreso" not in consulta or "salida" not in consulta:
+                raise ValueError("Indique las fechas 'ingreso' y 'salida' (YYYY-MM-DD).")
+            libres = s.cotizar_disponibles(consulta["ingreso"], consulta["salida"], consulta.get("tipo"))
+            return 200, [dict(h.to_dict(), precio_total=total) for h, total in libres]
+        if partes == ["metricas"]:
+            return 200, metricas.texto_prometheus()
+        if partes == ["cache"]:
+            return 200, s.cache.estadisticas()
+        if partes == ["pagos", "conciliacion"]:
+            return 200, s.conciliar_pagos()
+        if partes == ["espera"]:
+            return 200, [json_espera(x) for x in s.listar_espera(consulta.get("tipo"))]
+        if len(partes) == 2:
+            recurso, id_ = partes[0], _entero(partes[1], "id")
+            if recurso == "clientes":
+                cliente = s.obtener_cliente(id_)
+                return 200, dict(cliente.to_dict(), reservas=list(cliente.reservas))
+            if recurso == "habitaciones":
+                return 200, s.obtener_habitacion(id_).to_dict()
+            if recurso == "reservaciones":
+                return 200, json_reserva(s.obtener_reserva(id_))
+            if recurso == "espera":
+                return 200, json_espera(s.obtener_espera(id_))
+        raise ErrorNoEncontrado(f"Ruta no encontrada: {self.path}")
+
+    def _rutas_post(self, partes, consulta) -> Tuple[int, object]:
+        s = self.servicio
+        datos = self._leer_json()
+        if partes == ["clientes"]:
+            cliente = s.registrar_cliente(datos.get("nombre", ""), datos.get("correo", ""), datos.get("telefono", ""))
+            return 201, cliente.to_dict()
+        if partes == ["habitaciones"]:
+            return 201, s.registrar_habitacion(datos.get("tipo", ""), datos.get("precio")).to_dict()
+        if partes == ["reservaciones"]:
+            reserva = s.crear_reservacion(
+                _entero(datos.get("id_cliente"), "id_cliente"),
+                _entero(datos.get("id_habitacion"), "id_habitacion"),
+                str(datos.get("fecha_ingreso", "")),
+                str(datos.get("fecha_salida", "")),
+            )
+            return 201, json_reserva(reserva)
+        if partes == ["reservaciones", "grupo"]:
+            solicitudes = datos.get("solicitudes")
+            if not isinstance(solicitudes, list) or not all(isinstance(x, dict) for x in solicitudes):
+                raise ValueError("El campo 'solicitudes' debe ser una lista de objetos.")
+            return 201, [json_reserva(r) for r in s.reservar_grupo(solicitudes)]
+        if len(partes) == 3 and partes[0] == "clientes" and partes[2] == "datos":
+            cliente = s.actualizar_cliente(_entero(partes[1], "id"), datos.get("nombre"), datos.get("correo"),
+                                           datos.get("telefono"))
+            return 200, cliente.to_dict()
+        if len(partes) == 3 and partes[0] == "habitaciones" and partes[2] == "estado":
+            return 200, s.cambiar_estado_habitacion(_entero(partes[1], "id"), datos.get("estado", "")).to_dict()
+        if len(partes) == 3 and partes[0] == "reservaciones" and partes[2] == "cancelar":
+            return 200, json_reserva(s.cancelar_reservacion(_entero(partes[1], "id")))
+        if partes == ["pagos"]:
+            pago = s.procesar_pago(_entero(datos.get("id_reserva"), "id_reserva"),
+                                   str(datos.get("metodo", "")).strip().lower(), datos.get("clave"))
+            return 201, json_pago(pago)
+        if partes == ["pagos", "lote"]:
+            solicitudes = datos.get("pagos")
+            if not isinstance(solicitudes, list) or not all(isinstance(x, dict) for x in solicitudes):
+                raise ValueError("El campo 'pagos' debe ser una lista de objetos.")
+            return 201, [json_pago(p) for p in s.procesar_pagos(solicitudes)]
+        if partes == ["estancias", "avanzar"]:
+            hasta = datos.get("hasta")
+            return 200, s.avanzar_estancias(None if hasta is None else str(hasta))
+        if partes == ["espera"]:
+            resultado = s.solicitar_habitacion(
+                _entero(datos.get("id_cliente"), "id_cliente"),
+                str(datos.get("tipo", "")),
+                str(datos.get("fecha_ingreso", "")),
+                str(datos.get("fecha_salida", "")),
+            )
+            if isinstance(resultado, Reservacion):
+                return 201, {"reservacion": json_reserva(resultado)}
+            return 201, {"espera": json_espera(resultado)}
+        if partes == ["espera", "reacomodar"]:
+            resultado = s.reacomodar_espera(datos.get("tipo"))
+            return 200, {"asignadas": [json_reserva(r) for r in resultado["asignadas"]],
+                         "vencidas": [json_espera(x) for x in resultado["vencidas"]]}
+        if len(partes) == 3 and partes[0] == "espera" and partes[2] == "retirar":
+            return 200, json_espera(s.retirar_espera(_entero(partes[1], "id")))
+        raise ErrorNoEncontrado(f"Ruta no encontrada: {self.path}")
+
+    # ------------------------------------------------------
+    # Entrada / salida
+    # ------------------------------------------------------
+    def _leer_json(self) -> Dict:
+        largo = int(self.headers.get("Content-Length") or 0)
+        if not largo:
+            return {}
+        try:
+            datos = json.loads(self.rfile.read(largo).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError("El cuerpo de la petición no es JSON válido.")
+        if not isinstance(datos, dict):
+            raise ValueError("El cuerpo de la petición debe ser un objeto JSON.")
+        return datos
+
+    def _responder(self, codigo: int, cuerpo) -> None:
+        if isinstance(cuerpo, str):
+            datos, tipo = cuerpo.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            datos, tipo = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+        self.send_response(codigo)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def log_message(self, formato, *args):
+        if not self.server.silencioso:
+            super().log_message(formato, *args)
+
+    def log_error(self, formato, *args):
+        super().log_message(formato, *args)  # los errores se registran aunque el servidor sea silencioso
+
+
+class ServidorHotel(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # la cola por defecto (5) descarta conexiones bajo ráfagas de terminales
+    silencioso = False
+
+
+def crear_servidor(servicio: ServicioHotel, host: str = "127.0.0.1", puerto: int = 8000,
+                   silencioso: bool = False) -> ServidorHotel:
+    """Crea (sin arrancar) un servidor ligado al servicio. Con `puerto=0` el sistema elige uno libre."""
+    manejador = type("Manejador", (ManejadorHotel,), {"servicio": servicio})
+    servidor = ServidorHotel((host, puerto), manejador)
+    servidor.silencioso = silencioso
+    return servidor
+
+
+def avanzar_cada_dia(servicio: ServicioHotel, detener: threading.Event) -> None:
+    """Aplica los ingresos y salidas de huéspedes ahora y después de cada medianoche."""
+    while True:
+        try:
+            servicio.avanzar_estancias()
+        except Exception as e:
+            print(f"No se pudieron aplicar los ingresos y salidas del día: {e}")
+        ahora = datetime.now()
+        manana = datetime.combine(ahora.date() + timedelta(days=1), time.min)
+        # Se despierta al menos cada hora por si el reloj del sistema cambia.
+        if detener.wait(min((manana - ahora).total_seconds() + 1, 3600)):
+            return
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON del Hotel Sena.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8000)
+    parser.add_argument("--datos", default="data", help="Directorio de los archivos de datos")
+    parser.add_argument("--silencioso", action="store_true", help="No registrar cada petición en consola")
+    parser.add_argument("--metricas", action="store_true", help="Medir latencias (se consultan en GET /metricas)")
+    args = parser.parse_args(argv)
+    if args.metricas:
+        metricas.activar()
+
+    servicio = ServicioHotel(args.datos)
+    cargados = servicio.cargar()
+    print(f"Datos cargados: {cargados['clientes']} clientes, {cargados['habitaciones']} habitaciones, "
+          f"{cargados['reservas']} reservaciones, {cargados['pagos']} pagos, "
+          f"{cargados['espera']} en lista de espera.")
+
+    servidor = crear_servidor(servicio, args.host, args.puerto, args.silencioso)
+    print(f"Hotel Sena escuchando en http://{args.host}:{servidor.server_address[1]}")
+    detener = threading.Event()
+    threading.Thread(target=avanzar_cada_dia, args=(servicio, detener), name="agenda", daemon=True).start()
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+    finally:
+        detener.set()
+        servidor.server_close()
+        servicio.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Motor de tarifas dinámicas del Hotel Sena.
+
+La tarifa de una noche es el precio base de la habitación multiplicado por:
+
+    - el factor de temporada (rangos MM-DD que se repiten cada año,
+      opcionalmente solo para un tipo de habitación),
+    - el factor del día de la semana (p. ej. viernes y sábado),
+    - el factor del nivel de ocupación de ese tipo de habitación esa noche.
+
+Sobre el total de la estadía se aplica además el descuento por duración
+(el de mayor mínimo de noches que se cumpla).
+
+Para cada (tipo, precio base) se precalcula una tabla de tarifas noche a
+noche sobre un horizonte de calendario y su suma acumulada, así que
+cotizar cualquier estadía cuesta dos lecturas y una resta, sin recorrer
+sus noches. Las tablas se invalidan cuando cambia una regla, cuando
+`Habitacion.actualizar_precio` cambia un precio base o cuando una
+reserva mueve la ocupación de alguna noche a otro nivel: el motor escucha
+los eventos del canal de su índice de disponibilidad (ver eventos.py).
+
+Sin reglas configuradas la cotización es noches × precio, como antes.
+"""
+import json
+from array import array
+from bisect import bisect_right
+from datetime import date
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from hotel_sena.disponibilidad import a_ordinal, indice_disponibilidad
+from hotel_sena.metricas import contar, medido
+
+
+def _mes_dia(texto: str) -> Tuple[int, int]:
+    """'MM-DD' -> (mes, día), validando la fecha (acepta 02-29)."""
+    try:
+        mes, dia = (int(x) for x in texto.split("-"))
+        date(2000, mes, dia)
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(f"Fecha de temporada inválida: '{texto}'. Formato esperado: MM-DD.")
+    return mes, dia
+
+
+def _factor(valor) -> float:
+    try:
+        factor = float(valor)
+    except (TypeError, ValueError):
+        factor = 0.0
+    if factor <= 0:
+        raise ValueError("Los factores de tarifa deben ser números positivos.")
+    return factor
+
+
+def _clave_tipo(tipo: str) -> str:
+    return tipo.strip().lower()
+
+
+class MotorTarifas:
+    """Cotiza estadías con tablas de tarifas precalculadas por tipo de habitación."""
+
+    def __init__(self, indice=indice_disponibilidad, horizonte: int = 730, inicio=None):
+        self.indice = indice
+        self._inicio = a_ordinal(inicio) if inicio is not None else date.today().toordinal() - 30
+        self._dias = horizonte
+
+        # Reglas
+        self.temporadas: List[Tuple[Tuple[int, int], Tuple[int, int], float, Optional[str]]] = []
+        self.factores_semana: List[float] = [1.0] * 7  # lunes = 0 ... domingo = 6 (noche que empieza ese día)
+        self.descuentos_estadia: List[Tuple[int, float]] = []  # (noches mínimas, factor), ordenados
+        self.niveles_ocupacion: List[Tuple[float, float]] = []  # (ocupación mínima, factor), ordenados
+
+        # Cachés (se reconstruyen a pedido)
+        self._multiplicadores: Dict[str, array] = {}
+        self._ocupadas: Dict[str, array] = {}
+        self._totales: Dict[str, int] = {}
+        self._niveles: Dict[str, array] = {}
+        self._tablas: Dict[Tuple[str, float], array] = {}
+
+        self._suscripciones = {
+            "reserva_registrada": lambda habitacion, ingreso, salida, **_: self._mover_ocupacion(
+                habitacion.tipo, ingreso, salida, 1),
+            "reserva_liberada": lambda habitacion, ingreso, salida, **_: self._mover_ocupacion(
+                habitacion.tipo, ingreso, salida, -1),
+            "habitacion_agregada": lambda habitacion: self._olvidar_tipo(habitacion.tipo),
+            "precio_actualizado": lambda habitacion, anterior: self._tablas.pop(
+                (_clave_tipo(habitacion.tipo), float(anterior)), None),
+            "indice_reiniciado": self.invalidar,
+        }
+        for evento, funcion in self._suscripciones.items():
+            self.indice.canal.suscribir(evento, funcion)
+
+    def desconectar(self) -> None:
+        """Deja de escuchar los eventos del sistema (para motores temporales)."""
+        for evento, funcion in self._suscripciones.items():
+            self.indice.canal.desuscribir(evento, funcion)
+
+    # ----------------------------------------------------------
+    # Reglas
+    # ----------------------------------------------------------
+    def agregar_temporada(self, desde: str, hasta: str, factor: float, tipo: Optional[str] = None) -> None:
+        """Temporada de `desde` a `hasta` (MM-DD, ambos incluidos; puede cruzar el fin de año)."""
+        self.temporadas.append((_mes_dia(desde), _mes_dia(hasta), _factor(factor),
+                                _clave_tipo(tipo) if tipo else None))
+        self._reglas_cambiadas()
+
+    def definir_factor_dias(self, dias: Iterable[int], factor: float) -> None:
+        """Factor para las noches que empiezan en esos días de la semana (lunes = 0)."""
+        factor = _factor(factor)
+        for dia in dias:
+            if not 0 <= int(dia) <= 6:
+                raise ValueError("Los días de la semana van de 0 (lunes) a 6 (domingo).")
+            self.factores_semana[int(dia)] = factor
+        self._reglas_cambiadas()
+
+    def agregar_descuento_estadia(self, noches_minimas: int, factor: float) -> None:
+        """Factor sobre el total para estadías de al menos `noches_minimas` noches."""
+        if int(noches_minimas) < 1:
+            raise ValueError("El mínimo de noches debe ser al menos 1.")
+        self.descuentos_estadia.append((int(noches_minimas), _factor(factor)))
+        self.descuentos_estadia.sort()
+        self._reglas_cambiadas()
+
+    def agregar_nivel_ocupacion(self, umbral: float, factor: float) -> None:
+        """Factor para las noches en que la ocupación del tipo es de al menos `umbral` (0 a 1)."""
+        if not 0 <= float(umbral) <= 1:
+            raise ValueError("El umbral de ocupación debe estar entre 0 y 1.")
+        self.niveles_ocupacion.append((float(umbral), _factor(factor)))
+        self.niveles_ocupacion.sort()
+        self._reglas_cambiadas()
+
+    def limpiar_reglas(self) -> None:
+        self.temporadas.clear()
+        self.factores_semana = [1.0] * 7
+        self.descuentos_estadia.clear()
+        self.niveles_ocupacion.clear()
+        self._reglas_cambiadas()
+
+    def configurar(self, reglas: Dict) -> None:
+        """
+        Reemplaza las reglas con las de un diccionario como:
+
+            {"temporadas": [{"desde": "12-15", "hasta": "01-15", "factor": 1.3, "tipo": "Suite"}],
+             "dias": [{"dias": [4, 5], "factor": 1.15}],
+             "estadia": [{"noches": 7, "factor": 0.9}],
+             "ocupacion": [{"umbral": 0.8, "factor": 1.2}]}
+        """
+        self.limpiar_reglas()
+        for t in reglas.get("temporadas", []):
+            self.agregar_temporada(t["desde"], t["hasta"], t["factor"], t.get("tipo"))
+        for d in reglas.get("dias", []):
+            self.definir_factor_dias(d["dias"], d["factor"])
+        for e in reglas.get("estadia", []):
+            self.agregar_descuento_estadia(e["noches"], e["factor"])
+        for o in reglas.get("ocupacion", []):
+            self.agregar_nivel_ocupacion(o["umbral"], o["factor"])
+
+    def cargar_reglas(self, ruta: str = "data/tarifas.json") -> None:
+        with open(ruta, "r", encoding="utf-8") as f:
+            self.configurar(json.load(f))
+
+    # ----------------------------------------------------------
+    # Cotización
+    # ----------------------------------------------------------
+    @medido("tarifas.cotizar")
+    def cotizar(self, tipo: str, precio: float, fecha_ingreso, fecha_salida) -> float:
+        """Precio total de la estadía (salida exclusiva) para una habitación de ese tipo y precio base."""
+        ingreso, salida = a_ordinal(fecha_ingreso), a_ordinal(fecha_salida)
+        if salida <= ingreso:
+            raise ValueError("La fecha de salida debe ser posterior a la de ingreso.")
+        self._cubrir(ingreso, salida)
+        prefijos = self._tabla(tipo, precio)
+        total = prefijos[salida - self._inicio] - prefijos[ingreso - self._inicio]
+        return round(total * self._factor_estadia(salida - ingreso), 2)
+
+    def cotizar_habitacion(self, habitacion, fecha_ingreso, fecha_salida) -> float:
+        return self.cotizar(habitacion.tipo, habitacion.precio, fecha_ingreso, fecha_salida)
+
+    def tarifa_noche(self, tipo: str, precio: float, fecha) -> float:
+        """Tarifa de la noche que empieza en `fecha` (sin descuento por duración)."""
+        dia = a_ordinal(fecha)
+        self._cubrir(dia, dia + 1)
+        prefijos = self._tabla(tipo, precio)
+        i = dia - self._inicio
+        return round(prefijos[i + 1] - prefijos[i], 2)
+
+    # ----------------------------------------------------------
+    # Tablas precalculadas
+    # ----------------------------------------------------------
+    def invalidar(self) -> None:
+        """Descarta todas las tablas; se reconstruyen en la próxima cotización."""
+        self._multiplicadores.clear()
+        self._ocupadas.clear()
+        self._totales.clear()
+        self._niveles.clear()
+        self._tablas.clear()
+
+    def _reglas_cambiadas(self) -> None:
+        self.invalidar()
+        self.indice.canal.emitir("tarifas_actualizadas", tipo=None, desde=None, hasta=None)
+
+    def _cubrir(self, ingreso: int, salida: int) -> None:
+        """Amplía el horizonte si la estadía queda fuera de él."""
+        fin = self._inicio + self._dias
+        if ingreso >= self._inicio and salida <= fin:
+            return
+        self._inicio = min(self._inicio, ingreso)
+        self._dias = max(fin, salida) - self._inicio
+        self.invalidar()
+
+    def _factor_estadia(self, noches: int) -> float:
+        i = bisect_right(self.descuentos_estadia, (noches, float("inf")))
+        return self.descuentos_estadia[i - 1][1] if i else 1.0
+
+    def _multiplicador(self, clave: str) -> array:
+        """Temporada × día de la semana para cada noche del horizonte."""
+        mult = self._multiplicadores.get(clave)
+        if mult is not None:
+            return mult
+        temporadas = [t for t in self.temporadas if t[3] is None or t[3] == clave]
+        mult = array("d")
+        for dia in range(self._inicio, self._inicio + self._dias):
+            fecha = date.fromordinal(dia)
+            f = self.factores_semana[fecha.weekday()]
+            md = (fecha.month, fecha.day)
+            for desde, hasta, factor, _ in temporadas:
+                if (desde <= md <= hasta) if desde <= hasta else (md >= desde or md <= hasta):
+                    f *= factor
+            mult.append(f)
+        self._multiplicadores[clave] = mult
+        return mult
+
+    def _nivel(self, ocupadas: int, total: int) -> int:
+        """0 = sin recargo; k = el k-ésimo nivel de `niveles_ocupacion`."""
+        return bisect_right(self.niveles_ocupacion, (ocupadas / total, float("inf"))) if total else 0
+
+    def _niveles_de(self, clave: str) -> Optional[array]:
+        """Nivel de ocupación del tipo en cada noche (None si no hay reglas de ocupación)."""
+        if not self.niveles_ocupacion:
+            return None
+        niveles = self._niveles.get(clave)
+        if niveles is not None:
+            return niveles
+        habitaciones = self.indice.habitaciones_de_tipo(clave)
+        dif = [0] * (self._dias + 1)
+        for h in habitaciones:
+            for ingreso, salida, _ in self.indice.reservas_de(h.id_habitacion):
+                a = min(max(ingreso - self._inicio, 0), self._dias)
+                b = min(max(salida - self._inicio, 0), self._dias)
+                dif[a] += 1
+                dif[b] -= 1
+        ocupadas = array("i", accumulate(dif[:self._dias]))
+        self._ocupadas[clave] = ocupadas
+        self._totales[clave] = len(habitaciones)
+        self._niveles[clave] = niveles = array("b", (self._nivel(n, len(habitaciones)) for n in ocupadas))
+        return niveles
+
+    def _tabla(self, tipo: str, precio: float) -> array:
+        """Suma acumulada de las tarifas por noche: prefijos[i] = total de las noches 0..i-1."""
+        clave = _clave_tipo(tipo)
+        llave = (clave, float(precio))
+        prefijos = self._tablas.get(llave)
+        if prefijos is not None:
+            return prefijos
+        mult = self._multiplicador(clave)
+        niveles = self._niveles_de(clave)
+        if niveles is None:
+            noches = (round(precio * m, 2) for m in mult)
+        else:
+            factores = [1.0] + [f for _, f in self.niveles_ocupacion]
+            noches = (round(precio * m * factores[n], 2) for m, n in zip(mult, niveles))
+        prefijos = self._tablas[llave] = array("d", accumulate(noches, initial=0.0))
+        contar("tarifas.tablas_construidas")
+        return prefijos
+
+    # ----------------------------------------------------------
+    # Eventos del sistema
+    # ----------------------------------------------------------
+    def _olvidar_tipo(self, tipo: str) -> None:
+        """Cambió la cantidad de habitaciones del tipo: la ocupación se recalcula."""
+        clave = _clave_tipo(tipo)
+        self._ocupadas.pop(clave, None)
+        self._totales.pop(clave, None)
+        if self._niveles.pop(clave, None) is not None:
+            self._descartar_tablas(clave)
+            self.indice.canal.emitir("tarifas_actualizadas", tipo=clave, desde=None, hasta=None)
+
+    def _mover_ocupacion(self, tipo: str, ingreso: int, salida: int, delta: int) -> None:
+        """
+        Actualiza la ocupación de las noches de una reserva. Las tablas del
+        tipo solo se descartan si alguna noche cambia de nivel.
+        """
+        clave = _clave_tipo(tipo)
+        ocupadas = self._ocupadas.get(clave)
+        if ocupadas is None:
+            return
+        niveles = self._niveles[clave]
+        total = self._totales[clave]
+        primera = ultima = None  # noches que cambiaron de nivel
+        for i in range(max(ingreso - self._inicio, 0), min(salida - self._inicio, self._dias)):
+            ocupadas[i] += delta
+            nivel = self._nivel(ocupadas[i], total)
+            if nivel != niveles[i]:
+                niveles[i] = nivel
+                if primera is None:
+                    primera = i
+                ultima = i
+        if primera is not None:
+            self._descartar_tablas(clave)
+            self.indice.canal.emitir("tarifas_actualizadas", tipo=clave, desde=self._inicio + primera,
+                                     hasta=self._inicio + ultima + 1)
+
+    def _descartar_tablas(self, clave: str) -> None:
+        for llave in [k for k in self._tablas if k[0] == clave]:
+            del self._tablas[llave]
+
+
+# Motor compartido por el sistema (sin reglas = noches × precio).
+motor_tarifas = MotorTarifas()
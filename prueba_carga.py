@@ -0,0 +1,202 @@
+"""
+Prueba de carga del servidor HTTP del Hotel Sena.
+
+Simula varias terminales concurrentes (hilos) que registran clientes,
+consultan disponibilidad, crean reservaciones y las pagan. Sin `--url`
+levanta una instancia local con datos temporales en un puerto libre.
+
+Uso:
+    python prueba_carga.py --terminales 32 --operaciones 50
+    python prueba_carga.py --url http://127.0.0.1:8000 --terminales 16
+
+Al final muestra la latencia (p50/p95/p99), el rendimiento y los errores
+por tipo de operación, o los emite en JSON con `--json`.
+"""
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+TIPOS = ["Sencilla", "Doble", "Suite"]
+
+
+class ClienteHTTP:
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def pedir(self, metodo: str, ruta: str, datos: Dict = None) -> Tuple[int, object]:
+        cuerpo = json.dumps(datos).encode("utf-8") if datos is not None else None
+        peticion = Request(self.url + ruta, data=cuerpo, method=metodo,
+                           headers={"Content-Type": "application/json"})
+        try:
+            with urlopen(peticion, timeout=self.timeout) as r:
+                return r.status, json.loads(r.read() or b"null")
+        except HTTPError as e:
+            return e.code, json.loads(e.read() or b"null")
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def preparar(cliente: ClienteHTTP, habitaciones: int) -> None:
+    for i in range(habitaciones):
+        cliente.pedir("POST", "/habitaciones", {"tipo": TIPOS[i % len(TIPOS)], "precio": 80_000 + 40_000 * (i % 3)})
+
+
+def terminal(cliente: ClienteHTTP, numero: int, operaciones: int, semilla: int,
+             medidas: Dict[str, List[float]], errores: Dict[str, int], candado: threading.Lock) -> None:
+    """Una terminal de recepción: alta de cliente y, por cada operación, consulta + reserva + pago."""
+    azar = random.Random(semilla + numero)
+    locales = defaultdict(list)
+    fallas = defaultdict(int)
+
+    def medir(nombre: str, metodo: str, ruta: str, datos: Dict = None, esperados=(200, 201)):
+        inicio = time.perf_counter()
+        try:
+            codigo, cuerpo = cliente.pedir(metodo, ruta, datos)
+        except (URLError, OSError, ValueError):
+            codigo, cuerpo = None, None
+        locales[nombre].append(time.perf_counter() - inicio)
+        if codigo not in esperados:
+            fallas[nombre] += 1
+            return None
+        return cuerpo
+
+    nuevo = medir("registrar_cliente", "POST", "/clientes", {
+        "nombre": f"Terminal {numero}", "correo": f"terminal{numero}@gmail.com", "telefono": 3_000_000_000 + numero,
+    })
+    if nuevo:
+        base = date(2025, 1, 1)
+        for _ in range(operaciones):
+            ingreso = base + timedelta(days=azar.randrange(365))
+            salida = ingreso + timedelta(days=azar.randint(1, 5))
+            libres = medir("disponibilidad", "GET",
+                           f"/disponibilidad?ingreso={ingreso.isoformat()}&salida={salida.isoformat()}")
+            if not libres:
+                continue
+            # Otra terminal puede ganarle la habitación: 400 es una respuesta válida
+            reserva = medir("crear_reservacion", "POST", "/reservaciones", {
+                "id_cliente": nuevo["id_cliente"], "id_habitacion": azar.choice(libres)["id_habitacion"],
+                "fecha_ingreso": ingreso.isoformat(), "fecha_salida": salida.isoformat(),
+            }, esperados=(201, 400))
+            if reserva and "id_reserva" in reserva and azar.random() < 0.5:
+                medir("procesar_pago", "POST", "/pagos", {"id_reserva": reserva["id_reserva"], "metodo": "nequi"})
+
+    with candado:
+        for nombre, tiempos in locales.items():
+            medidas[nombre].extend(tiempos)
+        for nombre, n in fallas.items():
+            errores[nombre] += n
+
+
+def ejecutar(url: str, terminales: int, operaciones: int, habitaciones: int, semilla: int = 42) -> Dict:
+    cliente = ClienteHTTP(url)
+    preparar(cliente, habitaciones)
+
+    medidas: Dict[str, List[float]] = defaultdict(list)
+    errores: Dict[str, int] = defaultdict(int)
+    candado = threading.Lock()
+    hilos = [
+        threading.Thread(target=terminal, args=(cliente, i, operaciones, semilla, medidas, errores, candado))
+        for i in range(terminales)
+    ]
+    inicio = time.perf_counter()
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    segundos = time.perf_counter() - inicio
+
+    todas = [t for tiempos in medidas.values() for t in tiempos]
+    operaciones_medidas = {
+        nombre: {
+            "peticiones": len(tiempos),
+            "errores": errores.get(nombre, 0),
+            "p50_ms": round(_percentil(tiempos, 50) * 1000, 2),
+            "p95_ms": round(_percentil(tiempos, 95) * 1000, 2),
+            "p99_ms": round(_percentil(tiempos, 99) * 1000, 2),
+        }
+        for nombre, tiempos in sorted(medidas.items())
+    }
+    return {
+        "url": url,
+        "terminales": terminales,
+        "segundos": round(segundos, 3),
+        "peticiones": len(todas),
+        "peticiones_por_segundo": round(len(todas) / segundos, 1) if segundos else None,
+        "errores": sum(errores.values()),
+        "p50_ms": round(_percentil(todas, 50) * 1000, 2),
+        "p95_ms": round(_percentil(todas, 95) * 1000, 2),
+        "p99_ms": round(_percentil(todas, 99) * 1000, 2),
+        "operaciones": operaciones_medidas,
+    }
+
+
+def _imprimir(informe: Dict) -> None:
+    print("\n" + "=" * 60)
+    print(f"  PRUEBA DE CARGA - {informe['url']}")
+    print("=" * 60)
+    print(f"Terminales: {informe['terminales']} | Peticiones: {informe['peticiones']} "
+          f"en {informe['segundos']} s ({informe['peticiones_por_segundo']} pet/s)")
+    print(f"Latencia total: p50 {informe['p50_ms']} ms | p95 {informe['p95_ms']} ms | p99 {informe['p99_ms']} ms")
+    print(f"Errores: {informe['errores']}")
+    print("-" * 60)
+    for nombre, m in informe["operaciones"].items():
+        print(f"{nombre:18} {m['peticiones']:6} pet  p50 {m['p50_ms']:8} ms  p95 {m['p95_ms']:8} ms  "
+              f"p99 {m['p99_ms']:8} ms  errores {m['errores']}")
+    print("=" * 60 + "\n")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor HTTP del Hotel Sena.")
+    parser.add_argument("--url", help="Servidor a probar (por defecto se levanta uno local temporal)")
+    parser.add_argument("--terminales", type=int, default=16, help="Clientes concurrentes")
+    parser.add_argument("--operaciones", type=int, default=25, help="Reservaciones que intenta cada terminal")
+    parser.add_argument("--habitaciones", type=int, default=50, help="Habitaciones que se crean antes de la prueba")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Emitir el informe en JSON")
+    args = parser.parse_args(argv)
+
+    servidor = directorio = None
+    url = args.url
+    if not url:
+        from hotel_sena.procesador_pagos import PasarelaSimulada, ProcesadorPagos
+        from hotel_sena.servicio import ServicioHotel
+        from hotel_sena.servidor_http import crear_servidor
+
+        directorio = tempfile.TemporaryDirectory(prefix="hotel_sena_carga_")
+        procesador = ProcesadorPagos(ruta_archivo=None)  # el servicio guarda los pagos en su bitácora
+        procesador.pasarela_por_defecto = PasarelaSimulada(latencia=0.01, tasa_exito=0.9, semilla=args.semilla)
+        servidor = crear_servidor(ServicioHotel(directorio.name, procesador), "127.0.0.1", 0, silencioso=True)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{servidor.server_address[1]}"
+
+    try:
+        informe = ejecutar(url, args.terminales, args.operaciones, args.habitaciones, args.semilla)
+    finally:
+        if servidor:
+            servidor.shutdown()
+            servidor.server_close()
+            directorio.cleanup()
+
+    if args.json:
+        print(json.dumps(informe, indent=2, ensure_ascii=False))
+    else:
+        _imprimir(informe)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+import pytest
+
+from hotel_sena.procesador_pagos import PasarelaSimulada, ProcesadorPagos
+from hotel_sena.servicio import ServicioHotel
+
+
+class Reloj:
+    """Reloj de prueba para la agenda: devuelve `hoy` y se adelanta a mano."""
+
+    def __init__(self, hoy: date):
+        self.hoy = hoy
+
+    def __call__(self) -> date:
+        return self.hoy
+
+    def avanzar(self, dias: int = 1) -> None:
+        self.hoy += timedelta(days=dias)
+
+
+@pytest.fixture
+def reloj():
+    return Reloj(date(2030, 1, 1))
+
+
+@pytest.fixture
+def crear_servicio(tmp_path, reloj):
+    """
+    Arma un ServicioHotel sobre `tmp_path` (o el directorio indicado) con
+    el reloj de prueba y una pasarela sin espera que aprueba todo. No se
+    cierra al final: varias pruebas simulan una caída abriendo otro
+    servicio sobre los mismos datos.
+    """
+    def crear(directorio=None, **opciones) -> ServicioHotel:
+        procesador = ProcesadorPagos(ruta_archivo=None)
+        procesador.pasarela_por_defecto = PasarelaSimulada(latencia=0, tasa_exito=1)
+        servicio = ServicioHotel(str(directorio or tmp_path), procesador, reloj=reloj, **opciones)
+        servicio.cargar()
+        return servicio
+
+    return crear
+
+
+@pytest.fixture
+def servicio(crear_servicio):
+    return crear_servicio()
+
+
+@pytest.fixture
+def hotel(servicio):
+    """Servicio con una clienta y dos habitaciones dobles."""
+    cliente = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    for _ in range(2):
+        servicio.registrar_habitacion("Doble", 100)
+    return servicio, cliente
+
+
+def falla_bitacora(cambios):
+    """Reemplazo de Bitacora.anotar que simula un disco lleno."""
+    list(cambios)
+    raise OSError("disco lleno")
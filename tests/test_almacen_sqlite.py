@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from hotel_sena.almacen_sqlite import AlmacenSQLite
+from hotel_sena.almacenamiento import DiarioJSONL, configurar_almacenamiento
+
+
+@pytest.fixture
+def sqlite():
+    configurar_almacenamiento(AlmacenSQLite)
+    yield
+    configurar_almacenamiento(DiarioJSONL)
+
+
+def _reserva(id_reserva, habitacion=1, ingreso="2030-01-10", salida="2030-01-12", estado="activa"):
+    return {"ID": id_reserva, "Cliente": "Ana Gomez", "Habitación": habitacion, "Ingreso": ingreso,
+            "Salida": salida, "Precio por día": 100.0, "Precio total": 200.0, "Estado": estado,
+            "ID Cliente": 1}
+
+
+def test_cargar_devuelve_los_registros_de_to_dict(tmp_path, sqlite, crear_servicio):
+    servicio = crear_servicio()
+    cliente = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    habitacion = servicio.registrar_habitacion("Doble", 100)
+    reserva = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-10", "2030-01-12")
+    servicio.procesar_pago(reserva.id_reserva, "Nequi")
+    servicio.cerrar()
+
+    almacen = AlmacenSQLite(str(tmp_path / "reservas.json"), tamano_pagina=1)
+    assert list(almacen.cargar()) == [servicio.obtener_reserva(reserva.id_reserva).to_dict()]
+    assert list(AlmacenSQLite(str(tmp_path / "clientes.json")).cargar()) == [cliente.to_dict()]
+    movimientos = list(AlmacenSQLite(str(tmp_path / "libro_pagos.json")).cargar())
+    assert [m["Estado"] for m in movimientos] == ["pendiente", "aprobado"]  # el libro no reemplaza
+
+    otro = crear_servicio()
+    assert otro.obtener_reserva(reserva.id_reserva).estado == "pagada"
+    assert otro.obtener_cliente(cliente.id_cliente).correo == "ana@gmail.com"
+
+
+def test_dos_conexiones_no_reservan_la_misma_habitacion(tmp_path):
+    ruta = str(tmp_path / "reservas.json")
+    primera, segunda = AlmacenSQLite(ruta), AlmacenSQLite(ruta)
+
+    with primera.reservando([_reserva(1)]):
+        pass
+    with pytest.raises(ValueError, match="ya está reservada"):
+        with segunda.reservando([_reserva(2, ingreso="2030-01-11", salida="2030-01-13")]):
+            pass
+    with segunda.reservando([_reserva(3, ingreso="2030-01-12", salida="2030-01-14")]):
+        pass  # entra el día que la otra sale
+    with segunda.reservando([_reserva(4, habitacion=2)]):
+        pass
+
+    assert [r["ID"] for r in primera.cargar()] == [1, 3, 4]
+
+
+def test_la_segunda_conexion_espera_a_la_primera(tmp_path):
+    ruta = str(tmp_path / "reservas.json")
+    primera, segunda = AlmacenSQLite(ruta), AlmacenSQLite(ruta, timeout=10)
+    dentro, seguir = threading.Event(), threading.Event()
+
+    def reservar():
+        with primera.reservando([_reserva(1)]):
+            dentro.set()
+            seguir.wait(5)
+
+    hilo = threading.Thread(target=reservar)
+    hilo.start()
+    dentro.wait(5)
+    errores = []
+
+    def competir():
+        try:
+            with segunda.reservando([_reserva(2)]):
+                pass
+        except ValueError as e:
+            errores.append(e)
+
+    otro = threading.Thread(target=competir)
+    otro.start()
+    seguir.set()
+    hilo.join(5)
+    otro.join(10)
+
+    assert len(errores) == 1
+    assert [r["ID"] for r in segunda.cargar()] == [1]
+
+
+def test_un_error_dentro_de_reservando_revierte(tmp_path):
+    almacen = AlmacenSQLite(str(tmp_path / "reservas.json"))
+    with pytest.raises(OSError):
+        with almacen.reservando([_reserva(1)]):
+            raise OSError("disco lleno")
+    assert list(almacen.cargar()) == []
+
+
+def test_el_servicio_rechaza_un_cruce_escrito_por_otra_conexion(tmp_path, sqlite, hotel):
+    servicio, cliente = hotel
+    otra_terminal = AlmacenSQLite(str(tmp_path / "reservas.json"))
+    with otra_terminal.reservando([_reserva(99, habitacion=1)]):
+        pass
+
+    with pytest.raises(ValueError, match="reservación #99"):
+        servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-11", "2030-01-13")
+
+    assert servicio.listar_reservaciones() == []
+    assert cliente.reservas == []
+    assert servicio.indice.esta_libre(1, "2030-01-11", "2030-01-13")
+    assert servicio.obtener_habitacion(1).estado == "disponible"
+    # La otra habitación del mismo tipo sigue libre para esas noches
+    reserva = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-11", "2030-01-13")
+    assert reserva.habitacion.id_habitacion == 2
+
+
+def test_la_cancelacion_libera_las_noches_en_la_base(tmp_path, sqlite, hotel):
+    servicio, cliente = hotel
+    reserva = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-10", "2030-01-12")
+    servicio.cancelar_reservacion(reserva.id_reserva)
+
+    otra_terminal = AlmacenSQLite(str(tmp_path / "reservas.json"))
+    with otra_terminal.reservando([_reserva(99, habitacion=1)]):
+        pass
@@ -0,0 +1,129 @@
+"""Reporte de ocupación e ingresos (analitica.py), con NumPy y en Python puro."""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from hotel_sena import analitica
+from hotel_sena.analitica import Analitica, ColumnasPagos
+from hotel_sena.columnar import TablaReservasColumnar
+
+INICIO = date(2030, 1, 1)
+
+
+@pytest.fixture(params=["python", "numpy"])
+def motor(request, monkeypatch):
+    """Corre cada prueba con los dos caminos de analitica.py."""
+    if request.param == "numpy":
+        monkeypatch.setattr(analitica, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(analitica, "np", None)
+    return request.param
+
+
+def _datos(cantidad=300, semilla=7):
+    """Reservaciones y pagos al azar: [(ingreso, salida, precio, tipo, estado)] y [(monto, método, fecha, estado)]."""
+    azar = random.Random(semilla)
+    reservas = []
+    for _ in range(cantidad):
+        ingreso = INICIO + timedelta(days=azar.randrange(-20, 80))
+        salida = ingreso + timedelta(days=azar.randint(1, 12))
+        reservas.append((ingreso, salida, float(azar.choice([80, 100, 250])), azar.choice(["Doble", "Suite"]),
+                         azar.choice(["activa", "pagada", "finalizada", "cancelada"])))
+    pagos = [(float(azar.randint(50, 500)), azar.choice(["tarjeta", "nequi"]),
+              (INICIO + timedelta(days=azar.randrange(0, 60))).isoformat(), azar.choice(["aprobado", "fallido"]))
+             for _ in range(cantidad)]
+    return reservas, pagos
+
+
+def _analitica(reservas, pagos, total_habitaciones=40):
+    tabla = TablaReservasColumnar()
+    for n, (ingreso, salida, precio, tipo, estado) in enumerate(reservas, start=1):
+        tabla.agregar_fila(n, 1, n, ingreso.toordinal(), salida.toordinal(), precio, tipo, estado)
+    columnas = ColumnasPagos()
+    for monto, metodo, fecha, estado in pagos:
+        columnas.agregar_fila(monto, metodo, fecha, estado)
+    return Analitica(tabla, total_habitaciones, columnas)
+
+
+def _noches(reservas, desde, hasta):
+    """Referencia: recorre cada noche de cada estadía no cancelada dentro de [desde, hasta]."""
+    for ingreso, salida, precio, tipo, estado in reservas:
+        if estado == "cancelada":
+            continue
+        dia = ingreso
+        while dia < salida:
+            if desde <= dia <= hasta:
+                yield dia, precio, tipo
+            dia += timedelta(days=1)
+
+
+def test_ocupacion_e_ingresos_por_noche(motor):
+    reservas, pagos = _datos()
+    desde, hasta = date(2030, 1, 10), date(2030, 2, 20)
+    reporte = _analitica(reservas, pagos)
+
+    ocupadas, ingresos = {}, {}
+    for dia, precio, _ in _noches(reservas, desde, hasta):
+        ocupadas[dia] = ocupadas.get(dia, 0) + 1
+        ingresos[dia] = ingresos.get(dia, 0.0) + precio
+
+    diaria = reporte.ocupacion_diaria(desde, hasta)
+    assert len(diaria) == (hasta - desde).days + 1
+    for fecha, n, tasa in diaria:
+        assert n == ocupadas.get(date.fromisoformat(fecha), 0)
+        assert tasa == pytest.approx(n / 40)
+    for fecha, total in reporte.ingresos_diarios(desde, hasta):
+        assert total == pytest.approx(ingresos.get(date.fromisoformat(fecha), 0.0))
+
+
+def test_resumen_y_totales_por_tipo_y_metodo(motor):
+    reservas, pagos = _datos()
+    desde, hasta = date(2030, 1, 5), date(2030, 1, 31)
+    reporte = _analitica(reservas, pagos)
+
+    noches = list(_noches(reservas, desde, hasta))
+    ingresos = sum(precio for _, precio, _ in noches)
+    resumen = reporte.resumen(desde.isoformat(), hasta.isoformat())
+    assert resumen["noches_vendidas"] == len(noches)
+    assert resumen["noches_disponibles"] == 40 * 27
+    assert resumen["ingresos"] == pytest.approx(ingresos)
+    assert resumen["adr"] == pytest.approx(ingresos / len(noches))
+    assert resumen["revpar"] == pytest.approx(ingresos / (40 * 27))
+
+    por_tipo = {}
+    for _, precio, tipo in noches:
+        por_tipo[tipo] = por_tipo.get(tipo, 0.0) + precio
+    assert reporte.ingresos_por_tipo(desde, hasta) == pytest.approx(por_tipo)
+
+    por_metodo = {}
+    for monto, metodo, fecha, estado in pagos:
+        if estado == "aprobado" and desde <= date.fromisoformat(fecha) <= hasta:
+            por_metodo[metodo] = por_metodo.get(metodo, 0.0) + monto
+    assert reporte.ingresos_por_metodo(desde, hasta) == pytest.approx(por_metodo)
+
+
+def test_rangos_vacios_y_no_validos(motor):
+    vacio = _analitica([], [])
+    assert vacio.resumen("2030-01-01", "2030-01-07")["ocupacion"] == 0.0
+    assert vacio.ingresos_por_tipo("2030-01-01", "2030-01-07") == {}
+    assert vacio.ingresos_por_metodo("2030-01-01", "2030-01-07") == {}
+    assert [n for _, n, _ in vacio.ocupacion_diaria("2030-01-01", "2030-01-03")] == [0, 0, 0]
+    with pytest.raises(ValueError):
+        vacio.resumen("2030-01-07", "2030-01-01")
+
+
+def test_reporte_desde_los_registros_del_servicio(motor, hotel):
+    servicio, cliente = hotel
+    servicio.registrar_habitacion("Suite", 300)
+    pagada = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-10", "2030-01-13")
+    servicio.crear_reservacion(cliente.id_cliente, 3, "2030-01-12", "2030-01-14")
+    cancelada = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-10", "2030-01-12")
+    servicio.cancelar_reservacion(cancelada.id_reserva)
+    servicio.procesar_pago(pagada.id_reserva, "tarjeta")
+
+    reporte = Analitica.desde_registros(servicio.reservas, servicio.habitaciones, servicio.pagos)
+    resumen = reporte.resumen("2030-01-10", "2030-01-13")
+    assert (resumen["noches_vendidas"], resumen["noches_disponibles"]) == (5, 12)
+    assert resumen["ingresos"] == 300 + 600
+    assert reporte.ingresos_por_tipo("2030-01-10", "2030-01-13") == {"Doble": 300, "Suite": 600}
@@ -0,0 +1,48 @@
+"""Recuperación tras caídas y puntos de control de la bitácora (bitacora.py)."""
+
+
+def _llenar(servicio):
+    cliente = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    habitacion = servicio.registrar_habitacion("Doble", 100)
+    servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-05", "2030-01-08")
+
+
+def test_recupera_tras_linea_cortada(tmp_path, crear_servicio):
+    _llenar(crear_servicio())
+    # Caída a mitad de una escritura: sin cerrar() y con la última línea a medias.
+    with open(tmp_path / "bitacora.wal", "a", encoding="utf-8") as f:
+        f.write('deadbeef {"lsn": 99, "cambios": [["reservas.json", {"ID": ')
+
+    recuperado = crear_servicio()
+    assert len(recuperado.clientes) == 1
+    [reserva] = list(recuperado.reservas)
+    assert reserva.estado == "activa"
+    assert recuperado.obtener_habitacion(1).estado == "reservada"
+    assert recuperado.habitaciones_disponibles("2030-01-06", "2030-01-07") == []
+
+    # La línea dañada se descartó: lo que se anota después también se recupera.
+    recuperado.registrar_cliente("Luis Paz", "luis@gmail.com", "3001112222")
+    otra_vez = crear_servicio()
+    assert [c.correo for c in otra_vez.clientes] == ["ana@gmail.com", "luis@gmail.com"]
+
+
+def test_punto_de_control_vacia_la_bitacora(tmp_path, crear_servicio):
+    servicio = crear_servicio(punto_control_cada=2)
+    _llenar(servicio)
+    servicio.registrar_cliente("Luis Paz", "luis@gmail.com", "3001112222")
+
+    with open(tmp_path / "bitacora.wal", encoding="utf-8") as f:
+        assert len(f.readlines()) < 2
+    recuperado = crear_servicio()
+    assert len(recuperado.clientes) == 2
+    assert len(recuperado.reservas) == 1
+
+
+def test_cerrar_deja_todo_en_los_archivos(tmp_path, crear_servicio):
+    servicio = crear_servicio()
+    _llenar(servicio)
+    servicio.cerrar()
+
+    assert (tmp_path / "bitacora.wal").stat().st_size == 0
+    recuperado = crear_servicio()
+    assert recuperado.obtener_cliente(1).reservas == [1]
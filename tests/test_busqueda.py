@@ -0,0 +1,87 @@
+"""Búsqueda de clientes (busqueda.py): prefijos, sin tildes y aproximada por trigramas."""
+import pytest
+
+from hotel_sena.busqueda import IndiceBusqueda, normalizar
+
+
+@pytest.fixture
+def indice():
+    indice = IndiceBusqueda()
+    for id_cliente, nombre, correo, telefono in (
+        (1, "María Gómez", "maria.gomez@gmail.com", "3001112233"),
+        (2, "José Peña", "jpena@hotmail.com", "3104445566"),
+        (3, "Mario Santana Rodríguez", "msr@gmail.com", "3207778899"),
+        (4, "Marta Gómez", "marta@yahoo.com", "3001110000"),
+    ):
+        indice.indexar(id_cliente, nombre, correo, telefono)
+    return indice
+
+
+def test_normalizar():
+    assert normalizar("Peña Gómez") == "pena gomez"
+    assert normalizar("JOSÉ") == "jose"
+
+
+def test_prefijos_de_cada_palabra(indice):
+    assert indice.buscar("mar gom", aproximada=False) == [1, 4]
+    assert indice.buscar("gom mari", aproximada=False) == [1]
+    assert indice.buscar("mar", aproximada=False) == [1, 3, 4]
+    assert indice.buscar("mar", limite=2, aproximada=False) == [1, 3]
+    assert indice.buscar("   ") == []
+
+
+def test_sin_tildes_ni_mayusculas(indice):
+    assert indice.buscar("pena", aproximada=False) == [2]
+    assert indice.buscar("JOSE PEÑA", aproximada=False) == [2]
+    assert indice.buscar("rodriguez", aproximada=False) == [3]
+
+
+def test_correo_y_telefono_por_prefijo(indice):
+    assert indice.buscar("jpena@hot", aproximada=False) == [2]
+    assert indice.buscar("marta", aproximada=False) == [4]  # usuario del correo
+    assert sorted(indice.buscar("300111", aproximada=False)) == [1, 4]
+    assert indice.buscar("3104445566", aproximada=False) == [2]
+
+
+def test_busqueda_aproximada_por_trigramas(indice):
+    assert indice.buscar("santaana rodriges") == [3]
+    assert indice.buscar("santaana rodriges", aproximada=False) == []
+    assert "santana" in indice.parecidas("santaana")
+    assert sorted(indice.buscar("gomes")) == [1, 4]
+    # Primero las coincidencias por prefijo y después las parecidas
+    assert indice.buscar("mari") == [1, 3, 4]
+    assert indice.buscar("xyzw") == []
+
+
+def test_actualizar_y_quitar(indice):
+    indice.indexar(2, "José Peñaloza", "jpena@hotmail.com", "3104445566")
+    assert indice.buscar("penal", aproximada=False) == [2]
+    indice.quitar(2)
+    assert indice.buscar("jose") == []
+    assert indice.buscar("penaloza") == []
+    assert len(indice) == 3
+    # Una palabra que ya nadie usa sale del vocabulario aproximado
+    assert "penaloza" not in indice.parecidas("penaloza")
+
+
+def test_carga_masiva_y_altas_sueltas():
+    indice = IndiceBusqueda()
+    for i in range(500):
+        indice.indexar(i, f"Cliente{i} Apellido", f"c{i}@gmail.com", f"300{i:07d}")
+    assert len(indice) == 500
+    assert indice.buscar("cliente12 ape", aproximada=False) == [12, *range(120, 129)]
+    indice.indexar(1000, "Zoila Vaca", "zoila@gmail.com", "3110000000")
+    assert indice.buscar("zoi", aproximada=False) == [1000]
+    indice.reiniciar()
+    assert len(indice) == 0 and indice.buscar("zoi") == []
+
+
+def test_el_servicio_sigue_los_cambios_de_los_clientes(hotel):
+    servicio, cliente = hotel
+    otro = servicio.registrar_cliente("Ángela Muñoz", "angela@gmail.com", "3015556677")
+    assert servicio.buscar_clientes("angela munoz") == [otro]
+    assert servicio.buscar_clientes("gomez") == [cliente]
+
+    servicio.actualizar_cliente(otro.id_cliente, nombre="Ángela Muñoz Torres")
+    assert servicio.buscar_clientes("torr") == [otro]
+    assert servicio.buscar_clientes("munos tores") == [otro]
@@ -0,0 +1,111 @@
+"""Caché de disponibilidad y cotizaciones (cache_consultas.py): invalidación por eventos."""
+import pytest
+
+from hotel_sena.cache_consultas import CacheConsultas
+from hotel_sena.eventos import CanalEventos
+from hotel_sena.Habitaciones import Habitacion
+
+
+class Contador:
+    """Función de cálculo que cuenta cuántas veces la llama la caché."""
+
+    def __init__(self, valor):
+        self.valor = valor
+        self.llamadas = 0
+
+    def __call__(self):
+        self.llamadas += 1
+        return self.valor
+
+
+def _libres(servicio, ingreso="2030-01-10", salida="2030-01-12", tipo=None):
+    return [h.id_habitacion for h in servicio.habitaciones_disponibles(ingreso, salida, tipo)]
+
+
+def test_la_reserva_y_la_cancelacion_invalidan_solo_las_fechas_cruzadas(hotel):
+    servicio, cliente = hotel
+    assert _libres(servicio) == [1, 2]
+    assert _libres(servicio, "2030-02-01", "2030-02-03") == [1, 2]
+    assert _libres(servicio) == [1, 2]
+    assert servicio.cache.aciertos == 1
+
+    reserva = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-11", "2030-01-13")
+    assert servicio.cache.invalidadas == 1  # la consulta de febrero no se toca
+    assert _libres(servicio) == [2]
+    assert _libres(servicio, "2030-02-01", "2030-02-03") == [1, 2]
+    assert servicio.cache.aciertos == 2
+
+    servicio.cancelar_reservacion(reserva.id_reserva)
+    assert _libres(servicio) == [1, 2]
+
+
+def test_una_habitacion_nueva_invalida_su_tipo(hotel):
+    servicio, _ = hotel
+    assert _libres(servicio, tipo="Doble") == [1, 2]
+    assert _libres(servicio, tipo="suite") == []
+    servicio.registrar_habitacion("Suite", 300)
+
+    assert _libres(servicio, tipo="Doble") == [1, 2]
+    assert servicio.cache.aciertos == 1
+    assert _libres(servicio, tipo="Suite") == [3]
+    assert _libres(servicio) == [1, 2, 3]
+
+
+def test_el_cambio_de_precio_invalida_las_cotizaciones_de_la_habitacion(hotel):
+    servicio, _ = hotel
+    assert servicio.cotizar(1, "2030-01-10", "2030-01-12") == 200
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 200
+    servicio.obtener_habitacion(1).actualizar_precio(150, canal=servicio.eventos)
+
+    assert servicio.cotizar(1, "2030-01-10", "2030-01-12") == 300
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 200
+    assert servicio.cache.aciertos == 1
+
+
+def test_las_reglas_de_tarifas_invalidan_las_cotizaciones(hotel):
+    servicio, _ = hotel
+    assert servicio.cotizar(1, "2030-01-10", "2030-01-12") == 200
+    servicio.tarifas.agregar_descuento_estadia(2, 0.5)
+    assert servicio.cotizar(1, "2030-01-10", "2030-01-12") == 100
+
+
+def test_capacidad_y_tiempo_de_vida():
+    ahora = [0.0]
+    canal = CanalEventos()
+    cache = CacheConsultas(capacidad=2, ttl=10, reloj=lambda: ahora[0], canal=canal)
+    calcular = Contador(["libres"])
+
+    cache.disponibilidad("2030-01-10", "2030-01-12", None, calcular)
+    cache.disponibilidad("2030-01-11", "2030-01-12", None, calcular)
+    cache.disponibilidad("2030-01-10", "2030-01-12", None, calcular)  # ahora es la más reciente
+    cache.disponibilidad("2030-01-12", "2030-01-13", None, calcular)  # desaloja la del 11
+    assert calcular.llamadas == 3
+    cache.disponibilidad("2030-01-10", "2030-01-12", None, calcular)
+    assert calcular.llamadas == 3
+
+    ahora[0] = 10
+    cache.disponibilidad("2030-01-10", "2030-01-12", None, calcular)
+    assert calcular.llamadas == 4
+    assert cache.estadisticas()["desalojadas"] == 1
+    assert cache.estadisticas()["expiradas"] == 1
+
+    with pytest.raises(ValueError):
+        CacheConsultas(capacidad=0, canal=canal)
+
+
+def test_reinicio_del_indice_y_desconectar():
+    canal = CanalEventos()
+    cache = CacheConsultas(canal=canal)
+    habitacion = Habitacion(1, "Doble", 100)
+    cotizar = Contador(200.0)
+
+    cache.cotizacion(habitacion, "2030-01-10", "2030-01-12", cotizar)
+    canal.emitir("indice_reiniciado")
+    cache.cotizacion(habitacion, "2030-01-10", "2030-01-12", cotizar)
+    assert cotizar.llamadas == 2
+
+    cache.desconectar()
+    canal.emitir("indice_reiniciado")
+    cache.cotizacion(habitacion, "2030-01-10", "2030-01-12", cotizar)
+    assert cotizar.llamadas == 2
+    assert cache.estadisticas()["tasa_aciertos"] == pytest.approx(1 / 3)
@@ -0,0 +1,103 @@
+"""Importación por ServicioHotel.importar (carga_masiva.py)."""
+import pytest
+
+from conftest import falla_bitacora
+
+
+def _csv(tmp_path, nombre, texto):
+    ruta = tmp_path / nombre
+    ruta.write_text(texto, encoding="utf-8")
+    return str(ruta)
+
+
+def test_fila_con_id_repetido_no_pisa_al_cliente(tmp_path, servicio):
+    ana = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    ruta = _csv(tmp_path, "clientes.csv", "id_cliente,nombre,correo,telefono\n"
+                                          "1,Impostor,impostor@gmail.com,3009990000\n"
+                                          ",Luis Paz,luis@gmail.com,3001112222\n")
+
+    resultado = servicio.importar("clientes", ruta)
+    assert resultado.importados == 1
+    assert [linea for linea, _ in resultado.errores] == [2]
+    assert servicio.obtener_cliente(1) is ana
+    assert servicio.buscar_clientes("impostor") == []
+    assert servicio.buscar_clientes("ana") == [ana]
+    assert servicio.clientes.por_correo("luis@gmail.com").id_cliente == 2
+
+
+def test_importacion_pasa_por_la_bitacora(tmp_path, servicio, crear_servicio):
+    servicio.importar("habitaciones", _csv(tmp_path, "habitaciones.csv", "tipo,precio\nDoble,100\nSuite,300\n"))
+    servicio.importar("clientes", _csv(tmp_path, "clientes.csv",
+                                       "nombre,correo,telefono\nAna Gomez,ana@gmail.com,3001234567\n"))
+    servicio.importar("reservaciones", _csv(tmp_path, "reservas.csv",
+                                            "id_cliente,id_habitacion,fecha_ingreso,fecha_salida\n"
+                                            "1,2,2030-01-05,2030-01-07\n"))
+
+    recuperado = crear_servicio()
+    assert len(recuperado.habitaciones) == 2
+    assert recuperado.obtener_habitacion(2).estado == "reservada"
+    assert recuperado.obtener_cliente(1).reservas == [1]
+    assert [h.id_habitacion for h in recuperado.habitaciones_disponibles("2030-01-05", "2030-01-07")] == [1]
+
+
+def test_deshacer_devuelve_la_habitacion_a_su_estado(tmp_path, servicio, monkeypatch):
+    cliente = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    habitacion = servicio.registrar_habitacion("Doble", 100)
+    ruta = _csv(tmp_path, "reservas.csv", "id_cliente,id_habitacion,fecha_ingreso,fecha_salida\n"
+                                          "1,1,2030-01-05,2030-01-07\n"
+                                          "1,1,2030-01-10,2030-01-12\n")
+    monkeypatch.setattr(servicio.bitacora, "anotar", falla_bitacora)
+
+    with pytest.raises(OSError):
+        servicio.importar("reservaciones", ruta)
+    assert habitacion.estado == "disponible"
+    assert len(servicio.reservas) == 0
+    assert cliente.reservas == []
+    assert servicio.indice.reservas_de(habitacion.id_habitacion) == []
+
+
+def test_deshacer_clientes_y_habitaciones(tmp_path, servicio, monkeypatch):
+    monkeypatch.setattr(servicio.bitacora, "anotar", falla_bitacora)
+
+    with pytest.raises(OSError):
+        servicio.importar("clientes", _csv(tmp_path, "clientes.csv",
+                                           "nombre,correo,telefono\nZoe Lima,zoe@gmail.com,3005556666\n"))
+    with pytest.raises(OSError):
+        servicio.importar("habitaciones", _csv(tmp_path, "habitaciones.csv", "tipo,precio\nSuite,300\n"))
+    assert len(servicio.clientes) == 0
+    assert servicio.buscar_clientes("zoe") == []
+    assert servicio.indice.habitaciones_de_tipo("Suite") == []
+
+
+def test_entidad_desconocida(tmp_path, servicio):
+    with pytest.raises(ValueError):
+        servicio.importar("pagos", _csv(tmp_path, "pagos.csv", "id\n1\n"))
+
+
+def test_ids_explicitos_y_sin_huecos(tmp_path, servicio):
+    ruta = _csv(tmp_path, "clientes.csv", "id_cliente,nombre,correo,telefono\n"
+                                          "0,Cero Uno,cero@gmail.com,3000000000\n"
+                                          ",Sin Correo,no-es-correo,3001111111\n"
+                                          ",Luis Paz,luis@gmail.com,3001112222\n")
+
+    resultado = servicio.importar("clientes", ruta)
+    assert [linea for linea, _ in resultado.errores] == [3]
+    assert servicio.obtener_cliente(0).nombre == "Cero Uno"
+    # La fila rechazada no gastó un ID.
+    assert servicio.clientes.por_correo("luis@gmail.com").id_cliente == 1
+    assert servicio.registrar_cliente("Eva Rios", "eva@gmail.com", "3003334444").id_cliente == 2
+
+
+def test_estado_de_reservacion_desconocido(tmp_path, servicio):
+    servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    habitacion = servicio.registrar_habitacion("Doble", 100)
+    ruta = _csv(tmp_path, "reservas.csv", "id_cliente,id_habitacion,fecha_ingreso,fecha_salida,estado\n"
+                                          "1,1,2030-01-05,2030-01-07,confirmadisima\n"
+                                          "1,1,2030-01-10,2030-01-12,cancelada\n")
+
+    resultado = servicio.importar("reservaciones", ruta)
+    assert resultado.importados == 1
+    [(linea, mensaje)] = resultado.errores
+    assert linea == 2 and "confirmadisima" in mensaje
+    assert habitacion.estado == "disponible"
+    assert servicio.indice.reservas_de(habitacion.id_habitacion) == []
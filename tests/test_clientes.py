@@ -0,0 +1,16 @@
+"""Registro de clientes y sus índices por correo y teléfono."""
+import pytest
+
+
+def test_actualizar_cliente_reindexa_correo_y_telefono(hotel, crear_servicio):
+    servicio, cliente = hotel
+    servicio.actualizar_cliente(cliente.id_cliente, correo="nueva@gmail.com", telefono="3009999999")
+
+    assert servicio.clientes.por_correo("ana@gmail.com") is None
+    assert servicio.clientes.por_correo("nueva@gmail.com") is cliente
+    assert servicio.clientes.por_telefono("3009999999") == [cliente]
+    assert servicio.buscar_clientes("nueva") == [cliente]
+    with pytest.raises(ValueError):
+        servicio.actualizar_cliente(cliente.id_cliente, correo="sin-arroba")
+    assert cliente.correo == "nueva@gmail.com"
+    assert crear_servicio().obtener_cliente(cliente.id_cliente).correo == "nueva@gmail.com"
@@ -0,0 +1,123 @@
+"""Ingresos y salidas programados (agenda.py) y estado de las habitaciones."""
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from hotel_sena.servidor_http import crear_servidor
+
+
+def _hotel(servicio):
+    cliente = servicio.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+    habitacion = servicio.registrar_habitacion("Doble", 100)
+    return cliente, habitacion
+
+
+def test_salida_antes_que_ingreso_el_mismo_dia(servicio, reloj):
+    cliente, habitacion = _hotel(servicio)
+    primera = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+    segunda = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-03", "2030-01-05")
+
+    assert servicio.avanzar_estancias() == {"ingresos": 1, "salidas": 0}
+    assert habitacion.estado == "ocupada"
+
+    reloj.avanzar()
+    assert servicio.avanzar_estancias() == {"ingresos": 0, "salidas": 0}
+
+    reloj.avanzar()
+    assert servicio.avanzar_estancias() == {"ingresos": 1, "salidas": 1}
+    assert primera.estado == "finalizada"
+    assert segunda.estado == "activa"
+    assert habitacion.estado == "ocupada"
+
+    reloj.avanzar(2)
+    assert servicio.avanzar_estancias() == {"ingresos": 0, "salidas": 1}
+    assert segunda.estado == "finalizada"
+    assert habitacion.estado == "disponible"
+
+
+def test_varios_dias_de_una_vez(servicio, reloj):
+    cliente, habitacion = _hotel(servicio)
+    for ingreso, salida in (("2030-01-01", "2030-01-03"), ("2030-01-03", "2030-01-05"), ("2030-01-08", "2030-01-09")):
+        servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, ingreso, salida)
+
+    reloj.avanzar(5)
+    assert servicio.avanzar_estancias() == {"ingresos": 2, "salidas": 2}
+    assert habitacion.estado == "reservada"  # queda la del día 8
+    assert [r.estado for r in servicio.reservas] == ["finalizada", "finalizada", "activa"]
+
+
+def test_cancelar_con_huesped_adentro_no_libera_la_habitacion(servicio):
+    cliente, habitacion = _hotel(servicio)
+    servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+    futura = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-10", "2030-01-12")
+    servicio.avanzar_estancias()
+
+    servicio.cancelar_reservacion(futura.id_reserva)
+    assert habitacion.estado == "ocupada"
+
+
+def test_cancelar_deja_reservada_si_quedan_reservaciones(servicio):
+    cliente, habitacion = _hotel(servicio)
+    una = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-05", "2030-01-06")
+    otra = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-10", "2030-01-12")
+
+    servicio.cancelar_reservacion(una.id_reserva)
+    assert habitacion.estado == "reservada"
+    servicio.cancelar_reservacion(otra.id_reserva)
+    assert habitacion.estado == "disponible"
+
+
+def test_reservar_con_huesped_adentro_sigue_ocupada(servicio):
+    cliente, habitacion = _hotel(servicio)
+    servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+    servicio.avanzar_estancias()
+
+    servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-10", "2030-01-12")
+    assert habitacion.estado == "ocupada"
+
+
+def test_no_se_adelantan_fechas_futuras(servicio, reloj):
+    cliente, habitacion = _hotel(servicio)
+    reserva = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+
+    with pytest.raises(ValueError, match="futuras"):
+        servicio.avanzar_estancias("2030-01-05")
+    assert reserva.estado == "activa"
+    assert servicio.avanzar_estancias("2030-01-01") == {"ingresos": 1, "salidas": 0}
+
+    reloj.avanzar(4)  # solo el reloj adelanta el calendario
+    assert servicio.avanzar_estancias() == {"ingresos": 0, "salidas": 1}
+    assert reserva.estado == "finalizada"
+
+
+def test_la_ruta_http_rechaza_fechas_futuras(servicio):
+    cliente, habitacion = _hotel(servicio)
+    reserva = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+    servidor = crear_servidor(servicio, puerto=0, silencioso=True)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{servidor.server_address[1]}/estancias/avanzar"
+        peticion = Request(url, data=json.dumps({"hasta": "2099-01-01"}).encode("utf-8"), method="POST")
+        with pytest.raises(HTTPError) as error:
+            urlopen(peticion, timeout=5)
+        assert error.value.code == 400
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+    assert reserva.estado == "activa"
+
+
+def test_volver_a_registrar_no_duplica_eventos(servicio):
+    cliente, habitacion = _hotel(servicio)
+    otra = servicio.registrar_habitacion("Doble", 100)
+    reserva = servicio.crear_reservacion(cliente.id_cliente, habitacion.id_habitacion, "2030-01-01", "2030-01-03")
+    assert len(servicio.agenda) == 2
+
+    servicio._mover(reserva, otra)
+    servicio._mover(reserva, habitacion)
+    assert len(servicio.agenda) == 2
+    assert servicio.avanzar_estancias() == {"ingresos": 1, "salidas": 0}
+    assert len(servicio.agenda) == 1
@@ -0,0 +1,25 @@
+"""Reservaciones de grupo todo o nada (ServicioHotel.reservar_grupo)."""
+import pytest
+
+from conftest import falla_bitacora
+
+
+def test_grupo_se_deshace_si_falla_la_bitacora(hotel, monkeypatch):
+    servicio, cliente = hotel
+    monkeypatch.setattr(servicio.bitacora, "anotar", falla_bitacora)
+
+    with pytest.raises(OSError):
+        servicio.reservar_grupo([{"id_cliente": cliente.id_cliente, "tipo": "Doble", "cantidad": 2,
+                                  "fecha_ingreso": "2030-01-05", "fecha_salida": "2030-01-07"}])
+    assert len(servicio.reservas) == 0
+    assert cliente.reservas == []
+    assert [h.estado for h in servicio.habitaciones] == ["disponible", "disponible"]
+    assert len(servicio.habitaciones_disponibles("2030-01-05", "2030-01-07")) == 2
+
+
+def test_grupo_sin_lugar_no_toca_nada(hotel):
+    servicio, cliente = hotel
+    with pytest.raises(ValueError):
+        servicio.reservar_grupo([{"id_cliente": cliente.id_cliente, "tipo": "Doble", "cantidad": 3,
+                                  "fecha_ingreso": "2030-01-05", "fecha_salida": "2030-01-07"}])
+    assert len(servicio.reservas) == 0
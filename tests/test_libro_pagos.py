@@ -0,0 +1,70 @@
+"""Libro de pagos y conciliación (libro_pagos.py, ServicioHotel.conciliar_pagos)."""
+from hotel_sena.almacenamiento import obtener_almacen
+from hotel_sena.libro_pagos import conciliar
+from hotel_sena.procesador_pagos import PasarelaSimulada
+
+
+def _movimiento(id_pago, id_reserva, estado, monto=200.0):
+    return {"ID Pago": id_pago, "ID Reserva": id_reserva, "Clave": None, "Estado": estado,
+            "Monto": monto, "Método": "tarjeta", "Registrado": "2030-01-01T10:00:00"}
+
+
+def _reserva(id_reserva, estado="activa"):
+    return {"ID": id_reserva, "Estado": estado, "Precio total": 200.0}
+
+
+def _ids(informe):
+    return {grupo: [fila["id_reserva"] for fila in filas] for grupo, filas in informe.items()}
+
+
+def test_conciliar_clasifica_cada_reservacion():
+    movimientos = [
+        _movimiento(1, 2, "pendiente"), _movimiento(1, 2, "aprobado"),
+        _movimiento(2, 3, "pendiente"), _movimiento(2, 3, "rechazado"),
+        _movimiento(3, 4, "pendiente"),                                   # quedó a mitad de camino
+        _movimiento(4, 5, "aprobado"), _movimiento(5, 5, "aprobado", 150.0),
+        _movimiento(6, 6, "aprobado"),
+        _movimiento(7, None, "aprobado"),                                 # pago suelto, sin reservación
+    ]
+    reservas = [_reserva(1), _reserva(2, "Pagada"), _reserva(3), _reserva(4), _reserva(5, "pagada"),
+                _reserva(6, "cancelada"), _reserva(7, "cancelada"), _reserva(8, "finalizada")]
+
+    informe = conciliar(movimientos, reservas)
+    assert _ids(informe) == {"sin_pagar": [1, 8], "fallidas": [3, 4], "pago_doble": [5],
+                             "canceladas_pagas": [6]}
+    doble = informe["pago_doble"][0]
+    assert (doble["pagado"], doble["aprobados"], doble["intentos"], doble["total"]) == (350.0, 2, 2, 200.0)
+    assert informe["fallidas"][0]["estado"] == "activa"
+
+
+def test_un_lote_reaplicado_no_cambia_el_resultado():
+    movimientos = [_movimiento(1, 1, "pendiente"), _movimiento(1, 1, "aprobado")]
+    reservas = [_reserva(1, "pagada")]
+    assert conciliar(movimientos * 2, reservas) == conciliar(movimientos, reservas)
+    assert _ids(conciliar(movimientos * 2, reservas))["pago_doble"] == []
+
+
+def test_el_servicio_anota_cada_intento_y_concilia(hotel, tmp_path):
+    servicio, cliente = hotel
+    servicio.procesador.pasarelas["nequi"] = PasarelaSimulada(latencia=0, tasa_exito=0)
+    pagada = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-10", "2030-01-12")
+    fallida = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-10", "2030-01-12")
+    sin_pagar = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-02-10", "2030-02-12")
+    cancelada = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-02-10", "2030-02-12")
+    servicio.procesar_pago(pagada.id_reserva, "tarjeta")
+    servicio.procesar_pago(fallida.id_reserva, "Nequi")
+    servicio.cancelar_reservacion(cancelada.id_reserva)
+
+    informe = servicio.conciliar_pagos()
+    assert _ids(informe) == {"sin_pagar": [sin_pagar.id_reserva], "fallidas": [fallida.id_reserva],
+                             "pago_doble": [], "canceladas_pagas": []}
+    assert informe["fallidas"][0]["intentos"] == 1
+
+    libro = list(obtener_almacen(str(tmp_path / "libro_pagos.json")).cargar())
+    assert [(m["ID Reserva"], m["Estado"]) for m in libro] == [
+        (pagada.id_reserva, "pendiente"), (pagada.id_reserva, "aprobado"),
+        (fallida.id_reserva, "pendiente"), (fallida.id_reserva, "fallido")]
+    # Tras un cobro fallido la reservación se puede volver a cobrar
+    servicio.procesador.pasarelas.clear()
+    servicio.procesar_pago(fallida.id_reserva, "tarjeta")
+    assert _ids(servicio.conciliar_pagos())["fallidas"] == []
@@ -0,0 +1,98 @@
+"""Lista de espera y reacomodo de reservaciones (lista_espera.py)."""
+import pytest
+
+from conftest import falla_bitacora
+from hotel_sena.lista_espera import SolicitudEspera
+from hotel_sena.reservacion import Reservacion
+
+
+def test_cancelacion_atiende_la_lista_de_espera(hotel):
+    servicio, cliente = hotel
+    otro = servicio.registrar_cliente("Luis Paz", "luis@gmail.com", "3001112222")
+    ocupadas = [servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-05", "2030-01-08")
+                for _ in range(2)]
+    solicitud = servicio.solicitar_habitacion(otro.id_cliente, "Doble", "2030-01-06", "2030-01-08")
+    assert isinstance(solicitud, SolicitudEspera)
+    assert solicitud.estado == "espera"
+
+    servicio.cancelar_reservacion(ocupadas[0].id_reserva)
+    assert solicitud.estado == "asignada"
+    asignada = servicio.obtener_reserva(solicitud.id_reserva)
+    assert isinstance(asignada, Reservacion)
+    assert asignada.cliente is otro
+    assert servicio.listar_espera() == []
+
+
+def test_mueve_reservaciones_para_despejar_una_habitacion(hotel):
+    servicio, cliente = hotel
+    primera = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-05", "2030-01-07")
+    segunda = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-09", "2030-01-11")
+    eventos = len(servicio.agenda)
+
+    reserva = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-05", "2030-01-11")
+
+    assert isinstance(reserva, Reservacion)
+    assert primera.habitacion is segunda.habitacion  # una se mudó a la habitación de la otra
+    assert reserva.habitacion is not primera.habitacion
+    assert [(r.fecha_ingreso, r.fecha_salida) for r in (primera, segunda)] == [
+        (primera.fecha_ingreso, primera.fecha_salida), (segunda.fecha_ingreso, segunda.fecha_salida)]
+    for r in (primera, segunda, reserva):
+        assert servicio.indice.reservas_en(r.habitacion.id_habitacion, r.ingreso, r.salida) == [
+            (r.ingreso, r.salida, r.id_reserva)]
+    assert len(servicio.agenda) == eventos + 2  # la mudanza no reprograma a la reservación movida
+
+
+def test_si_falla_la_bitacora_la_mudanza_se_deshace(hotel, monkeypatch):
+    servicio, cliente = hotel
+    primera = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-05", "2030-01-07")
+    segunda = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-09", "2030-01-11")
+    eventos = len(servicio.agenda)
+    monkeypatch.setattr(servicio.bitacora, "anotar", falla_bitacora)
+
+    with pytest.raises(OSError):
+        servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-05", "2030-01-11")
+
+    assert primera.habitacion.id_habitacion == 1
+    assert segunda.habitacion.id_habitacion == 2
+    assert [r.id_reserva for r in servicio.reservas] == [primera.id_reserva, segunda.id_reserva]
+    assert servicio.indice.reservas_en(1, primera.ingreso, segunda.salida) == [
+        (primera.ingreso, primera.salida, primera.id_reserva)]
+    # Solo quedan los eventos de la reservación deshecha (se descartan al aplicarlos),
+    # no los de las que volvieron a su habitación.
+    assert len(servicio.agenda) == eventos + 2
+
+
+def test_la_cancelacion_elige_la_solicitud_que_mejor_llena_el_hueco(hotel):
+    servicio, cliente = hotel
+    ocupadas = [servicio.crear_reservacion(cliente.id_cliente, h, "2030-01-05", "2030-01-10") for h in (1, 2)]
+    corta = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-06", "2030-01-08")
+    larga = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-05", "2030-01-09")
+    afuera = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-08", "2030-01-12")
+
+    servicio.cancelar_reservacion(ocupadas[0].id_reserva)
+
+    assert larga.estado == "asignada"
+    assert servicio.obtener_reserva(larga.id_reserva).habitacion.id_habitacion == 1
+    assert corta.estado == "espera"   # se cruza con la larga
+    assert afuera.estado == "espera"  # no cabe en el hueco liberado
+    assert servicio.listar_espera() == [corta, afuera]
+
+
+def test_cupo_de_prioridad(hotel):
+    servicio, cliente = hotel
+    servicio.configurar_prioridad("Doble", 1)
+    ocupadas = [servicio.crear_reservacion(cliente.id_cliente, h, "2030-01-05", "2030-01-10") for h in (1, 2)]
+    larga = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-05", "2030-01-09")
+    corta = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-06", "2030-01-08")
+    assert larga.estado == "prioritaria"
+    assert corta.estado == "espera"  # el cupo de esas noches ya está tomado
+    assert servicio.listar_espera() == [larga, corta]
+
+    servicio.retirar_espera(larga.id_espera)
+    tercera = servicio.solicitar_habitacion(cliente.id_cliente, "Doble", "2030-01-07", "2030-01-08")
+    assert tercera.estado == "prioritaria"  # el cupo se liberó al retirarla
+
+    servicio.cancelar_reservacion(ocupadas[1].id_reserva)
+    assert tercera.estado == "asignada"  # antes que la más larga
+    assert corta.estado == "espera"
+    assert len(servicio.listar_reservaciones(estado="activa")) == 2  # nunca más reservaciones que habitaciones
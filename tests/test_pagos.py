@@ -0,0 +1,17 @@
+"""Pagos por lotes con clave de idempotencia (ServicioHotel.procesar_pagos)."""
+import pytest
+
+
+def test_pago_con_la_misma_clave_no_cobra_dos_veces(hotel):
+    servicio, cliente = hotel
+    reserva = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-05", "2030-01-07")
+
+    primero = servicio.procesar_pago(reserva.id_reserva, "tarjeta", clave="terminal-1-0001")
+    repetido = servicio.procesar_pago(reserva.id_reserva, "tarjeta", clave="terminal-1-0001")
+    assert repetido is primero
+    assert len(servicio.pagos) == 1
+    assert reserva.estado == "pagada"
+
+    otra = servicio.crear_reservacion(cliente.id_cliente, 2, "2030-01-05", "2030-01-07")
+    with pytest.raises(ValueError):
+        servicio.procesar_pago(otra.id_reserva, "tarjeta", clave="terminal-1-0001")
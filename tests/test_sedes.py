@@ -0,0 +1,64 @@
+"""Modo multi-sede (sedes.py): un proceso por sede y consultas de toda la cadena."""
+import pytest
+
+from hotel_sena.sedes import EnrutadorSedes
+from hotel_sena.servicio import ErrorNoEncontrado
+
+ANA = {"nombre": "Ana Gomez", "correo": "Ana@Gmail.com", "telefono": "3001234567"}
+
+
+@pytest.fixture(scope="module")
+def cadena(tmp_path_factory):
+    with EnrutadorSedes(["Norte", "sur"], str(tmp_path_factory.mktemp("sedes"))) as cadena:
+        for sede, tipo, precio in (("norte", "Doble", 120), ("norte", "Suite", 300), ("sur", "Doble", 90)):
+            cadena.registrar_habitacion(sede, tipo, precio)
+        yield cadena
+
+
+def test_disponibilidad_de_toda_la_cadena_por_precio(cadena):
+    libres = cadena.disponibilidad("2031-03-01", "2031-03-03")
+    assert [(h["sede"], h["tipo"], h["precio_total"]) for h in libres] == [
+        ("sur", "Doble", 180), ("norte", "Doble", 240), ("norte", "Suite", 600)]
+    assert [h["sede"] for h in cadena.disponibilidad("2031-03-01", "2031-03-03", "doble", sedes=["norte"])] == [
+        "norte"]
+
+
+def test_historial_del_cliente_en_todas_las_sedes(cadena):
+    cadena.crear_reservacion("sur", ANA, 1, "2031-05-10", "2031-05-12")
+    cadena.crear_reservacion("norte", ANA, 1, "2031-05-01", "2031-05-03")
+
+    historial = cadena.historial_cliente("ana@gmail.com")
+    assert [(r["sede"], r["fecha_ingreso"]) for r in historial] == [("norte", "2031-05-01"), ("sur", "2031-05-10")]
+    assert cadena.historial_cliente("nadie@gmail.com") == []
+    # El cliente se registró una sola vez en cada sede
+    assert {sede: r["clientes"] for sede, r in cadena.resumen().items()} == {"norte": 1, "sur": 1}
+
+
+def test_los_errores_de_la_sede_llegan_al_enrutador(cadena):
+    cadena.crear_reservacion("norte", ANA, 2, "2031-07-01", "2031-07-04")
+    with pytest.raises(ValueError):
+        cadena.crear_reservacion("norte", ANA, 2, "2031-07-02", "2031-07-03")
+    with pytest.raises(ErrorNoEncontrado):
+        cadena.cancelar_reservacion("sur", 999)
+    with pytest.raises(ErrorNoEncontrado):
+        cadena.registrar_habitacion("oeste", "Doble", 100)
+    with pytest.raises(ValueError):
+        cadena.llamar("norte", "borrar_todo")
+
+
+def test_nombres_de_sede_no_validos():
+    with pytest.raises(ValueError):
+        EnrutadorSedes([])
+    with pytest.raises(ValueError):
+        EnrutadorSedes(["../otra"])
+
+
+def test_cada_sede_recupera_sus_datos_al_reiniciar(tmp_path):
+    with EnrutadorSedes(["norte", "sur"], str(tmp_path)) as cadena:
+        cadena.registrar_habitacion("norte", "Doble", 100)
+        cadena.crear_reservacion("norte", ANA, 1, "2031-01-10", "2031-01-12")
+
+    with EnrutadorSedes(["norte", "sur"], str(tmp_path)) as cadena:
+        assert cadena.cargados["norte"]["reservas"] == 1
+        assert cadena.cargados["sur"]["reservas"] == 0
+        assert cadena.disponibilidad("2031-01-10", "2031-01-12") == []
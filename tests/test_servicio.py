@@ -0,0 +1,12 @@
+"""ServicioHotel: cada instancia tiene sus propios índices y eventos."""
+
+
+def test_dos_servicios_no_se_mezclan(tmp_path, crear_servicio):
+    uno = crear_servicio(tmp_path / "uno")
+    otro = crear_servicio(tmp_path / "otro")
+    uno.registrar_habitacion("Doble", 100)
+    uno.registrar_cliente("Ana Gomez", "ana@gmail.com", "3001234567")
+
+    assert otro.habitaciones_disponibles("2030-01-05", "2030-01-07") == []
+    assert otro.buscar_clientes("ana") == []
+    assert len(otro.agenda) == 0
@@ -0,0 +1,103 @@
+"""Tarifas dinámicas (tarifas.py): reglas y cotización con sumas acumuladas."""
+from datetime import date, timedelta
+
+import pytest
+
+from hotel_sena.disponibilidad import IndiceDisponibilidad
+from hotel_sena.eventos import CanalEventos
+from hotel_sena.Habitaciones import Habitacion
+from hotel_sena.tarifas import MotorTarifas
+
+
+@pytest.fixture
+def motor():
+    return MotorTarifas(IndiceDisponibilidad(CanalEventos()), horizonte=60, inicio="2030-01-01")
+
+
+def _noche_a_noche(precio, ingreso, salida, factor):
+    """Cotización de referencia: recorre las noches una por una."""
+    dia, total = date.fromisoformat(ingreso), 0.0
+    while dia < date.fromisoformat(salida):
+        total += round(precio * factor(dia), 2)
+        dia += timedelta(days=1)
+    return total
+
+
+def test_sin_reglas_es_noches_por_precio(motor):
+    assert motor.cotizar("Doble", 100, "2030-01-10", "2030-01-13") == 300
+    assert motor.tarifa_noche("Doble", 100, "2030-01-10") == 100
+    with pytest.raises(ValueError):
+        motor.cotizar("Doble", 100, "2030-01-13", "2030-01-13")
+
+
+def test_temporada_dias_y_estadia(motor):
+    motor.agregar_temporada("12-20", "01-05", 1.5, tipo="Suite")  # cruza el fin de año
+    motor.definir_factor_dias([4, 5], 1.2)                         # viernes y sábado
+    motor.agregar_descuento_estadia(3, 0.95)
+    motor.agregar_descuento_estadia(7, 0.9)
+
+    def suite(dia):
+        temporada = 1.5 if (dia.month, dia.day) >= (12, 20) or (dia.month, dia.day) <= (1, 5) else 1.0
+        return temporada * (1.2 if dia.weekday() in (4, 5) else 1.0)
+
+    def doble(dia):
+        return 1.2 if dia.weekday() in (4, 5) else 1.0
+
+    assert motor.cotizar("Suite", 200, "2030-12-30", "2031-01-02") == round(
+        _noche_a_noche(200, "2030-12-30", "2031-01-02", suite) * 0.95, 2)
+    assert motor.cotizar("suite", 200, "2031-01-01", "2031-01-10") == round(
+        _noche_a_noche(200, "2031-01-01", "2031-01-10", suite) * 0.9, 2)
+    assert motor.cotizar("Doble", 100, "2030-12-30", "2031-01-01") == _noche_a_noche(
+        100, "2030-12-30", "2031-01-01", doble)  # la temporada es solo de las suites
+
+
+def test_suma_acumulada_coincide_con_las_noches(motor):
+    motor.configurar({"temporadas": [{"desde": "01-10", "hasta": "01-20", "factor": 1.3}],
+                      "dias": [{"dias": [5, 6], "factor": 1.1}]})
+    for ingreso in range(1, 25, 3):
+        for noches in (1, 2, 5, 9):
+            desde = date(2030, 1, ingreso)
+            hasta = desde + timedelta(days=noches)
+            noche_a_noche = sum(motor.tarifa_noche("Doble", 87.5, desde + timedelta(days=n)) for n in range(noches))
+            assert motor.cotizar("Doble", 87.5, desde, hasta) == pytest.approx(noche_a_noche)
+
+
+def test_el_horizonte_se_amplia(motor):
+    motor.definir_factor_dias([6], 2)
+    lejos = motor.cotizar("Doble", 100, "2032-06-01", "2032-06-08")  # una semana: un domingo
+    assert lejos == 800
+    assert motor.cotizar("Doble", 100, "2029-12-01", "2029-12-08") == 800
+
+
+def test_reglas_no_validas(motor):
+    with pytest.raises(ValueError):
+        motor.agregar_temporada("13-01", "12-31", 1.1)
+    with pytest.raises(ValueError):
+        motor.definir_factor_dias([7], 1.1)
+    with pytest.raises(ValueError):
+        motor.agregar_nivel_ocupacion(0.5, 0)
+    with pytest.raises(ValueError):
+        motor.agregar_descuento_estadia(0, 0.9)
+
+
+def test_ocupacion_y_precio_invalidan_las_tablas(hotel):
+    servicio, cliente = hotel
+    servicio.tarifas.agregar_nivel_ocupacion(0.5, 1.5)
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 200
+
+    reserva = servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-11", "2030-01-13")
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 100 + 150  # la noche del 11 está a media ocupación
+    servicio.cancelar_reservacion(reserva.id_reserva)
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 200
+
+    servicio.obtener_habitacion(2).actualizar_precio(120, canal=servicio.eventos)
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 240
+    servicio.registrar_habitacion("Doble", 100)
+    servicio.crear_reservacion(cliente.id_cliente, 1, "2030-01-11", "2030-01-13")
+    assert servicio.cotizar(2, "2030-01-10", "2030-01-12") == 240  # con tres habitaciones no llega a la mitad
+
+
+def test_habitacion_usa_su_tipo_y_precio(motor):
+    motor.agregar_temporada("01-01", "12-31", 2, tipo="Suite")
+    assert motor.cotizar_habitacion(Habitacion(1, "Suite", 50), "2030-01-10", "2030-01-11") == 100
+    assert motor.cotizar_habitacion(Habitacion(2, "Doble", 50), "2030-01-10", "2030-01-11") == 50